@@ -6,20 +6,14 @@ logging.getLogger("PIL").setLevel(logging.WARNING)  # silence pillow
 logging.getLogger("matplotlib").setLevel(logging.CRITICAL)  # silence mpl
 logging.getLogger("matplotlib.font_manager").setLevel(logging.CRITICAL)  # silence font scans
 import argparse
+import copy
 from src.data.loader import (
+    load_flights_cached,
     load_missions,
-    load_simulated_flights,
     load_test_scenarios
 )
-from src.query.deconfliction_api import (
-    check_mission_conflicts,
-    run_scenario
-)
-from src.visualization.plotter_2d import plot_2d_static, animate_2d
-from src.visualization.plotter_3d import plot_3d_static, animate_3d
-
-from src.utils.random_flights import generate_random_flight_schedule
-from src.core.conflict_resolver import resolve_conflicts_for_mission
+# Each mode imports what it needs (plotters and matplotlib only when
+# something is drawn), so startup stays cheap
 from src.utils.config import get_config
 
 # NEW: altitude modification utilities
@@ -31,13 +25,17 @@ from src.utils.mission_modifiers import slope_mission_altitude
 # Dynamic Airspace Generator
 # =====================================================
 
-def run_dynamic_airspace(visualize_all=False):
+def run_dynamic_airspace(visualize_all=False, workers=None, render=None, render_view="2d", plot=True):
     """
     Run dynamic scenario:
     - Main mission fixed (MISSION_2)
     - Five random drones generated
     - Full visualization pipeline if visualize_all=True
+    - Headless render to the `render` file path instead, if given
+    - Conflict check only if plot=False
     """
+    from src.core.conflict_resolver import resolve_conflicts_for_mission
+    from src.utils.random_flights import generate_random_flight_schedule
 
     MAIN_MISSION_ID = "mission_2"
 
@@ -67,6 +65,10 @@ def run_dynamic_airspace(visualize_all=False):
         schedule=schedule,
         safety_buffer=config.SAFETY_BUFFER_DISTANCE,
         num_samples=config.NUM_SAMPLES,
+        engine=config.CONFLICT_ENGINE,
+        chunk_size=config.BATCH_CHUNK_SIZE,
+        pruning=config.PRUNING,
+        workers=config.NUM_WORKERS if workers is None else workers,
     )
 
     print("\n--- Dynamic Airspace Conflict Check ---")
@@ -79,6 +81,19 @@ def run_dynamic_airspace(visualize_all=False):
             f"t≈{c['conflict_time']:.1f}, d≈{c['min_distance']:.1f}m"
         )
 
+    if not plot:
+        return
+
+    if render:
+        from src.visualization.render import render_animation
+
+        print(f"\n=== Rendering {render_view.upper()} Animation to {render} ===")
+        render_animation(main_mission, schedule, render, conflicts=result["conflicts"], view=render_view)
+        return
+
+    from src.visualization.plotter_2d import plot_2d_static, animate_2d
+    from src.visualization.plotter_3d import plot_3d_static, animate_3d
+
     # Run full visualization pipeline
     print("\n\n=== Running 2D Static Visualization ===")
     plot_2d_static(main_mission, schedule, conflicts=result["conflicts"])
@@ -106,40 +121,118 @@ def main():
     parser.add_argument("--mission", type=str, help="Run conflict check for a mission ID")
     parser.add_argument("--scenario", type=str, help="Run predefined scenario from scenarios.json")
     parser.add_argument("--dynamic", action="store_true", help="Run dynamic random airspace mode")
+    parser.add_argument("--airspace", action="store_true", help="Check every pair of filed flights for conflicts")
     parser.add_argument("--visualize", action="store_true", help="Run only 2D visualization")
     parser.add_argument("--visualize_all", action="store_true", help="Run 2D, 3D, and 4D visualizations in sequence")
+    parser.add_argument("--serve", action="store_true", help="Serve mission checks over local HTTP")
+    parser.add_argument("--host", type=str, default=None, help="Host for --serve (default: Config.SERVER_HOST)")
+    parser.add_argument("--port", type=int, default=None, help="Port for --serve (default: Config.SERVER_PORT)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for conflict evaluation (default: Config.NUM_WORKERS)")
+    parser.add_argument("--render", type=str, default=None, metavar="PATH", help="Render the animation headlessly to a video/GIF file instead of opening windows")
+    parser.add_argument("--render_view", choices=get_config().RENDER_VIEWS, default="2d", help="Animation to render with --render")
+    parser.add_argument("--heatmap", type=str, default=None, metavar="PATH", help="With --airspace, save occupancy heatmaps with the conflicts overlaid")
+    parser.add_argument("--no-plot", dest="plot", action="store_false", help="Compute and print results only: no plots, animations or renders")
 
     args = parser.parse_args()
 
+    # =====================================================
+    # Server Mode
+    # =====================================================
+    if args.serve:
+        from src.query.server import run_server
+        from src.query.service import get_service
+
+        service = get_service("data/sample_missions.json", "data/simulated_flights.json")
+        run_server(service, host=args.host, port=args.port)
+        return
+
     # =====================================================
     # Dynamic Airspace Mode
     # =====================================================
     if args.dynamic:
-        run_dynamic_airspace(visualize_all=args.visualize_all)
+        run_dynamic_airspace(
+            visualize_all=args.visualize_all,
+            workers=args.workers,
+            render=args.render,
+            render_view=args.render_view,
+            plot=args.plot,
+        )
+        return
+
+    # =====================================================
+    # Airspace-wide Sweep Mode
+    # =====================================================
+    if args.airspace:
+        from src.query.deconfliction_api import check_airspace_conflicts
+
+        report = check_airspace_conflicts("data/simulated_flights.json")
+
+        print("\n--- Airspace Conflict Sweep ---")
+        print("Status          :", report["status"])
+        print("Conflicting pairs:", report["total_conflicting_pairs"])
+        for pair in report["pairs"]:
+            print(
+                f"- {pair['drone_a']} <-> {pair['drone_b']}: "
+                f"{len(pair['conflicts'])} conflict(s), d_min≈{pair['min_distance']:.1f}m"
+            )
+
+        if args.heatmap and args.plot:
+            from src.visualization.heatmap import hotspots, occupancy_grid, plot_occupancy_heatmaps
+
+            # Same cached columnar schedule the sweep used; sliced in chunks
+            grid = occupancy_grid(load_flights_cached("data/simulated_flights.json"))
+            conflicts = [c for pair in report["pairs"] for c in pair["conflicts"]]
+
+            print("\n--- Busiest Cells ---")
+            for spot in hotspots(grid, top=5):
+                print(
+                    f"- t {spot['window'][0]:.0f}-{spot['window'][1]:.0f}s, "
+                    f"x {spot['x'][0]:.0f}-{spot['x'][1]:.0f}, y {spot['y'][0]:.0f}-{spot['y'][1]:.0f}: "
+                    f"{spot['occupancy']:.2f} drones"
+                )
+            plot_occupancy_heatmaps(grid, conflicts=conflicts, save_path=args.heatmap)
         return
 
     # =====================================================
     # Scenario Mode
     # =====================================================
     if args.scenario:
+        from src.query.deconfliction_api import run_scenario
+        from src.query.service import get_service
+
         result = run_scenario(
             scenarios_path="data/scenarios.json",
             missions_path="data/sample_missions.json",
             flights_path="data/simulated_flights.json",
-            scenario_id=args.scenario
+            scenario_id=args.scenario,
+            workers=args.workers
         )
 
         print("\n--- Scenario Result ---")
         print(result)
 
-        missions = load_missions("data/sample_missions.json")
-        flights = load_simulated_flights("data/simulated_flights.json")
-        mission_id = result["raw_output"]["mission_id"]
-        mission = next(m for m in missions if m.mission_id == mission_id)
+        if not args.plot:
+            return
+
+        # Reuse the schedule the API already loaded; copy the mission
+        # because the altitude slope below modifies it in place
+        service = get_service("data/sample_missions.json", "data/simulated_flights.json")
+        flights = service.schedule
+        mission = copy.deepcopy(service.get_mission(result["raw_output"]["mission_id"]))
 
         # Apply altitude slope (NEW)
         mission = slope_mission_altitude(mission, start_z=10, end_z=40)
 
+        if args.render:
+            from src.visualization.render import render_animation
+
+            render_animation(mission, flights, args.render,
+                             conflicts=result["raw_output"]["conflicts"], view=args.render_view)
+            return
+
+        from src.visualization.plotter_2d import plot_2d_static, animate_2d
+        from src.visualization.plotter_3d import plot_3d_static, animate_3d
+
         # Always 2D static
         plot_2d_static(mission, flights, conflicts=result["raw_output"]["conflicts"])
 
@@ -154,24 +247,39 @@ def main():
     # Mission Mode
     # =====================================================
     if args.mission:
-
-        missions = load_missions("data/sample_missions.json")
-        flights = load_simulated_flights("data/simulated_flights.json")
+        from src.query.deconfliction_api import check_mission_conflicts
+        from src.query.service import get_service
 
         result = check_mission_conflicts(
             missions_path="data/sample_missions.json",
             flights_path="data/simulated_flights.json",
-            mission_id=args.mission
+            mission_id=args.mission,
+            workers=args.workers
         )
 
         print("\n--- Mission Check Result ---")
         print(result)
 
-        mission = next(m for m in missions if m.mission_id == args.mission)
+        if not args.plot:
+            return
+
+        service = get_service("data/sample_missions.json", "data/simulated_flights.json")
+        flights = service.schedule
+        mission = copy.deepcopy(service.get_mission(args.mission))
 
         # Apply altitude slope (NEW)
         mission = slope_mission_altitude(mission, start_z=10, end_z=40)
 
+        if args.render:
+            from src.visualization.render import render_animation
+
+            render_animation(mission, flights, args.render,
+                             conflicts=result["conflicts"], view=args.render_view)
+            return
+
+        from src.visualization.plotter_2d import plot_2d_static, animate_2d
+        from src.visualization.plotter_3d import plot_3d_static, animate_3d
+
         # Always 2D static
         plot_2d_static(mission, flights, conflicts=result["conflicts"])
 
@@ -187,6 +295,11 @@ def main():
     print("  python main.py --scenario scenario_2 --visualize_all")
     print("  python main.py --mission mission_2 --visualize_all")
     print("  python main.py --dynamic --visualize_all")
+    print("  python main.py --airspace")
+    print("  python main.py --airspace --heatmap occupancy.png")
+    print("  python main.py --mission mission_2 --render replay.gif --render_view 3d")
+    print("  python main.py --mission mission_2 --no-plot")
+    print("  python main.py --serve --port 8080")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,477 @@
+"""
+Vectorized spatiotemporal conflict kernel.
+
+Segments are packed into contiguous (N, 8) float64 arrays with columns:
+    [x0, y0, z0, x1, y1, z1, t_start, t_end]
+
+Closest approach (constant velocity over the shared time window) is then
+evaluated for many segment pairs at once with broadcast NumPy operations,
+chunked so that memory stays bounded for large schedules.
+"""
+
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from src.core.temporal_checker import segment_time_overlaps
+from src.data.columnar import ColumnarSchedule, ScheduleLike
+from src.data.models import Drone
+
+SEGMENT_COLUMNS = 8
+DEFAULT_CHUNK_SIZE = 250_000  # segment pairs evaluated per chunk
+LIKELY_FIRST_CHUNK = 4096  # pairs in the first early-exit chunk
+
+
+def segments_to_array(
+    segments: Sequence[Tuple[Tuple[float, float, float], Tuple[float, float, float], float, float]]
+) -> np.ndarray:
+    """
+    Pack segments of the form (start_xyz, end_xyz, t_start, t_end)
+    into an (N, 8) float64 array.
+    """
+    packed = np.empty((len(segments), SEGMENT_COLUMNS), dtype=float)
+    for row, (start, end, t_start, t_end) in enumerate(segments):
+        packed[row, 0:3] = start
+        packed[row, 3:6] = end
+        packed[row, 6] = t_start
+        packed[row, 7] = t_end
+    return packed
+
+
+def array_to_segments(
+    packed: np.ndarray,
+) -> List[Tuple[Tuple[float, float, float], Tuple[float, float, float], float, float]]:
+    """Inverse of segments_to_array."""
+    return [
+        (
+            (float(r[0]), float(r[1]), float(r[2])),
+            (float(r[3]), float(r[4]), float(r[5])),
+            float(r[6]),
+            float(r[7]),
+        )
+        for r in packed
+    ]
+
+
+def pack_drone_segments(drones: Sequence[Drone]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pack the segments of every drone into one contiguous array.
+
+    Returns:
+        (segments, owner) where segments is (N, 8) and owner[k] is the
+        index into `drones` of the drone that flies segment k.
+        Segments keep drone order, then to_segments() order.
+    """
+    arrays = [drone.trajectory.packed for drone in drones]
+    if not arrays:
+        return np.empty((0, SEGMENT_COLUMNS), dtype=float), np.empty(0, dtype=np.int64)
+    owner = np.repeat(np.arange(len(arrays), dtype=np.int64), [len(a) for a in arrays])
+    return np.concatenate(arrays), owner
+
+
+def pack_schedule_segments(schedule: ScheduleLike) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Packed (segments, owner) for a FlightSchedule or ColumnarSchedule.
+    A ColumnarSchedule is packed straight from its arrays.
+    """
+    if isinstance(schedule, ColumnarSchedule):
+        return schedule.segment_array()
+    return pack_drone_segments(schedule.drones)
+
+
+def schedule_bounds(schedule: ScheduleLike) -> Tuple[np.ndarray, np.ndarray]:
+    """(D, 4) whole-flight [x, y, z, t] lows and highs of every drone."""
+    if isinstance(schedule, ColumnarSchedule):
+        return schedule.drone_bounds()
+    trajectories = [d.trajectory for d in schedule.drones]
+    if not trajectories:
+        return np.empty((0, 4)), np.empty((0, 4))
+    return np.array([t.lo for t in trajectories]), np.array([t.hi for t in trajectories])
+
+
+def nearby_drones(
+    schedule: ScheduleLike, lo: np.ndarray, hi: np.ndarray, safety_buffer: float
+) -> np.ndarray:
+    """
+    Indices of the drones whose whole-flight box is airborne during and
+    within safety_buffer of the 4D box [lo, hi]. No other drone can
+    conflict with segments inside that box.
+    """
+    drone_lo, drone_hi = schedule_bounds(schedule)
+    in_time = (drone_lo[:, 3] < hi[3]) & (lo[3] < drone_hi[:, 3])
+    gap = np.maximum(0.0, np.maximum(drone_lo[:, :3] - hi[:3], lo[:3] - drone_hi[:, :3]))
+    return np.nonzero(in_time & (np.einsum("ij,ij->i", gap, gap) < safety_buffer ** 2))[0]
+
+
+def pack_nearby_segments(
+    schedule: ScheduleLike, mission_array: np.ndarray, safety_buffer: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    pack_schedule_segments restricted to the drones that can come within
+    safety_buffer of any segment of mission_array (whole-drone reject on
+    bounding boxes). owner still indexes the full schedule.
+    """
+    if len(mission_array) == 0:
+        return np.empty((0, SEGMENT_COLUMNS), dtype=float), np.empty(0, dtype=np.int64)
+    lo = np.concatenate((np.minimum(mission_array[:, 0:3], mission_array[:, 3:6]).min(axis=0),
+                         [mission_array[:, 6].min()]))
+    hi = np.concatenate((np.maximum(mission_array[:, 0:3], mission_array[:, 3:6]).max(axis=0),
+                         [mission_array[:, 7].max()]))
+    keep = nearby_drones(schedule, lo, hi, safety_buffer)
+
+    if isinstance(schedule, ColumnarSchedule):
+        packed, owner = schedule.segment_array()
+        if len(keep) == len(schedule):
+            return packed, owner
+        near = np.zeros(len(schedule), dtype=bool)
+        near[keep] = True
+        rows = near[owner]
+        return packed[rows], owner[rows]
+
+    drones = schedule.drones
+    packed, local_owner = pack_drone_segments([drones[i] for i in keep.tolist()])
+    return packed, keep[local_owner]
+
+
+def schedule_drone_ids(schedule: ScheduleLike) -> List[str]:
+    """Drone ids of a schedule, indexed like the owner array."""
+    if isinstance(schedule, ColumnarSchedule):
+        return schedule.drone_ids
+    return [d.drone_id for d in schedule.drones]
+
+
+def segment_velocities(packed: np.ndarray) -> np.ndarray:
+    """Per-segment constant velocity, zero for degenerate durations."""
+    duration = packed[..., 7] - packed[..., 6]
+    delta = packed[..., 3:6] - packed[..., 0:3]
+    vel = np.zeros_like(delta)
+    np.divide(delta, duration[..., None], out=vel, where=duration[..., None] > 0)
+    return vel
+
+
+def _closest_approach(
+    seg_a: np.ndarray,
+    vel_a: np.ndarray,
+    seg_b: np.ndarray,
+    vel_b: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """
+    Closest approach for broadcastable arrays of segments.
+
+    seg_a / seg_b have trailing dimension 8, vel_a / vel_b trailing
+    dimension 3; leading dimensions broadcast against each other.
+    Pairs without a time overlap get min_distance = inf.
+    """
+    overlap = segment_time_overlaps(seg_a, seg_b)
+    t_start, t_end, valid = overlap["start"], overlap["end"], overlap["valid"]
+
+    # Positions at the start of the overlap
+    pos_a = seg_a[..., 0:3] + vel_a * (t_start - seg_a[..., 6])[..., None]
+    pos_b = seg_b[..., 0:3] + vel_b * (t_start - seg_b[..., 6])[..., None]
+
+    r0 = pos_a - pos_b
+    dv = vel_a - vel_b
+    dv_sq = np.einsum("...k,...k->...", dv, dv)
+    r0_dv = np.einsum("...k,...k->...", r0, dv)
+
+    tau = np.zeros_like(dv_sq)
+    np.divide(-r0_dv, dv_sq, out=tau, where=dv_sq > 1e-12)
+    tau = np.clip(tau, 0.0, np.maximum(t_end - t_start, 0.0))
+
+    pos_a = pos_a + vel_a * tau[..., None]
+    pos_b = pos_b + vel_b * tau[..., None]
+    diff = pos_a - pos_b
+    min_distance = np.sqrt(np.einsum("...k,...k->...", diff, diff))
+    min_distance = np.where(valid, min_distance, np.inf)
+
+    return {
+        "valid": valid,
+        "min_distance": min_distance,
+        "conflict_time": t_start + tau,
+        "position_a": pos_a,
+        "position_b": pos_b,
+    }
+
+
+def closest_approach_indexed(
+    packed: np.ndarray,
+    velocities: np.ndarray,
+    index_a: np.ndarray,
+    index_b: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """
+    closest_approach_pairs for pairs of rows of one packed array, reusing
+    precomputed segment_velocities(packed).
+    """
+    return _closest_approach(
+        packed[index_a], velocities[index_a], packed[index_b], velocities[index_b]
+    )
+
+
+def separation_intervals(
+    seg_a: np.ndarray, seg_b: np.ndarray, safety_buffer: float
+) -> Dict[str, np.ndarray]:
+    """
+    Exact loss-of-separation interval for K segment pairs (seg_a[k], seg_b[k]).
+
+    With r(tau) = r0 + dv * tau over the shared window [t0, t0 + T], the
+    pair is closer than the buffer b where |r(tau)|^2 < b^2, i.e. between
+    the roots of (dv.dv) tau^2 + 2 (r0.dv) tau + (r0.r0 - b^2) = 0,
+    clipped to [0, T]. Equal velocities keep a constant separation, so
+    the interval is then the whole window or nothing.
+
+    Returns dict of arrays:
+        {
+            "valid": (K,) bool,     # separation is lost at some point
+            "t_enter": (K,) float,  # nan where not valid
+            "t_exit": (K,) float,
+        }
+    """
+    seg_a = np.asarray(seg_a, dtype=float).reshape(-1, SEGMENT_COLUMNS)
+    seg_b = np.asarray(seg_b, dtype=float).reshape(-1, SEGMENT_COLUMNS)
+    vel_a, vel_b = segment_velocities(seg_a), segment_velocities(seg_b)
+
+    overlap = segment_time_overlaps(seg_a, seg_b)
+    t_start = overlap["start"]
+    window = overlap["end"] - t_start
+
+    r0 = (seg_a[:, 0:3] + vel_a * (t_start - seg_a[:, 6])[:, None]) \
+        - (seg_b[:, 0:3] + vel_b * (t_start - seg_b[:, 6])[:, None])
+    dv = vel_a - vel_b
+    a = np.einsum("ij,ij->i", dv, dv)
+    c = np.einsum("ij,ij->i", r0, dv)
+    d = np.einsum("ij,ij->i", r0, r0) - safety_buffer ** 2
+
+    moving = a > 1e-12
+    disc = c * c - a * d
+    root = np.sqrt(np.maximum(disc, 0.0))
+    safe_a = np.where(moving, a, 1.0)
+    enter = np.where(moving, (-c - root) / safe_a, 0.0)
+    exit_ = np.where(moving, (-c + root) / safe_a, window)
+
+    enter = np.clip(enter, 0.0, np.maximum(window, 0.0))
+    exit_ = np.clip(exit_, 0.0, np.maximum(window, 0.0))
+    valid = (window > 0) & np.where(moving, (disc > 0) & (enter < exit_), d < 0)
+
+    return {
+        "valid": valid,
+        "t_enter": np.where(valid, t_start + enter, np.nan),
+        "t_exit": np.where(valid, t_start + exit_, np.nan),
+    }
+
+
+def closest_approach_pairs(seg_a: np.ndarray, seg_b: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Element-wise closest approach for K segment pairs (seg_a[k], seg_b[k]).
+
+    Returns dict of arrays:
+        {
+            "valid": (K,) bool,          # segments overlap in time
+            "min_distance": (K,) float,  # inf where not valid
+            "conflict_time": (K,) float,
+            "position_a": (K, 3) float,
+            "position_b": (K, 3) float,
+        }
+    """
+    seg_a = np.asarray(seg_a, dtype=float).reshape(-1, SEGMENT_COLUMNS)
+    seg_b = np.asarray(seg_b, dtype=float).reshape(-1, SEGMENT_COLUMNS)
+    return _closest_approach(
+        seg_a, segment_velocities(seg_a), seg_b, segment_velocities(seg_b)
+    )
+
+
+def find_conflicting_pairs(
+    seg_a: np.ndarray,
+    seg_b: np.ndarray,
+    safety_buffer: float,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, np.ndarray]:
+    """
+    Evaluate all M x N pairs between seg_a (M, 8) and seg_b (N, 8) and
+    keep those whose closest approach breaches the safety buffer.
+
+    Columns of seg_b are processed in chunks of about chunk_size pairs.
+
+    Returns dict of arrays, one entry per conflicting pair:
+        {
+            "index_a": (H,) int,
+            "index_b": (H,) int,
+            "min_distance": (H,) float,
+            "conflict_time": (H,) float,
+            "position_a": (H, 3) float,
+            "position_b": (H, 3) float,
+        }
+    """
+    seg_a = np.asarray(seg_a, dtype=float).reshape(-1, SEGMENT_COLUMNS)
+    seg_b = np.asarray(seg_b, dtype=float).reshape(-1, SEGMENT_COLUMNS)
+    num_a, num_b = len(seg_a), len(seg_b)
+
+    hits = {
+        "index_a": [],
+        "index_b": [],
+        "min_distance": [],
+        "conflict_time": [],
+        "position_a": [],
+        "position_b": [],
+    }
+
+    if num_a and num_b:
+        vel_a = segment_velocities(seg_a)[:, None, :]
+        vel_b_all = segment_velocities(seg_b)
+        seg_a_b = seg_a[:, None, :]
+        step = max(1, chunk_size // num_a)
+
+        for lo in range(0, num_b, step):
+            hi = min(lo + step, num_b)
+            res = _closest_approach(
+                seg_a_b, vel_a, seg_b[None, lo:hi, :], vel_b_all[None, lo:hi, :]
+            )
+            ia, ib = np.nonzero(res["min_distance"] < safety_buffer)
+            if len(ia) == 0:
+                continue
+            hits["index_a"].append(ia)
+            hits["index_b"].append(ib + lo)
+            hits["min_distance"].append(res["min_distance"][ia, ib])
+            hits["conflict_time"].append(res["conflict_time"][ia, ib])
+            hits["position_a"].append(res["position_a"][ia, ib])
+            hits["position_b"].append(res["position_b"][ia, ib])
+
+    empty_shapes = {"position_a": (0, 3), "position_b": (0, 3)}
+    out = {}
+    for key, parts in hits.items():
+        if parts:
+            out[key] = np.concatenate(parts)
+        else:
+            dtype = np.int64 if key.startswith("index") else float
+            out[key] = np.empty(empty_shapes.get(key, (0,)), dtype=dtype)
+    return out
+
+
+def overlap_gap(seg_a: np.ndarray, seg_b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    For K segment pairs: the length of their shared time window and a
+    lower bound on their separation within it (the gap between the
+    bounding boxes of both segments clipped to that window).
+
+    Returns (gap, overlap); pairs without a positive overlap have gap inf.
+    """
+    window = segment_time_overlaps(seg_a, seg_b)
+    overlap = window["end"] - window["start"]
+
+    t_start, t_end = window["start"], window["end"]
+
+    def clipped_box(seg):
+        duration = seg[:, 7] - seg[:, 6]
+        f0 = np.zeros_like(duration)
+        f1 = np.ones_like(duration)
+        np.divide(t_start - seg[:, 6], duration, out=f0, where=duration > 0)
+        np.divide(t_end - seg[:, 6], duration, out=f1, where=duration > 0)
+        delta = seg[:, 3:6] - seg[:, 0:3]
+        p0 = seg[:, 0:3] + np.clip(f0, 0.0, 1.0)[:, None] * delta
+        p1 = seg[:, 0:3] + np.clip(f1, 0.0, 1.0)[:, None] * delta
+        return np.minimum(p0, p1), np.maximum(p0, p1)
+
+    lo_a, hi_a = clipped_box(seg_a)
+    lo_b, hi_b = clipped_box(seg_b)
+    gap = np.linalg.norm(np.maximum(0.0, np.maximum(lo_b - hi_a, lo_a - hi_b)), axis=1)
+    return np.where(overlap > 0, gap, np.inf), overlap
+
+
+def likely_conflict_order(seg_a: np.ndarray, seg_b: np.ndarray, safety_buffer: float) -> np.ndarray:
+    """
+    Rows of the K pairs (seg_a[k], seg_b[k]) that can still breach the
+    buffer, most likely first: smallest clipped-box gap, then longest
+    shared time window.
+    """
+    gap, overlap = overlap_gap(seg_a, seg_b)
+    keep = np.nonzero(gap < safety_buffer)[0]
+    return keep[np.lexsort((-overlap[keep], gap[keep]))]
+
+
+def iter_likely_conflict_pairs(
+    seg_a: np.ndarray,
+    seg_b: np.ndarray,
+    safety_buffer: float,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Pairs of seg_a (M, 8) x seg_b (N, 8) that can breach the buffer, as
+    (index_a, index_b) arrays, each chunk ordered as in
+    likely_conflict_order. Chunks start at LIKELY_FIRST_CHUNK pairs and
+    grow 4x up to chunk_size, so consumers that stop at the first breach
+    score only a small part of a large schedule.
+    """
+    num_a, num_b = len(seg_a), len(seg_b)
+    if num_a == 0:
+        return
+    pairs = min(LIKELY_FIRST_CHUNK, chunk_size)
+    lo = 0
+    while lo < num_b:
+        hi = min(lo + max(1, pairs // num_a), num_b)
+        pairs = min(pairs * 4, chunk_size)
+        ia = np.repeat(np.arange(num_a, dtype=np.int64), hi - lo)
+        ib = np.tile(np.arange(lo, hi, dtype=np.int64), num_a)
+        # Cheap time filter before the clipped boxes
+        shared = np.minimum(seg_a[ia, 7], seg_b[ib, 7]) > np.maximum(seg_a[ia, 6], seg_b[ib, 6])
+        ia, ib = ia[shared], ib[shared]
+        order = likely_conflict_order(seg_a[ia], seg_b[ib], safety_buffer)
+        lo = hi
+        if len(order):
+            yield ia[order], ib[order]
+
+
+def sweep_candidate_pairs(
+    packed: np.ndarray,
+    owner: np.ndarray,
+    safety_buffer: float,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Sweep-and-prune over segment time intervals.
+
+    Segments are sorted by start time; each one is paired only with the
+    segments that start before it ends. Every unordered pair of segments
+    with a positive time overlap is therefore generated exactly once.
+    Pairs flown by the same drone, or whose bounding boxes are further
+    apart than the safety buffer on some axis, are dropped.
+
+    Yields (index_a, index_b) arrays into `packed`, about chunk_size
+    pairs at a time.
+    """
+    n = len(packed)
+    if n < 2:
+        return
+
+    order = np.argsort(packed[:, 6], kind="stable")
+    t_start = packed[order, 6]
+    t_end = packed[order, 7]
+    owner_sorted = owner[order]
+
+    half = 0.5 * safety_buffer
+    box_lo = np.minimum(packed[order, 0:3], packed[order, 3:6]) - half
+    box_hi = np.maximum(packed[order, 0:3], packed[order, 3:6]) + half
+
+    # Segment i overlaps sorted segments i+1 .. stop[i]-1 in time
+    stop = np.searchsorted(t_start, t_end, side="left")
+    counts = np.maximum(stop - np.arange(n) - 1, 0)
+    cumulative = np.cumsum(counts)
+
+    block_start = 0
+    while block_start < n:
+        base = cumulative[block_start - 1] if block_start else 0
+        block_end = int(np.searchsorted(cumulative, base + chunk_size, side="right"))
+        block_end = min(max(block_end, block_start + 1), n)
+
+        c = counts[block_start:block_end]
+        i = np.repeat(np.arange(block_start, block_end, dtype=np.int64), c)
+        j = i + 1 + np.arange(len(i), dtype=np.int64) - np.repeat(np.cumsum(c) - c, c)
+        block_start = block_end
+
+        # Prune one axis at a time so later axes touch fewer pairs
+        keep = owner_sorted[i] != owner_sorted[j]
+        i, j = i[keep], j[keep]
+        for axis in range(3):
+            keep = (box_lo[i, axis] <= box_hi[j, axis]) & (box_lo[j, axis] <= box_hi[i, axis])
+            i, j = i[keep], j[keep]
+        if len(i):
+            yield order[i], order[j]
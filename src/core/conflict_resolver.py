@@ -7,17 +7,43 @@ Combines:
 - spatial distance and safety buffer
 
 Outputs detailed conflict events for a given primary mission
-against a schedule of other flights.
+against a schedule of other flights, or for every pair of flights
+in a schedule (airspace-wide sweep).
+
+Three conflict engines are available:
+- "sampling": samples positions over the shared time window
+- "analytic": solves the closest approach exactly (constant velocity)
+- "vectorized": the analytic solution over all segment pairs at once
 """
 
-from typing import Dict, List, Tuple, Optional
+import math
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
+from src.core.batch_kernel import (
+    DEFAULT_CHUNK_SIZE,
+    array_to_segments,
+    closest_approach_indexed,
+    closest_approach_pairs,
+    find_conflicting_pairs,
+    iter_likely_conflict_pairs,
+    likely_conflict_order,
+    pack_nearby_segments,
+    pack_schedule_segments,
+    separation_intervals,
+    schedule_drone_ids,
+    segment_velocities,
+    sweep_candidate_pairs,
+)
+from src.core.parallel import find_conflicting_pairs_parallel
+from src.core.spatial_grid import SegmentGrid
+from src.core.spatial_index import BaseSegmentIndex, SegmentIndex
 from src.core.temporal_checker import (
     get_segments_time_overlap,
     interpolate_segment_position,
 )
+from src.data.columnar import ScheduleLike
 from src.data.models import Mission, FlightSchedule, Drone
 
 
@@ -102,15 +128,482 @@ def evaluate_segment_pair_spatiotemporal(
     }
 
 
+def _segment_velocity(
+    start: Tuple[float, float, float],
+    end: Tuple[float, float, float],
+    t_start: float,
+    t_end: float,
+) -> Tuple[float, float, float]:
+    """Constant velocity along a segment (zero for degenerate durations)."""
+    duration = t_end - t_start
+    if duration <= 0:
+        return (0.0, 0.0, 0.0)
+    return (
+        (end[0] - start[0]) / duration,
+        (end[1] - start[1]) / duration,
+        (end[2] - start[2]) / duration,
+    )
+
+
+def evaluate_segment_pair_analytic(
+    seg_a: Tuple[Tuple[float, float, float], Tuple[float, float, float], float, float],
+    seg_b: Tuple[Tuple[float, float, float], Tuple[float, float, float], float, float],
+    safety_buffer: float,
+) -> Dict:
+    """
+    Evaluate spatiotemporal conflict between two segments in closed form.
+
+    Both drones move at constant velocity over the shared time window, so
+    the relative position is r(tau) = r0 + dv * tau and the squared
+    distance |r(tau)|^2 is a quadratic in tau. Its minimum lies at
+        tau* = -(r0 . dv) / (dv . dv)
+    clamped to the overlap. This gives the exact closest approach, so fast
+    drones can no longer slip between samples.
+
+    Returns the same dict as evaluate_segment_pair_spatiotemporal.
+    """
+    start_a, end_a, t_a_start, t_a_end = seg_a
+    start_b, end_b, t_b_start, t_b_end = seg_b
+
+    overlap = get_segments_time_overlap(seg_a, seg_b)
+    if overlap is None:
+        return {
+            "conflict": False,
+            "min_distance": float("inf"),
+            "conflict_time": None,
+            "position_a": None,
+            "position_b": None,
+        }
+
+    t_overlap_start, t_overlap_end = overlap
+
+    vel_a = _segment_velocity(start_a, end_a, t_a_start, t_a_end)
+    vel_b = _segment_velocity(start_b, end_b, t_b_start, t_b_end)
+
+    # Positions at the start of the overlap
+    pa = [start_a[k] + vel_a[k] * (t_overlap_start - t_a_start) for k in range(3)]
+    pb = [start_b[k] + vel_b[k] * (t_overlap_start - t_b_start) for k in range(3)]
+
+    r0 = [pa[k] - pb[k] for k in range(3)]
+    dv = [vel_a[k] - vel_b[k] for k in range(3)]
+
+    dv_sq = dv[0] * dv[0] + dv[1] * dv[1] + dv[2] * dv[2]
+    if dv_sq <= 1e-12:
+        # Same velocity: separation is constant over the overlap
+        tau = 0.0
+    else:
+        tau = -(r0[0] * dv[0] + r0[1] * dv[1] + r0[2] * dv[2]) / dv_sq
+        tau = min(max(tau, 0.0), t_overlap_end - t_overlap_start)
+
+    best_pos_a = tuple(pa[k] + vel_a[k] * tau for k in range(3))
+    best_pos_b = tuple(pb[k] + vel_b[k] * tau for k in range(3))
+    min_dist = math.sqrt(
+        sum((best_pos_a[k] - best_pos_b[k]) ** 2 for k in range(3))
+    )
+
+    return {
+        "conflict": min_dist < safety_buffer,
+        "min_distance": float(min_dist),
+        "conflict_time": float(t_overlap_start + tau),
+        "position_a": best_pos_a,
+        "position_b": best_pos_b,
+    }
+
+
+CONFLICT_ENGINES = ("sampling", "analytic", "vectorized")
+
+
+def get_pair_evaluator(engine: str, num_samples: int = 50) -> Callable:
+    """
+    Return a callable (seg_a, seg_b, safety_buffer) -> result dict
+    for the requested conflict engine.
+    """
+    if engine == "sampling":
+        return lambda seg_a, seg_b, safety_buffer: evaluate_segment_pair_spatiotemporal(
+            seg_a, seg_b, safety_buffer, num_samples=num_samples
+        )
+    if engine in ("analytic", "vectorized"):
+        return evaluate_segment_pair_analytic
+    raise ValueError(
+        f"Unknown conflict engine '{engine}' (expected one of {CONFLICT_ENGINES})"
+    )
+
+
+def _conflict_entry(other_drone_id: str, min_distance, conflict_time, pos_a) -> Dict:
+    # we use the position of mission's drone as the "conflict location"
+    return {
+        "other_drone_id": other_drone_id,
+        "min_distance": float(min_distance),
+        "conflict_time": float(conflict_time),
+        "location": {
+            "x": float(pos_a[0]),
+            "y": float(pos_a[1]),
+            "z": float(pos_a[2]),
+        },
+    }
+
+
+def _resolve_pairwise(
+    mission: Mission,
+    schedule: ScheduleLike,
+    safety_buffer: float,
+    evaluate_pair: Callable,
+) -> List[Dict]:
+    """Scalar path: evaluate every segment pair one at a time."""
+    mission_trajectory = mission.drone.trajectory
+    mission_segments = mission_trajectory.segments
+    conflicts: List[Dict] = []
+
+    for other_drone in schedule.drones:
+        # Whole-drone reject before any segment pair
+        if not mission_trajectory.may_conflict(other_drone.trajectory, safety_buffer):
+            continue
+        other_segments = other_drone.trajectory.segments
+
+        for seg_a in mission_segments:
+            for seg_b in other_segments:
+                result = evaluate_pair(seg_a, seg_b, safety_buffer)
+
+                if result["conflict"]:
+                    conflicts.append(
+                        _conflict_entry(
+                            other_drone.drone_id,
+                            result["min_distance"],
+                            result["conflict_time"],
+                            result["position_a"],
+                        )
+                    )
+
+    return conflicts
+
+
+def _vectorized_hits(
+    mission_array: np.ndarray,
+    other_array: np.ndarray,
+    owner: np.ndarray,
+    safety_buffer: float,
+    chunk_size: int,
+    workers: int = 1,
+) -> Dict[str, np.ndarray]:
+    """Conflicting pairs of mission_array x other_array, plus drone_key per hit."""
+    # Below one chunk of pairs, process start-up costs more than it saves
+    if workers > 1 and len(mission_array) * len(other_array) > chunk_size:
+        hits = find_conflicting_pairs_parallel(
+            mission_array, other_array, owner, safety_buffer, workers, chunk_size=chunk_size
+        )
+    else:
+        hits = find_conflicting_pairs(
+            mission_array, other_array, safety_buffer, chunk_size=chunk_size
+        )
+    hits["drone_key"] = owner[hits["index_b"]]
+    hits["segment_index"] = hits["index_b"]
+    hits["segments_b"] = other_array[hits["index_b"]]
+    return hits
+
+
+def _indexed_hits(
+    mission_array: np.ndarray,
+    index: BaseSegmentIndex,
+    safety_buffer: float,
+    engine: str,
+    num_samples: int,
+) -> Dict[str, np.ndarray]:
+    """Conflicting pairs among the index's candidates for mission_array."""
+    cand = index.query(mission_array, safety_buffer=safety_buffer)
+
+    if engine == "vectorized":
+        res = closest_approach_pairs(mission_array[cand["index_a"]], cand["segments_b"])
+        keep = np.nonzero(res["min_distance"] < safety_buffer)[0]
+        min_distance = res["min_distance"][keep]
+        conflict_time = res["conflict_time"][keep]
+        position_a = res["position_a"][keep]
+    else:
+        evaluate_pair = get_pair_evaluator(engine, num_samples)
+        mission_segments = array_to_segments(mission_array)
+        keep, min_distance, conflict_time, position_a = [], [], [], []
+        for k, seg_b in enumerate(array_to_segments(cand["segments_b"])):
+            result = evaluate_pair(mission_segments[cand["index_a"][k]], seg_b, safety_buffer)
+            if result["conflict"]:
+                keep.append(k)
+                min_distance.append(result["min_distance"])
+                conflict_time.append(result["conflict_time"])
+                position_a.append(result["position_a"])
+        keep = np.asarray(keep, dtype=np.int64)
+        min_distance = np.asarray(min_distance, dtype=float)
+        conflict_time = np.asarray(conflict_time, dtype=float)
+        position_a = np.asarray(position_a, dtype=float).reshape(-1, 3)
+
+    return {
+        "index_a": cand["index_a"][keep],
+        "drone_key": cand["drone_key"][keep],
+        "segment_index": cand["segment_index"][keep],
+        "segments_b": cand["segments_b"][keep],
+        "min_distance": min_distance,
+        "conflict_time": conflict_time,
+        "position_a": position_a,
+    }
+
+
+def _conflict_entries(hits: Dict[str, np.ndarray], rows: np.ndarray, drone_id: Callable) -> List[Dict]:
+    return [
+        _conflict_entry(
+            drone_id(hits["drone_key"][k]),
+            hits["min_distance"][k],
+            hits["conflict_time"][k],
+            hits["position_a"][k],
+        )
+        for k in rows
+    ]
+
+
+def _interval_entries(
+    hits: Dict[str, np.ndarray],
+    rows: np.ndarray,
+    mission_array: np.ndarray,
+    drone_id: Callable,
+    safety_buffer: float,
+    merge_gap: float,
+) -> List[Dict]:
+    """
+    One entry per continuous loss of separation with each drone: the exact
+    [t_enter, t_exit] of every conflicting segment pair, merged when they
+    touch or overlap (within merge_gap seconds) for the same drone. Each
+    entry keeps the closest approach inside it, so it is a superset of a
+    point entry. Ordered by drone, then t_enter.
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    if len(rows) == 0:
+        return []
+    spans = separation_intervals(
+        mission_array[hits["index_a"][rows]], hits["segments_b"][rows], safety_buffer
+    )
+    # Float noise can leave a tangent approach without an interval
+    t_enter = np.where(spans["valid"], spans["t_enter"], hits["conflict_time"][rows])
+    t_exit = np.where(spans["valid"], spans["t_exit"], hits["conflict_time"][rows])
+
+    keys = hits["drone_key"][rows]
+    order = np.lexsort((t_exit, t_enter, keys))
+
+    entries: List[Dict] = []
+    current_key = None
+    for k in order.tolist():
+        row = rows[k]
+        key = keys[k]
+        if entries and key == current_key and t_enter[k] <= entries[-1]["t_exit"] + merge_gap:
+            entry = entries[-1]
+            entry["t_exit"] = max(entry["t_exit"], float(t_exit[k]))
+            if hits["min_distance"][row] < entry["min_distance"]:
+                closest = _conflict_entry(
+                    entry["other_drone_id"], hits["min_distance"][row],
+                    hits["conflict_time"][row], hits["position_a"][row],
+                )
+                entry.update(min_distance=closest["min_distance"],
+                             conflict_time=closest["conflict_time"],
+                             location=closest["location"])
+            continue
+        current_key = key
+        entry = _conflict_entry(
+            drone_id(key), hits["min_distance"][row],
+            hits["conflict_time"][row], hits["position_a"][row],
+        )
+        entry["t_enter"] = float(t_enter[k])
+        entry["t_exit"] = float(t_exit[k])
+        entries.append(entry)
+    return entries
+
+
+def _hit_order(hits: Dict[str, np.ndarray]) -> np.ndarray:
+    """Scalar order: drone, then mission segment, then other segment."""
+    return np.lexsort((hits["segment_index"], hits["index_a"], hits["drone_key"]))
+
+
+def _resolve_vectorized(
+    mission: Mission,
+    schedule: ScheduleLike,
+    safety_buffer: float,
+    chunk_size: int,
+    workers: int = 1,
+) -> List[Dict]:
+    """
+    Batched path: pack all segments and evaluate every pair with NumPy.
+    With workers > 1 the other drones are sharded across processes.
+    Conflicts come out in the same order as the scalar path.
+    """
+    mission_array = mission.drone.trajectory.packed
+    other_array, owner = pack_nearby_segments(schedule, mission_array, safety_buffer)
+    drone_ids = schedule_drone_ids(schedule)
+
+    hits = _vectorized_hits(mission_array, other_array, owner, safety_buffer, chunk_size, workers)
+    return _conflict_entries(hits, _hit_order(hits), lambda key: drone_ids[key])
+
+
+def _resolve_indexed(
+    mission: Mission,
+    index: BaseSegmentIndex,
+    safety_buffer: float,
+    engine: str,
+    num_samples: int,
+) -> List[Dict]:
+    """
+    Pruned path: query the index for candidate pairs and run the exact
+    check on those alone. Conflicts are ordered by drone insertion order,
+    then mission segment, then other segment.
+    """
+    mission_array = mission.drone.trajectory.packed
+    hits = _indexed_hits(mission_array, index, safety_buffer, engine, num_samples)
+    return _conflict_entries(hits, _hit_order(hits), index.drone_id)
+
+
+INTERVAL_MERGE_GAP = 1e-6  # seconds; intervals closer than this merge
+FIRST_CONFLICT_BATCH = 16  # pairs in the first early-exit batch (then x4)
+
+
+def _first_conflict(
+    mission_array: np.ndarray,
+    seg_b: np.ndarray,
+    safety_buffer: float,
+    engine: str,
+    num_samples: int,
+) -> Optional[Tuple[int, Dict]]:
+    """
+    Evaluate the (mission_array[k], seg_b[k]) pairs in order and stop at
+    the first that breaches the buffer. Returns (k, result) or None.
+    The vectorized engine checks growing batches, the scalar engines
+    one pair at a time.
+    """
+    if engine != "vectorized":
+        evaluate_pair = get_pair_evaluator(engine, num_samples)
+        for k, (seg_a_k, seg_b_k) in enumerate(
+            zip(array_to_segments(mission_array), array_to_segments(seg_b))
+        ):
+            result = evaluate_pair(seg_a_k, seg_b_k, safety_buffer)
+            if result["conflict"]:
+                return k, result
+        return None
+
+    lo, size = 0, FIRST_CONFLICT_BATCH
+    while lo < len(seg_b):
+        hi = min(lo + size, len(seg_b))
+        res = closest_approach_pairs(mission_array[lo:hi], seg_b[lo:hi])
+        hit = np.nonzero(res["min_distance"] < safety_buffer)[0]
+        if len(hit):
+            j = int(hit[0])
+            return lo + j, {
+                "conflict": True,
+                "min_distance": res["min_distance"][j],
+                "conflict_time": res["conflict_time"][j],
+                "position_a": res["position_a"][j],
+            }
+        lo, size = hi, size * 4
+    return None
+
+
+def _resolve_first_conflict(
+    mission: Mission,
+    schedule: ScheduleLike,
+    index: Optional[BaseSegmentIndex],
+    safety_buffer: float,
+    engine: str,
+    num_samples: int,
+    chunk_size: int,
+) -> List[Dict]:
+    """
+    Early-exit path: at most one conflict. Candidate pairs that can
+    breach the buffer are checked most likely first (smallest gap
+    between their time-clipped boxes, then longest shared window);
+    without an index this ordering is per chunk of the schedule.
+    """
+    mission_array = mission.drone.trajectory.packed
+
+    if index is not None:
+        cand = index.query(mission_array, safety_buffer=safety_buffer)
+        order = likely_conflict_order(
+            mission_array[cand["index_a"]], cand["segments_b"], safety_buffer
+        )
+        chunks = [(cand["index_a"][order], cand["segments_b"][order], cand["drone_key"][order])]
+        drone_id = index.drone_id
+    else:
+        other_array, owner = pack_nearby_segments(schedule, mission_array, safety_buffer)
+        drone_ids = schedule_drone_ids(schedule)
+        chunks = (
+            (index_a, other_array[index_b], owner[index_b])
+            for index_a, index_b in iter_likely_conflict_pairs(
+                mission_array, other_array, safety_buffer, chunk_size=chunk_size
+            )
+        )
+        drone_id = lambda key: drone_ids[key]
+
+    for index_a, seg_b, keys in chunks:
+        found = _first_conflict(mission_array[index_a], seg_b, safety_buffer, engine, num_samples)
+        if found is not None:
+            k, result = found
+            return [
+                _conflict_entry(
+                    drone_id(keys[k]),
+                    result["min_distance"],
+                    result["conflict_time"],
+                    result["position_a"],
+                )
+            ]
+    return []
+
+
+PRUNING_MODES = ("none", "tree", "grid")
+
+
+def build_segment_index(
+    schedule: ScheduleLike, safety_buffer: float, pruning: str = "tree"
+) -> BaseSegmentIndex:
+    """Build the broad-phase index for a pruning mode ("tree" or "grid")."""
+    if pruning == "tree":
+        return SegmentIndex.from_schedule(schedule, safety_buffer)
+    if pruning == "grid":
+        return SegmentGrid.from_schedule(schedule, safety_buffer)
+    raise ValueError(f"Pruning mode '{pruning}' does not use an index")
+
+
 def resolve_conflicts_for_mission(
     mission: Mission,
-    schedule: FlightSchedule,
+    schedule: ScheduleLike,
     safety_buffer: float,
     num_samples: int = 50,
+    engine: str = "vectorized",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    pruning: str = "none",
+    index: Optional[BaseSegmentIndex] = None,
+    workers: int = 1,
+    first_conflict_only: bool = False,
+    intervals: bool = False,
+    merge_gap: float = INTERVAL_MERGE_GAP,
 ) -> Dict:
     """
     Check a single primary mission against all other flights.
 
+    `engine` selects the conflict engine ("sampling", "analytic" or
+    "vectorized"); `num_samples` only applies to the sampling engine and
+    `chunk_size` (segment pairs per batch) to the vectorized one.
+
+    `pruning="tree"` (BVH) or `pruning="grid"` (hash grid) restricts the
+    exact check to candidate pairs from an index over the schedule. Pass a
+    prebuilt `index` to reuse it across calls (it then stands in for the
+    schedule).
+
+    `workers` > 1 shards the vectorized engine across that many processes.
+
+    `first_conflict_only=True` answers "is it clear?" as cheaply as
+    possible: candidate pairs are checked most likely first and the
+    search stops at the first breach, so "conflicts" holds at most one
+    entry (not necessarily the earliest). `workers` is ignored, and it
+    cannot be combined with `intervals`.
+
+    `intervals=True` reports each continuous loss of separation with a
+    drone once: the exact [t_enter, t_exit] where the distance is below
+    the buffer (solved in closed form, whatever the engine), with the
+    intervals of consecutive segment pairs merged when they are less
+    than `merge_gap` seconds apart. Such entries add "t_enter" and
+    "t_exit" to the keys below and describe the closest approach within
+    the interval.
+
     Returns summary dict:
         {
           "mission_id": str,
@@ -127,34 +620,136 @@ def resolve_conflicts_for_mission(
           ]
         }
     """
-    mission_segments = mission.drone.to_segments()
-    conflicts: List[Dict] = []
+    _check_modes(engine, pruning)
+    if intervals and first_conflict_only:
+        raise ValueError("first_conflict_only cannot be combined with intervals")
 
-    for other_drone in schedule.drones:
-        other_segments = other_drone.to_segments()
+    if intervals:
+        return resolve_conflicts_for_missions(
+            [mission], schedule, safety_buffer, num_samples=num_samples, engine=engine,
+            chunk_size=chunk_size, pruning=pruning, index=index, workers=workers,
+            intervals=True, merge_gap=merge_gap,
+        )[0]
 
-        for seg_a in mission_segments:
-            for seg_b in other_segments:
-                result = evaluate_segment_pair_spatiotemporal(
-                    seg_a, seg_b, safety_buffer, num_samples=num_samples
-                )
+    if first_conflict_only:
+        if index is None and pruning != "none":
+            index = build_segment_index(schedule, safety_buffer, pruning)
+        conflicts = _resolve_first_conflict(
+            mission, schedule, index, safety_buffer, engine, num_samples, chunk_size
+        )
+    elif index is not None or pruning != "none":
+        if index is None:
+            index = build_segment_index(schedule, safety_buffer, pruning)
+        conflicts = _resolve_indexed(mission, index, safety_buffer, engine, num_samples)
+    elif engine == "vectorized":
+        conflicts = _resolve_vectorized(
+            mission, schedule, safety_buffer, chunk_size, workers=workers
+        )
+    else:
+        conflicts = _resolve_pairwise(
+            mission, schedule, safety_buffer, get_pair_evaluator(engine, num_samples)
+        )
 
-                if result["conflict"]:
-                    # we use the position of mission's drone as the "conflict location"
-                    pos_a = result["position_a"]
-                    conflicts.append(
-                        {
-                            "other_drone_id": other_drone.drone_id,
-                            "min_distance": result["min_distance"],
-                            "conflict_time": result["conflict_time"],
-                            "location": {
-                                "x": pos_a[0],
-                                "y": pos_a[1],
-                                "z": pos_a[2],
-                            },
-                        }
-                    )
+    return _mission_summary(mission, conflicts)
+
+
+def is_mission_clear(
+    mission: Mission,
+    schedule: ScheduleLike,
+    safety_buffer: float,
+    **kwargs,
+) -> bool:
+    """
+    True if the mission breaches no safety buffer. Early-exit check; takes
+    the keyword arguments of resolve_conflicts_for_mission.
+    """
+    result = resolve_conflicts_for_mission(
+        mission, schedule, safety_buffer, first_conflict_only=True, **kwargs
+    )
+    return result["status"] == "clear"
+
+
+def resolve_conflicts_for_missions(
+    missions: Sequence[Mission],
+    schedule: ScheduleLike,
+    safety_buffer: float,
+    num_samples: int = 50,
+    engine: str = "vectorized",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    pruning: str = "none",
+    index: Optional[BaseSegmentIndex] = None,
+    workers: int = 1,
+    intervals: bool = False,
+    merge_gap: float = INTERVAL_MERGE_GAP,
+) -> List[Dict]:
+    """
+    Check several missions against one schedule, sharing the work.
+
+    The schedule is packed (or indexed) once and the segments of every
+    mission are evaluated together in one pass, then split per mission.
+    Arguments are as for resolve_conflicts_for_mission, and each result
+    is identical to what it returns for that mission alone.
+    """
+    _check_modes(engine, pruning)
+
+    arrays = [m.drone.trajectory.packed for m in missions]
+    mission_array = np.concatenate(arrays) if arrays else np.empty((0, 8))
+    mission_of_row = np.repeat(np.arange(len(arrays)), [len(a) for a in arrays])
 
+    if index is not None or pruning != "none":
+        if index is None:
+            index = build_segment_index(schedule, safety_buffer, pruning)
+        hits = _indexed_hits(mission_array, index, safety_buffer, engine, num_samples)
+        drone_id = index.drone_id
+    elif engine == "vectorized" or intervals:
+        # Intervals are exact, so they always come from the closed form
+        other_array, owner = pack_nearby_segments(schedule, mission_array, safety_buffer)
+        drone_ids = schedule_drone_ids(schedule)
+        hits = _vectorized_hits(
+            mission_array, other_array, owner, safety_buffer, chunk_size, workers
+        )
+        drone_id = lambda key: drone_ids[key]
+    else:
+        # The scalar engines evaluate pair by pair; nothing to share
+        return [
+            resolve_conflicts_for_mission(
+                m, schedule, safety_buffer, num_samples=num_samples, engine=engine
+            )
+            for m in missions
+        ]
+
+    mission_of_hit = mission_of_row[hits["index_a"]]
+    order = np.lexsort((
+        hits["segment_index"], hits["index_a"], hits["drone_key"], mission_of_hit
+    ))
+    bounds = np.searchsorted(mission_of_hit[order], np.arange(len(missions) + 1))
+
+    if intervals:
+        return [
+            _mission_summary(m, _interval_entries(
+                hits, order[bounds[i]:bounds[i + 1]], mission_array,
+                drone_id, safety_buffer, merge_gap,
+            ))
+            for i, m in enumerate(missions)
+        ]
+    return [
+        _mission_summary(m, _conflict_entries(hits, order[bounds[i]:bounds[i + 1]], drone_id))
+        for i, m in enumerate(missions)
+    ]
+
+
+def _check_modes(engine: str, pruning: str) -> None:
+    if engine not in CONFLICT_ENGINES:
+        raise ValueError(
+            f"Unknown conflict engine '{engine}' (expected one of {CONFLICT_ENGINES})"
+        )
+    if pruning not in PRUNING_MODES:
+        raise ValueError(
+            f"Unknown pruning mode '{pruning}' (expected one of {PRUNING_MODES})"
+        )
+
+
+def _mission_summary(mission: Mission, conflicts: List[Dict]) -> Dict:
     status = "clear" if len(conflicts) == 0 else "conflict_detected"
 
     return {
@@ -163,3 +758,105 @@ def resolve_conflicts_for_mission(
         "total_conflicts": len(conflicts),
         "conflicts": conflicts,
     }
+
+
+def resolve_airspace_conflicts(
+    schedule: ScheduleLike,
+    safety_buffer: float,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict:
+    """
+    Find every conflicting pair of drones in a schedule.
+
+    Each unordered segment pair is generated once by a sweep-and-prune
+    over time intervals, box-filtered, and checked in closed form.
+    Within a pair, drone_a is the drone that comes first in the schedule.
+
+    Returns summary dict:
+        {
+          "status": "clear" or "conflict_detected",
+          "total_conflicting_pairs": int,
+          "total_conflicts": int,
+          "pairs": [
+            {
+              "drone_a": str,
+              "drone_b": str,
+              "min_distance": float,
+              "conflicts": [
+                {
+                  "min_distance": float,
+                  "conflict_time": float,
+                  "location_a": {"x": float, "y": float, "z": float},
+                  "location_b": {"x": float, "y": float, "z": float},
+                },
+                ...
+              ],
+            },
+            ...
+          ]
+        }
+    """
+    packed, owner = pack_schedule_segments(schedule)
+    drone_ids = schedule_drone_ids(schedule)
+    velocities = segment_velocities(packed)
+
+    parts = {"owner_a": [], "owner_b": [], "min_distance": [], "conflict_time": [],
+             "position_a": [], "position_b": []}
+
+    for index_a, index_b in sweep_candidate_pairs(packed, owner, safety_buffer, chunk_size):
+        res = closest_approach_indexed(packed, velocities, index_a, index_b)
+        hit = np.nonzero(res["min_distance"] < safety_buffer)[0]
+        if len(hit) == 0:
+            continue
+
+        # Orient every pair so that drone_a comes first in the schedule
+        swap = owner[index_a[hit]] > owner[index_b[hit]]
+        pos_a, pos_b = res["position_a"][hit], res["position_b"][hit]
+        parts["owner_a"].append(np.where(swap, owner[index_b[hit]], owner[index_a[hit]]))
+        parts["owner_b"].append(np.where(swap, owner[index_a[hit]], owner[index_b[hit]]))
+        parts["position_a"].append(np.where(swap[:, None], pos_b, pos_a))
+        parts["position_b"].append(np.where(swap[:, None], pos_a, pos_b))
+        parts["min_distance"].append(res["min_distance"][hit])
+        parts["conflict_time"].append(res["conflict_time"][hit])
+
+    pairs: List[Dict] = []
+    total_conflicts = 0
+
+    if parts["owner_a"]:
+        hits = {key: np.concatenate(val) for key, val in parts.items()}
+        order = np.lexsort((hits["conflict_time"], hits["owner_b"], hits["owner_a"]))
+        total_conflicts = len(order)
+
+        rows = zip(
+            hits["owner_a"][order].tolist(),
+            hits["owner_b"][order].tolist(),
+            hits["min_distance"][order].tolist(),
+            hits["conflict_time"][order].tolist(),
+            hits["position_a"][order].tolist(),
+            hits["position_b"][order].tolist(),
+        )
+        current = None
+        for owner_a, owner_b, min_distance, conflict_time, pos_a, pos_b in rows:
+            if (owner_a, owner_b) != current:
+                current = (owner_a, owner_b)
+                pairs.append({
+                    "drone_a": drone_ids[owner_a],
+                    "drone_b": drone_ids[owner_b],
+                    "min_distance": min_distance,
+                    "conflicts": [],
+                })
+            entry = pairs[-1]
+            entry["min_distance"] = min(entry["min_distance"], min_distance)
+            entry["conflicts"].append({
+                "min_distance": min_distance,
+                "conflict_time": conflict_time,
+                "location_a": {"x": pos_a[0], "y": pos_a[1], "z": pos_a[2]},
+                "location_b": {"x": pos_b[0], "y": pos_b[1], "z": pos_b[2]},
+            })
+
+    return {
+        "status": "clear" if not pairs else "conflict_detected",
+        "total_conflicting_pairs": len(pairs),
+        "total_conflicts": total_conflicts,
+        "pairs": pairs,
+    }
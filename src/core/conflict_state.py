@@ -0,0 +1,242 @@
+"""
+Incremental conflict state for a changing airspace.
+
+ConflictStateStore keeps the result of every conflicting drone pair plus
+a persistent segment index. When a flight is filed, cancelled or amended
+only the pairs involving that drone are re-evaluated (its segments are
+queried against the index and checked in closed form), and the change is
+reported as a ConflictDiff of new, cleared and changed pairs.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from src.core.batch_kernel import closest_approach_pairs
+from src.core.conflict_resolver import build_segment_index, resolve_airspace_conflicts
+from src.core.spatial_index import BaseSegmentIndex
+from src.data.columnar import ScheduleLike
+from src.data.models import Drone, FlightSchedule
+
+PairKey = Tuple[str, str]
+
+# Results closer than this are the same result (guards float noise)
+_RESULT_TOLERANCE = 1e-9
+
+
+@dataclass
+class PairConflict:
+    """
+    Every conflict between two drones. drone_a < drone_b (by id), and
+    conflicts use the entry format of resolve_airspace_conflicts,
+    ordered by conflict time (then distance).
+    """
+    drone_a: str
+    drone_b: str
+    min_distance: float
+    conflicts: List[Dict]
+
+    @property
+    def key(self) -> PairKey:
+        return (self.drone_a, self.drone_b)
+
+    def involves(self, drone_id: str) -> bool:
+        return drone_id in self.key
+
+    def same_as(self, other: "PairConflict") -> bool:
+        if len(self.conflicts) != len(other.conflicts):
+            return False
+        values = [_entry_values(c) for c in self.conflicts]
+        other_values = [_entry_values(c) for c in other.conflicts]
+        return np.allclose(values, other_values, rtol=0.0, atol=_RESULT_TOLERANCE)
+
+
+@dataclass
+class ConflictDiff:
+    """Pairs that started, stopped or changed conflicting after an update."""
+    new: List[PairConflict] = field(default_factory=list)
+    cleared: List[PairConflict] = field(default_factory=list)
+    changed: List[PairConflict] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.new or self.cleared or self.changed)
+
+
+def _entry_values(entry: Dict) -> List[float]:
+    loc_a, loc_b = entry["location_a"], entry["location_b"]
+    return [
+        entry["min_distance"], entry["conflict_time"],
+        loc_a["x"], loc_a["y"], loc_a["z"], loc_b["x"], loc_b["y"], loc_b["z"],
+    ]
+
+
+def _location(pos) -> Dict:
+    return {"x": float(pos[0]), "y": float(pos[1]), "z": float(pos[2])}
+
+
+def _pair_key(a: str, b: str) -> PairKey:
+    return (a, b) if a < b else (b, a)
+
+
+class ConflictStateStore:
+    """
+    Per-pair conflict results for a schedule, updated one flight at a time.
+
+    The index holds every drone in the store; it is updated in place, so
+    each amendment costs one index query for the changed drone.
+    """
+
+    def __init__(self, safety_buffer: float, pruning: str = "tree"):
+        self.safety_buffer = float(safety_buffer)
+        self._index: BaseSegmentIndex = build_segment_index(
+            FlightSchedule(drones=[]), safety_buffer, pruning
+        )
+        self._pairs: Dict[PairKey, PairConflict] = {}
+        self._partners: Dict[str, Set[str]] = {}
+
+    @classmethod
+    def from_schedule(
+        cls, schedule: ScheduleLike, safety_buffer: float, pruning: str = "tree"
+    ) -> "ConflictStateStore":
+        """Seed the store with one all-pairs sweep over the schedule."""
+        store = cls(safety_buffer, pruning=pruning)
+        store._index = build_segment_index(schedule, safety_buffer, pruning)
+        for drone_id in store._index.drone_ids:
+            store._partners[drone_id] = set()
+
+        report = resolve_airspace_conflicts(schedule, safety_buffer)
+        for pair in report["pairs"]:
+            a, b = pair["drone_a"], pair["drone_b"]
+            conflicts = pair["conflicts"]
+            if a > b:
+                a, b = b, a
+                conflicts = [
+                    {**c, "location_a": c["location_b"], "location_b": c["location_a"]}
+                    for c in conflicts
+                ]
+            store._set_pair(PairConflict(
+                a, b, pair["min_distance"],
+                sorted(conflicts, key=lambda c: (c["conflict_time"], c["min_distance"])),
+            ))
+        return store
+
+    # ---------------- State ----------------
+
+    def __len__(self) -> int:
+        """Number of conflicting pairs."""
+        return len(self._pairs)
+
+    def __contains__(self, drone_id: str) -> bool:
+        return drone_id in self._partners
+
+    @property
+    def drone_ids(self) -> List[str]:
+        return self._index.drone_ids
+
+    def pairs(self) -> List[PairConflict]:
+        return [self._pairs[k] for k in sorted(self._pairs)]
+
+    def get_pair(self, a: str, b: str) -> Optional[PairConflict]:
+        return self._pairs.get(_pair_key(a, b))
+
+    def conflicts_for(self, drone_id: str) -> List[PairConflict]:
+        """Every conflicting pair the drone is part of."""
+        return [
+            self._pairs[_pair_key(drone_id, other)]
+            for other in sorted(self._partners.get(drone_id, ()))
+        ]
+
+    def _set_pair(self, pair: PairConflict) -> None:
+        self._pairs[pair.key] = pair
+        self._partners.setdefault(pair.drone_a, set()).add(pair.drone_b)
+        self._partners.setdefault(pair.drone_b, set()).add(pair.drone_a)
+
+    def _drop_pair(self, key: PairKey) -> PairConflict:
+        pair = self._pairs.pop(key)
+        self._partners[pair.drone_a].discard(pair.drone_b)
+        self._partners[pair.drone_b].discard(pair.drone_a)
+        return pair
+
+    # ---------------- Updates ----------------
+
+    def add_flight(self, drone: Drone) -> ConflictDiff:
+        """
+        File a flight, or amend it if the drone id is already stored.
+        Only pairs involving this drone are re-evaluated.
+        """
+        drone_id = drone.drone_id
+        segments = drone.trajectory.packed
+
+        if drone_id in self._partners:
+            if np.array_equal(self._index.drone_segments(drone_id), segments):
+                return ConflictDiff()
+            self._index.remove(drone_id)
+
+        fresh = self._evaluate(drone_id, segments)
+        self._index.insert_segments(drone_id, segments)
+        self._partners.setdefault(drone_id, set())
+
+        diff = ConflictDiff()
+        for other in sorted(self._partners[drone_id] - set(fresh)):
+            diff.cleared.append(self._drop_pair(_pair_key(drone_id, other)))
+        for other in sorted(fresh):
+            pair = fresh[other]
+            old = self._pairs.get(pair.key)
+            if old is None:
+                diff.new.append(pair)
+            elif not old.same_as(pair):
+                diff.changed.append(pair)
+            self._set_pair(pair)
+        return diff
+
+    update_flight = add_flight
+
+    def remove_flight(self, drone_id: str) -> ConflictDiff:
+        """Cancel a flight; every pair it was part of is cleared."""
+        if drone_id not in self._partners:
+            return ConflictDiff()
+        diff = ConflictDiff(cleared=[
+            self._drop_pair(_pair_key(drone_id, other))
+            for other in sorted(self._partners[drone_id])
+        ])
+        del self._partners[drone_id]
+        self._index.remove(drone_id)
+        return diff
+
+    def _evaluate(self, drone_id: str, segments: np.ndarray) -> Dict[str, PairConflict]:
+        """Conflicts of `segments` against every other stored drone."""
+        if len(segments) == 0 or len(self._index) == 0:
+            return {}
+
+        cand = self._index.query(segments)
+        res = closest_approach_pairs(segments[cand["index_a"]], cand["segments_b"])
+        hit = np.nonzero(res["min_distance"] < self.safety_buffer)[0]
+
+        keys = cand["drone_key"][hit]
+        order = np.lexsort((res["min_distance"][hit], res["conflict_time"][hit], keys))
+        grouped: Dict[str, List[Tuple[float, float, Dict, Dict]]] = {}
+        for k in hit[order].tolist():
+            other = self._index.drone_id(cand["drone_key"][k])
+            grouped.setdefault(other, []).append((
+                float(res["min_distance"][k]),
+                float(res["conflict_time"][k]),
+                _location(res["position_a"][k]),
+                _location(res["position_b"][k]),
+            ))
+
+        pairs = {}
+        for other, rows in grouped.items():
+            flip = other < drone_id  # this drone is drone_b of the pair
+            conflicts = [
+                {
+                    "min_distance": d,
+                    "conflict_time": t,
+                    "location_a": loc_b if flip else loc_a,
+                    "location_b": loc_a if flip else loc_b,
+                }
+                for d, t, loc_a, loc_b in rows
+            ]
+            a, b = _pair_key(drone_id, other)
+            pairs[other] = PairConflict(a, b, min(r[0] for r in rows), conflicts)
+        return pairs
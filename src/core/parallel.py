@@ -0,0 +1,150 @@
+"""
+Multiprocess sharded conflict evaluation.
+
+The packed (N, 8) segment array of the schedule is placed in a
+multiprocessing.shared_memory block, which is kept and reused while the
+same array object comes back (such as the cached segment_array() of a
+ColumnarSchedule), so packed arrays must not be modified in place. Worker
+processes map the block without copying or pickling any dataclasses. The other-drone set is
+split into contiguous shards of roughly equal segment counts (aligned to
+drone boundaries), each worker runs the vectorized kernel on its shard,
+and the partial hit lists are merged in shard order, so the result does
+not depend on worker scheduling.
+"""
+
+import atexit
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.core.batch_kernel import DEFAULT_CHUNK_SIZE, SEGMENT_COLUMNS, find_conflicting_pairs
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+
+# (packed array, shared copy of it); the lock is held while workers read it
+_shared: Optional[Tuple[np.ndarray, shared_memory.SharedMemory]] = None
+_shared_lock = threading.Lock()
+
+
+def get_executor(workers: int) -> ProcessPoolExecutor:
+    """Shared process pool, recreated only when the worker count changes."""
+    global _executor, _executor_workers
+    if _executor is None or _executor_workers != workers:
+        shutdown_executor()
+        _executor = ProcessPoolExecutor(max_workers=workers)
+        _executor_workers = workers
+    return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor, _executor_workers
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+    _executor = None
+    _executor_workers = 0
+
+
+def _share(packed: np.ndarray) -> shared_memory.SharedMemory:
+    """Shared-memory copy of `packed`, reused for the same array object."""
+    global _shared
+    if _shared is not None and _shared[0] is packed:
+        return _shared[1]
+    release_shared()
+    shm = shared_memory.SharedMemory(create=True, size=max(packed.nbytes, 1))
+    shared = np.ndarray(packed.shape, dtype=np.float64, buffer=shm.buf)
+    shared[:] = packed
+    del shared  # release the view so the block can be closed
+    _shared = (packed, shm)
+    return shm
+
+
+def release_shared() -> None:
+    """Free the shared copy of the last packed array."""
+    global _shared
+    if _shared is not None:
+        _shared[1].close()
+        _shared[1].unlink()
+    _shared = None
+
+
+atexit.register(shutdown_executor)
+atexit.register(release_shared)
+
+
+def shard_bounds(owner: np.ndarray, num_shards: int) -> List[Tuple[int, int]]:
+    """
+    Split rows of an owner-sorted segment array into at most num_shards
+    contiguous [lo, hi) ranges of similar size that never split a drone.
+    """
+    n = len(owner)
+    if n == 0:
+        return []
+    cuts = [0]
+    for k in range(1, num_shards):
+        target = (n * k) // num_shards
+        # Snap the cut back to the first segment of the drone at target
+        cut = int(np.searchsorted(owner, owner[min(target, n - 1)], side="left"))
+        if target >= n or cut <= cuts[-1]:
+            continue
+        cuts.append(cut)
+    cuts.append(n)
+    return [(lo, hi) for lo, hi in zip(cuts[:-1], cuts[1:]) if hi > lo]
+
+
+def _evaluate_shard(
+    shm_name: str,
+    num_rows: int,
+    lo: int,
+    hi: int,
+    mission_array: np.ndarray,
+    safety_buffer: float,
+    chunk_size: int,
+) -> Dict[str, np.ndarray]:
+    """Worker: run the vectorized kernel on rows [lo, hi) of the shared array."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        packed = np.ndarray((num_rows, SEGMENT_COLUMNS), dtype=np.float64, buffer=shm.buf)
+        hits = find_conflicting_pairs(
+            mission_array, packed[lo:hi], safety_buffer, chunk_size=chunk_size
+        )
+        hits["index_b"] += lo
+        del packed
+        return hits
+    finally:
+        shm.close()
+
+
+def find_conflicting_pairs_parallel(
+    mission_array: np.ndarray,
+    packed: np.ndarray,
+    owner: np.ndarray,
+    safety_buffer: float,
+    workers: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, np.ndarray]:
+    """
+    Same result as find_conflicting_pairs(mission_array, packed, ...),
+    computed across `workers` processes. `owner` must be sorted (as
+    produced by pack_schedule_segments) so shards align with drones.
+    """
+    shards = shard_bounds(owner, workers)
+    if len(shards) <= 1:
+        return find_conflicting_pairs(mission_array, packed, safety_buffer, chunk_size=chunk_size)
+
+    with _shared_lock:
+        shm = _share(packed)
+        executor = get_executor(workers)
+        futures = [
+            executor.submit(
+                _evaluate_shard, shm.name, len(packed), lo, hi,
+                mission_array, safety_buffer, chunk_size,
+            )
+            for lo, hi in shards
+        ]
+        parts = [f.result() for f in futures]
+
+    return {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
@@ -1,16 +1,93 @@
 """
 Spatial conflict detection module.
-Computes minimum distance between two 3D line segments.
+Computes minimum distance between 3D line segments, one pair at a time
+or for arrays of pairs.
 """
 
+import math
+
 import numpy as np
 from typing import Tuple, Dict
 
+# Squared lengths below this are points; relative denominators below it are parallel
+_EPS = 1e-12
+
 
 def segment_to_vector(seg_start, seg_end):
     return np.array(seg_start), np.array(seg_end - seg_start)
 
 
+def _dot(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+    return np.einsum("ij,ij->i", p, q)
+
+
+def segment_distances(
+    A0: np.ndarray,
+    A1: np.ndarray,
+    B0: np.ndarray,
+    B1: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """
+    Minimum 3D distance between segments A[k] = A0[k]-A1[k] and
+    B[k] = B0[k]-B1[k] for (N, 3) endpoint arrays.
+
+    The unconstrained closest points are clamped to A, then the point on
+    B is recomputed for that clamp and clamped in turn (re-solving on A
+    when B is clamped), so parallel segments and zero-length segments
+    both get their true closest endpoints.
+
+    Returns dict of arrays:
+        {
+            "distance": (N,) float,
+            "point_on_A": (N, 3) float,
+            "point_on_B": (N, 3) float,
+        }
+    """
+    A0 = np.asarray(A0, dtype=float).reshape(-1, 3)
+    A1 = np.asarray(A1, dtype=float).reshape(-1, 3)
+    B0 = np.asarray(B0, dtype=float).reshape(-1, 3)
+    B1 = np.asarray(B1, dtype=float).reshape(-1, 3)
+
+    u = A1 - A0
+    v = B1 - B0
+    w0 = A0 - B0
+
+    a = _dot(u, u)  # always >= 0
+    b = _dot(u, v)
+    c = _dot(v, v)  # always >= 0
+    d = _dot(u, w0)
+    e = _dot(v, w0)
+
+    a_point = a <= _EPS
+    b_point = c <= _EPS
+    safe_a = np.where(a_point, 1.0, a)
+    safe_c = np.where(b_point, 1.0, c)
+
+    # s on A from the unconstrained solution; any s works for parallel lines
+    D = a * c - b * b  # denom
+    parallel = D <= _EPS * a * c
+    s = np.where(parallel, 0.0, (b * e - c * d) / np.where(parallel, 1.0, D))
+    # A point B: project B0 onto A
+    s = np.where(b_point, -d / safe_a, s)
+    s = np.where(a_point, 0.0, np.clip(s, 0.0, 1.0))
+
+    # Point on B closest to A(s); if that is off B, clamp it and re-solve s
+    t = np.where(b_point, 0.0, (b * s + e) / safe_c)
+    s = np.where(t < 0.0, np.clip(-d / safe_a, 0.0, 1.0), s)
+    s = np.where(t > 1.0, np.clip((b - d) / safe_a, 0.0, 1.0), s)
+    s = np.where(a_point, 0.0, s)
+    t = np.clip(t, 0.0, 1.0)
+
+    closest_A = A0 + s[:, None] * u
+    closest_B = B0 + t[:, None] * v
+
+    return {
+        "distance": np.linalg.norm(closest_A - closest_B, axis=1),
+        "point_on_A": closest_A,
+        "point_on_B": closest_B,
+    }
+
+
 def compute_min_distance_segment_segment(
     A0: Tuple[float, float, float],
     A1: Tuple[float, float, float],
@@ -26,46 +103,69 @@ def compute_min_distance_segment_segment(
             "point_on_B": np.array
         }
     """
-
-    A0 = np.array(A0, dtype=float)
-    A1 = np.array(A1, dtype=float)
-    B0 = np.array(B0, dtype=float)
-    B1 = np.array(B1, dtype=float)
-
-    u = A1 - A0
-    v = B1 - B0
-    w0 = A0 - B0
-
-    a = np.dot(u, u)  # always >= 0
-    b = np.dot(u, v)
-    c = np.dot(v, v)  # always >= 0
-    d = np.dot(u, w0)
-    e = np.dot(v, w0)
-
-    D = a * c - b * b  # denom
-
-    # parameters on each segment (0 to 1)
-    if D < 1e-8:  
-        # Segments are almost parallel
+    # Same clamp-and-re-solve as segment_distances, in plain floats: the
+    # pairwise engines call this once per segment pair
+    ax, ay, az = (float(q) for q in A0)
+    bx, by, bz = (float(q) for q in B0)
+    ux, uy, uz = float(A1[0]) - ax, float(A1[1]) - ay, float(A1[2]) - az
+    vx, vy, vz = float(B1[0]) - bx, float(B1[1]) - by, float(B1[2]) - bz
+    wx, wy, wz = ax - bx, ay - by, az - bz
+
+    a = ux * ux + uy * uy + uz * uz  # always >= 0
+    b = ux * vx + uy * vy + uz * vz
+    c = vx * vx + vy * vy + vz * vz  # always >= 0
+    d = ux * wx + uy * wy + uz * wz
+    e = vx * wx + vy * wy + vz * wz
+
+    if a <= _EPS:
         s = 0.0
-        t = (e / c) if c != 0 else 0.0
+    elif c <= _EPS:
+        # A point B: project B0 onto A
+        s = min(max(-d / a, 0.0), 1.0)
     else:
-        s = (b * e - c * d) / D
-        t = (a * e - b * d) / D
+        D = a * c - b * b  # denom
+        s = 0.0 if D <= _EPS * a * c else min(max((b * e - c * d) / D, 0.0), 1.0)
+
+    # Point on B closest to A(s); if that is off B, clamp it and re-solve s
+    t = 0.0 if c <= _EPS else (b * s + e) / c
+    if t < 0.0:
+        t = 0.0
+        s = 0.0 if a <= _EPS else min(max(-d / a, 0.0), 1.0)
+    elif t > 1.0:
+        t = 1.0
+        s = 0.0 if a <= _EPS else min(max((b - d) / a, 0.0), 1.0)
+
+    closest_A = np.array((ax + s * ux, ay + s * uy, az + s * uz))
+    closest_B = np.array((bx + t * vx, by + t * vy, bz + t * vz))
+    dx, dy, dz = closest_A - closest_B
 
-    # Clamp to segment range [0,1]
-    s = min(max(s, 0.0), 1.0)
-    t = min(max(t, 0.0), 1.0)
+    return {
+        "distance": math.sqrt(dx * dx + dy * dy + dz * dz),
+        "point_on_A": closest_A,
+        "point_on_B": closest_B,
+    }
 
-    closest_A = A0 + s * u
-    closest_B = B0 + t * v
 
-    distance = np.linalg.norm(closest_A - closest_B)
+def check_spatial_conflicts(
+    A0: np.ndarray, A1: np.ndarray, B0: np.ndarray, B1: np.ndarray, safety_buffer: float
+) -> Dict[str, np.ndarray]:
+    """
+    check_spatial_conflict for (N, 3) endpoint arrays.
+    Returns dict of arrays:
+        {
+            "conflict": (N,) bool,
+            "distance": (N,) float,
+            "closest_point_A": (N, 3) float,
+            "closest_point_B": (N, 3) float
+        }
+    """
+    result = segment_distances(A0, A1, B0, B1)
 
     return {
-        "distance": float(distance),
-        "point_on_A": closest_A,
-        "point_on_B": closest_B
+        "conflict": result["distance"] < safety_buffer,
+        "distance": result["distance"],
+        "closest_point_A": result["point_on_A"],
+        "closest_point_B": result["point_on_B"],
     }
 
 
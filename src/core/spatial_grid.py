@@ -0,0 +1,169 @@
+"""
+Uniform 3D grid with time buckets (sector hashing) for candidate generation.
+
+Airspace is cut into cubic cells of at least the safety buffer and time
+into fixed buckets. Every segment is split into pieces no longer than a
+cell and no longer than a bucket, and each piece is registered in every
+(cell, bucket) its box - inflated by the safety buffer - touches. Two
+segments are candidates when they share a cell key; pairs are
+de-duplicated and filtered with the same 4D box test as the BVH.
+
+Cell keys are hashed into int64, so the registry is a pair of sorted
+arrays and sharding the airspace is a matter of partitioning keys.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from src.core.spatial_index import (
+    DEFAULT_REBUILD_RATIO,
+    BaseSegmentIndex,
+    boxes_intersect,
+)
+
+DEFAULT_CELL_FACTOR = 2.0  # cell edge, in safety buffers
+DEFAULT_TIME_BUCKET = 10.0  # seconds
+
+_HASH_PRIMES = np.array(
+    [73856093, 19349663, 83492791, 2654435761], dtype=np.int64
+)
+
+
+def hash_cells(cells: np.ndarray) -> np.ndarray:
+    """Hash (K, 4) integer (ix, iy, iz, it) cell coordinates to int64 keys."""
+    mixed = cells * _HASH_PRIMES
+    return mixed[:, 0] ^ mixed[:, 1] ^ mixed[:, 2] ^ mixed[:, 3]
+
+
+def segment_pieces(
+    segments: np.ndarray,
+    cell_size: float,
+    time_bucket: float,
+    inflate: float = 0.0,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Split packed (N, 8) segments into pieces that span at most one cell
+    and one time bucket, and return their 4D boxes.
+
+    Returns:
+        (lo, hi, row) where lo / hi are (P, 4) piece boxes (spatial axes
+        inflated by `inflate`) and row[p] is the segment of piece p.
+    """
+    start, end = segments[:, 0:3], segments[:, 3:6]
+    t0, t1 = segments[:, 6], segments[:, 7]
+
+    length = np.linalg.norm(end - start, axis=1)
+    n_pieces = np.maximum(
+        1, np.ceil(np.maximum(length / cell_size, (t1 - t0) / time_bucket))
+    ).astype(np.int64)
+
+    row = np.repeat(np.arange(len(segments), dtype=np.int64), n_pieces)
+    k = np.arange(len(row), dtype=np.int64) - np.repeat(
+        np.cumsum(n_pieces) - n_pieces, n_pieces
+    )
+    a0 = (k / n_pieces[row])[:, None]
+    a1 = ((k + 1) / n_pieces[row])[:, None]
+
+    delta = (end - start)[row]
+    p0 = start[row] + a0 * delta
+    p1 = start[row] + a1 * delta
+    dt = (t1 - t0)[row][:, None]
+
+    lo = np.empty((len(row), 4), dtype=float)
+    hi = np.empty((len(row), 4), dtype=float)
+    lo[:, :3] = np.minimum(p0, p1) - inflate
+    hi[:, :3] = np.maximum(p0, p1) + inflate
+    lo[:, 3] = t0[row] + a0[:, 0] * dt[:, 0]
+    hi[:, 3] = t0[row] + a1[:, 0] * dt[:, 0]
+    return lo, hi, row
+
+
+def box_cell_keys(
+    lo: np.ndarray,
+    hi: np.ndarray,
+    cell_size: float,
+    time_bucket: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Every (cell, bucket) key touched by each box.
+
+    Returns:
+        (keys, box) where box[k] is the row of the box that touches keys[k].
+    """
+    scale = np.array([cell_size, cell_size, cell_size, time_bucket])
+    ilo = np.floor(lo / scale).astype(np.int64)
+    ihi = np.floor(hi / scale).astype(np.int64)
+    counts = ihi - ilo + 1
+    total = counts.prod(axis=1)
+
+    box = np.repeat(np.arange(len(lo), dtype=np.int64), total)
+    local = np.arange(len(box), dtype=np.int64) - np.repeat(np.cumsum(total) - total, total)
+
+    # Mixed-radix decomposition of the local index into per-axis offsets
+    cells = np.empty((len(box), 4), dtype=np.int64)
+    box_counts = counts[box]
+    for axis in range(4):
+        cells[:, axis] = ilo[box, axis] + local % box_counts[:, axis]
+        local = local // box_counts[:, axis]
+
+    return hash_cells(cells), box
+
+
+class SegmentGrid(BaseSegmentIndex):
+    """
+    Persistent hash-grid index over schedule segments.
+
+    Same interface as SegmentIndex (insert / remove / query), so the
+    resolver can use either for pruning.
+    """
+
+    def __init__(
+        self,
+        safety_buffer: float,
+        cell_size: Optional[float] = None,
+        time_bucket: float = DEFAULT_TIME_BUCKET,
+        rebuild_ratio: float = DEFAULT_REBUILD_RATIO,
+    ):
+        if cell_size is None:
+            cell_size = DEFAULT_CELL_FACTOR * safety_buffer
+        self.cell_size = max(float(cell_size), float(safety_buffer))
+        if self.cell_size <= 0 or time_bucket <= 0:
+            raise ValueError("Grid cell size and time bucket must be positive")
+        self.time_bucket = float(time_bucket)
+
+        self._cell_keys = np.empty(0, dtype=np.int64)
+        self._cell_items = np.empty(0, dtype=np.int64)
+        super().__init__(safety_buffer, rebuild_ratio=rebuild_ratio)
+
+    def _keys_for(self, segments: np.ndarray, inflate: float) -> Tuple[np.ndarray, np.ndarray]:
+        lo, hi, row = segment_pieces(segments, self.cell_size, self.time_bucket, inflate)
+        keys, box = box_cell_keys(lo, hi, self.cell_size, self.time_bucket)
+        return keys, row[box]
+
+    def _build_structure(self) -> None:
+        keys, items = self._keys_for(self._built_segments, self.safety_buffer)
+        order = np.argsort(keys, kind="stable")
+        self._cell_keys = keys[order]
+        self._cell_items = items[order]
+
+    def _query_structure(self, segments, q_lo, q_hi):
+        empty = np.empty(0, dtype=np.int64)
+        if len(segments) == 0 or len(self._cell_keys) == 0:
+            return empty, empty
+
+        q_keys, q_rows = self._keys_for(segments, 0.0)
+        left = np.searchsorted(self._cell_keys, q_keys, side="left")
+        right = np.searchsorted(self._cell_keys, q_keys, side="right")
+        counts = right - left
+
+        qi = np.repeat(q_rows, counts)
+        local = np.arange(len(qi), dtype=np.int64) - np.repeat(np.cumsum(counts) - counts, counts)
+        items = self._cell_items[np.repeat(left, counts) + local]
+
+        # De-duplicate pairs found through several shared cells
+        pair_ids = np.unique(qi * len(self._built_keys) + items)
+        qi, items = pair_ids // len(self._built_keys), pair_ids % len(self._built_keys)
+
+        hit = boxes_intersect(q_lo[qi], q_hi[qi], self._built_lo[items], self._built_hi[items])
+        return qi[hit], items[hit]
@@ -0,0 +1,367 @@
+"""
+Spatiotemporal segment index.
+
+A bounding volume hierarchy over 4D (x, y, z, t) boxes of schedule
+segments. Each stored box spans the segment's spatial extent inflated by
+the safety buffer and its exact time interval, so two segments can only
+breach the buffer if their boxes intersect. The resolver queries the
+index for candidate pairs and runs the exact check on those alone.
+
+The index is persistent: drones can be inserted and removed one at a time
+as flights are filed and cancelled. Removed drones are masked out, newly
+inserted drones are kept in a small pending set that is scanned directly,
+and the hierarchy is rebuilt lazily once those exceed a fraction of the
+indexed segments. That bookkeeping lives in BaseSegmentIndex, which the
+hash grid in spatial_grid.py shares.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.core.batch_kernel import (
+    SEGMENT_COLUMNS,
+    pack_schedule_segments,
+    schedule_drone_ids,
+)
+from src.data.columnar import ScheduleLike
+from src.data.models import Drone
+
+DEFAULT_LEAF_SIZE = 16
+DEFAULT_REBUILD_RATIO = 0.25
+
+
+def segment_boxes(segments: np.ndarray, inflate: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    4D axis-aligned boxes (x, y, z, t) of packed (N, 8) segments.
+    The spatial axes are inflated by `inflate`; the time axis is not.
+    """
+    lo = np.empty((len(segments), 4), dtype=float)
+    hi = np.empty((len(segments), 4), dtype=float)
+    lo[:, :3] = np.minimum(segments[:, 0:3], segments[:, 3:6]) - inflate
+    hi[:, :3] = np.maximum(segments[:, 0:3], segments[:, 3:6]) + inflate
+    lo[:, 3] = segments[:, 6]
+    hi[:, 3] = segments[:, 7]
+    return lo, hi
+
+
+def boxes_intersect(lo_a, hi_a, lo_b, hi_b) -> np.ndarray:
+    """
+    Broadcast box intersection test on the trailing axis (x, y, z, t).
+    Spatial contact counts as intersecting; time intervals must overlap
+    with positive length, like get_time_overlap.
+    """
+    spatial = ((lo_a[..., :3] <= hi_b[..., :3]) & (lo_b[..., :3] <= hi_a[..., :3])).all(axis=-1)
+    temporal = (lo_a[..., 3] < hi_b[..., 3]) & (lo_b[..., 3] < hi_a[..., 3])
+    return spatial & temporal
+
+
+class _Hierarchy:
+    """Flattened, immutable BVH over a fixed set of boxes."""
+
+    def __init__(self, lo: np.ndarray, hi: np.ndarray, leaf_size: int):
+        self.order = np.arange(len(lo), dtype=np.int64)
+        node_lo, node_hi, children, leaves = [], [], [], []
+
+        if len(lo):
+            stack = [(0, len(lo), -1, 0)]  # (start, stop, parent, side)
+            while stack:
+                start, stop, parent, side = stack.pop()
+                items = self.order[start:stop]
+                node = len(node_lo)
+                node_lo.append(lo[items].min(axis=0))
+                node_hi.append(hi[items].max(axis=0))
+                children.append([-1, -1])
+                leaves.append((start, stop))
+                if parent >= 0:
+                    children[parent][side] = node
+
+                if stop - start <= leaf_size:
+                    continue
+
+                # Split at the median centroid along the axis that holds the
+                # most boxes side by side (unit-free across space and time).
+                centers = 0.5 * (lo[items] + hi[items])
+                sizes = np.maximum((hi[items] - lo[items]).mean(axis=0), 1e-9)
+                spread = (centers.max(axis=0) - centers.min(axis=0)) / sizes
+                axis = int(np.argmax(spread))
+                mid = (stop - start) // 2
+                part = np.argpartition(centers[:, axis], mid)
+                self.order[start:stop] = items[part]
+
+                leaves[node] = (0, 0)
+                stack.append((start + mid, stop, node, 1))
+                stack.append((start, start + mid, node, 0))
+
+        self.node_lo = np.asarray(node_lo, dtype=float).reshape(-1, 4)
+        self.node_hi = np.asarray(node_hi, dtype=float).reshape(-1, 4)
+        self.children = np.asarray(children, dtype=np.int64).reshape(-1, 2)
+        self.leaves = np.asarray(leaves, dtype=np.int64).reshape(-1, 2)
+
+    def query(self, q_lo, q_hi, lo, hi) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        All (query, item) pairs whose boxes intersect.
+        `lo` / `hi` are the item boxes the hierarchy was built from.
+        """
+        out_q, out_i = [], []
+        if len(self.node_lo) == 0 or len(q_lo) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        stack = [(0, np.arange(len(q_lo), dtype=np.int64))]
+        while stack:
+            node, queries = stack.pop()
+            hit = boxes_intersect(
+                q_lo[queries], q_hi[queries], self.node_lo[node], self.node_hi[node]
+            )
+            queries = queries[hit]
+            if len(queries) == 0:
+                continue
+
+            left, right = self.children[node]
+            if left < 0:
+                start, stop = self.leaves[node]
+                items = self.order[start:stop]
+                mask = boxes_intersect(
+                    q_lo[queries][:, None, :], q_hi[queries][:, None, :],
+                    lo[items][None, :, :], hi[items][None, :, :],
+                )
+                qi, ii = np.nonzero(mask)
+                out_q.append(queries[qi])
+                out_i.append(items[ii])
+            else:
+                stack.append((right, queries))
+                stack.append((left, queries))
+
+        if not out_q:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(out_q), np.concatenate(out_i)
+
+
+class BaseSegmentIndex(ABC):
+    """
+    Persistent broad-phase index over the segments of a schedule.
+
+    Drones are identified by drone_id. Each drone also gets an integer key
+    in insertion order; query results are keyed by it so callers can order
+    candidates the way the schedule was filed.
+
+    Subclasses provide the acceleration structure through
+    _build_structure() and _query_structure().
+    """
+
+    def __init__(
+        self,
+        safety_buffer: float,
+        rebuild_ratio: float = DEFAULT_REBUILD_RATIO,
+    ):
+        self.safety_buffer = float(safety_buffer)
+        self.rebuild_ratio = rebuild_ratio
+
+        self._next_key = 0
+        self._keys: Dict[str, int] = {}
+        self._ids: Dict[int, str] = {}
+        self._segments: Dict[int, np.ndarray] = {}
+
+        # Built structure (over a snapshot of drones) and its item arrays
+        self._built = False
+        self._built_segments = np.empty((0, SEGMENT_COLUMNS), dtype=float)
+        self._built_keys = np.empty(0, dtype=np.int64)
+        self._built_seg_idx = np.empty(0, dtype=np.int64)
+        self._built_lo = np.empty((0, 4), dtype=float)
+        self._built_hi = np.empty((0, 4), dtype=float)
+        self._built_alive = np.empty(0, dtype=bool)
+        self._built_ranges: Dict[int, Tuple[int, int]] = {}
+        self._num_dead = 0
+
+        # Drones inserted since the last build (scanned directly)
+        self._pending: List[int] = []
+
+    # ---------------- Construction ----------------
+
+    @classmethod
+    def from_schedule(cls, schedule: ScheduleLike, safety_buffer: float, **kwargs):
+        """
+        Index every drone of a schedule (kwargs go to the constructor).
+        When a drone id appears more than once, the last flight wins.
+        """
+        index = cls(safety_buffer, **kwargs)
+        packed, owner = pack_schedule_segments(schedule)
+        drone_ids = schedule_drone_ids(schedule)
+
+        bounds = np.searchsorted(owner, np.arange(len(drone_ids) + 1))
+        for i, drone_id in enumerate(drone_ids):
+            index.insert_segments(drone_id, packed[bounds[i]:bounds[i + 1]])
+        index.rebuild()
+        return index
+
+    def insert(self, drone: Drone) -> None:
+        """Add a drone, replacing any drone already filed under its id."""
+        self.insert_segments(drone.drone_id, drone.trajectory.packed)
+
+    def insert_segments(self, drone_id: str, segments: np.ndarray) -> None:
+        """Add a drone from its packed (n, 8) segments."""
+        if drone_id in self._keys:
+            self.remove(drone_id)
+        self._add(drone_id, np.asarray(segments, dtype=float).reshape(-1, SEGMENT_COLUMNS))
+
+    def remove(self, drone_id: str) -> bool:
+        """Remove a drone. Returns False if it was not indexed."""
+        key = self._keys.pop(drone_id, None)
+        if key is None:
+            return False
+        del self._ids[key]
+        del self._segments[key]
+
+        if key in self._built_ranges:
+            lo, hi = self._built_ranges.pop(key)
+            self._built_alive[lo:hi] = False
+            self._num_dead += hi - lo
+        else:
+            self._pending.remove(key)
+        return True
+
+    def _add(self, drone_id: str, segments: np.ndarray) -> None:
+        key = self._next_key
+        self._next_key += 1
+        self._keys[drone_id] = key
+        self._ids[key] = drone_id
+        self._segments[key] = segments
+        self._pending.append(key)
+
+    def rebuild(self) -> None:
+        """Rebuild the acceleration structure over every live drone."""
+        keys = sorted(self._segments)
+        counts = [len(self._segments[k]) for k in keys]
+        starts = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+
+        if keys:
+            self._built_segments = np.concatenate([self._segments[k] for k in keys])
+        else:
+            self._built_segments = np.empty((0, SEGMENT_COLUMNS), dtype=float)
+        self._built_keys = np.repeat(np.asarray(keys, dtype=np.int64), counts)
+        self._built_seg_idx = np.arange(len(self._built_keys), dtype=np.int64) - np.repeat(
+            starts[:-1], counts
+        )
+        self._built_ranges = {
+            k: (int(starts[i]), int(starts[i + 1])) for i, k in enumerate(keys)
+        }
+        self._built_lo, self._built_hi = segment_boxes(
+            self._built_segments, self.safety_buffer
+        )
+        self._built_alive = np.ones(len(self._built_keys), dtype=bool)
+        self._num_dead = 0
+        self._pending = []
+        self._build_structure()
+        self._built = True
+
+    def _maybe_rebuild(self) -> None:
+        stale = self._num_dead + sum(len(self._segments[k]) for k in self._pending)
+        if not self._built or stale > self.rebuild_ratio * max(len(self._built_keys), 1):
+            self.rebuild()
+
+    # ---------------- Queries ----------------
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, drone_id: str) -> bool:
+        return drone_id in self._keys
+
+    @property
+    def drone_ids(self) -> List[str]:
+        """Indexed drone ids in insertion order."""
+        return [self._ids[k] for k in sorted(self._ids)]
+
+    def drone_id(self, key: int) -> str:
+        return self._ids[int(key)]
+
+    def drone_key(self, drone_id: str) -> int:
+        return self._keys[drone_id]
+
+    def drone_segments(self, drone_id: str) -> np.ndarray:
+        return self._segments[self._keys[drone_id]]
+
+    def query(self, segments: np.ndarray, safety_buffer: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Candidate pairs between query segments (M, 8) and indexed segments.
+
+        Returns dict of arrays, one entry per candidate pair:
+            {
+                "index_a": (K,) row in `segments`,
+                "drone_key": (K,) insertion key of the indexed drone,
+                "segment_index": (K,) segment position within that drone,
+                "segments_b": (K, 8) the indexed segment,
+            }
+        """
+        if safety_buffer is not None and safety_buffer > self.safety_buffer:
+            raise ValueError(
+                f"Index was built for safety buffer {self.safety_buffer}, "
+                f"cannot answer queries for {safety_buffer}"
+            )
+        self._maybe_rebuild()
+
+        segments = np.asarray(segments, dtype=float).reshape(-1, SEGMENT_COLUMNS)
+        q_lo, q_hi = segment_boxes(segments)
+
+        qi, items = self._query_structure(segments, q_lo, q_hi)
+        alive = self._built_alive[items]
+        qi, items = qi[alive], items[alive]
+
+        index_a = [qi]
+        keys = [self._built_keys[items]]
+        seg_idx = [self._built_seg_idx[items]]
+        segs_b = [self._built_segments[items]]
+
+        # Pending drones: direct vectorized scan
+        for key in self._pending:
+            segs = self._segments[key]
+            p_lo, p_hi = segment_boxes(segs, self.safety_buffer)
+            pq, pi = np.nonzero(
+                boxes_intersect(q_lo[:, None, :], q_hi[:, None, :], p_lo[None], p_hi[None])
+            )
+            index_a.append(pq)
+            keys.append(np.full(len(pq), key, dtype=np.int64))
+            seg_idx.append(pi.astype(np.int64))
+            segs_b.append(segs[pi])
+
+        return {
+            "index_a": np.concatenate(index_a).astype(np.int64),
+            "drone_key": np.concatenate(keys),
+            "segment_index": np.concatenate(seg_idx),
+            "segments_b": np.concatenate(segs_b).reshape(-1, SEGMENT_COLUMNS),
+        }
+
+    # ---------------- Structure hooks ----------------
+
+    @abstractmethod
+    def _build_structure(self) -> None:
+        """Build the acceleration structure over the indexed boxes."""
+
+    @abstractmethod
+    def _query_structure(
+        self, segments: np.ndarray, q_lo: np.ndarray, q_hi: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(query row, built item) pairs whose boxes intersect."""
+
+
+class SegmentIndex(BaseSegmentIndex):
+    """
+    Persistent 4D interval BVH over schedule segments.
+    """
+
+    def __init__(
+        self,
+        safety_buffer: float,
+        leaf_size: int = DEFAULT_LEAF_SIZE,
+        rebuild_ratio: float = DEFAULT_REBUILD_RATIO,
+    ):
+        self.leaf_size = leaf_size
+        self._tree: Optional[_Hierarchy] = None
+        super().__init__(safety_buffer, rebuild_ratio=rebuild_ratio)
+
+    def _build_structure(self) -> None:
+        self._tree = _Hierarchy(self._built_lo, self._built_hi, self.leaf_size)
+
+    def _query_structure(self, segments, q_lo, q_hi):
+        return self._tree.query(q_lo, q_hi, self._built_lo, self._built_hi)
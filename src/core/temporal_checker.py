@@ -4,9 +4,160 @@ Temporal conflict detection utilities.
 This module handles:
 - Time interval overlap between segments
 - Position interpolation along a segment at a given time
+- Position interpolation of whole tracks (many drones, many times)
+
+The array functions serve the vectorized engines; the tuple-based scalar
+functions stay plain Python, since the pairwise engines call them once per
+segment pair. Segment arrays use the packed (N, 8) layout of
+batch_kernel: [x0, y0, z0, x1, y1, z1, t_start, t_end].
 """
 
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
+
+import numpy as np
+
+from src.data.columnar import ColumnarSchedule, ScheduleLike
+
+
+# ---------------- Array primitives ----------------
+
+def time_overlaps(
+    a_start: np.ndarray,
+    a_end: np.ndarray,
+    b_start: np.ndarray,
+    b_end: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """
+    Element-wise overlap of intervals [a_start, a_end] and [b_start, b_end]
+    (broadcastable arrays; reversed intervals are normalized).
+
+    Returns dict of arrays:
+        {
+            "valid": bool,   # overlap_start < overlap_end
+            "start": float,
+            "end": float,
+        }
+    """
+    a_start, a_end = np.asarray(a_start, dtype=float), np.asarray(a_end, dtype=float)
+    b_start, b_end = np.asarray(b_start, dtype=float), np.asarray(b_end, dtype=float)
+    return _overlaps(
+        np.minimum(a_start, a_end), np.maximum(a_start, a_end),
+        np.minimum(b_start, b_end), np.maximum(b_start, b_end),
+    )
+
+
+def segment_time_overlaps(seg_a: np.ndarray, seg_b: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    time_overlaps for packed segments; leading dimensions of seg_a and
+    seg_b broadcast against each other. Packed segments always have
+    t_start < t_end, so no normalization is done.
+    """
+    return _overlaps(seg_a[..., 6], seg_a[..., 7], seg_b[..., 6], seg_b[..., 7])
+
+
+def _overlaps(a_start, a_end, b_start, b_end) -> Dict[str, np.ndarray]:
+    start = np.maximum(a_start, b_start)
+    end = np.minimum(a_end, b_end)
+    return {"valid": start < end, "start": start, "end": end}
+
+
+def interpolate_segment_positions(segments: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """
+    Positions along packed segments at times t, clamped to each segment's
+    endpoints as in interpolate_segment_position.
+
+    segments is (K, 8); t is (K,) or (K, S) (S times per segment).
+    Returns t.shape + (3,).
+    """
+    segments = np.asarray(segments, dtype=float).reshape(-1, 8)
+    t = np.asarray(t, dtype=float)
+    extra = (1,) * (t.ndim - 1)
+
+    start = segments[:, 0:3].reshape((-1,) + extra + (3,))
+    end = segments[:, 3:6].reshape((-1,) + extra + (3,))
+    t_start = segments[:, 6].reshape((-1,) + extra)
+    t_end = segments[:, 7].reshape((-1,) + extra)
+
+    duration = t_end - t_start
+    alpha = np.zeros(np.broadcast(t, duration).shape)
+    np.divide(t - t_start, duration, out=alpha, where=duration > 0)
+    pos = start + alpha[..., None] * (end - start)
+
+    # Exact endpoints outside the segment (start for zero durations)
+    pos = np.where(((t <= t_start) | (duration <= 0))[..., None], start, pos)
+    return np.where(((t >= t_end) & (duration > 0))[..., None], end, pos)
+
+
+def interpolate_tracks(
+    times: np.ndarray,
+    offsets: np.ndarray,
+    waypoint_t: np.ndarray,
+    waypoint_xyz: np.ndarray,
+) -> np.ndarray:
+    """
+    Positions of D drones at Q query times.
+
+    Waypoints are stored flat as in ColumnarSchedule: drone i owns rows
+    offsets[i]:offsets[i+1] of waypoint_t (W,) and waypoint_xyz (W, 3),
+    with increasing times per drone. Each query is placed in its drone's
+    timestamps with one np.searchsorted over all drones (times are ranked
+    so that (drone, time) keys sort globally), then interpolated linearly.
+    Before the first / after the last waypoint a drone holds its first /
+    last position; drones without waypoints are NaN.
+
+    Returns (Q, D, 3).
+    """
+    times = np.asarray(times, dtype=float).reshape(-1)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    waypoint_t = np.asarray(waypoint_t, dtype=float)
+    waypoint_xyz = np.asarray(waypoint_xyz, dtype=float).reshape(-1, 3)
+    num_drones = len(offsets) - 1
+    out = np.full((len(times), num_drones, 3), np.nan)
+    if num_drones == 0 or len(times) == 0 or len(waypoint_t) == 0:
+        return out
+
+    # Integer ranks keep the combined (drone, time) key exact
+    grid = np.unique(np.concatenate((waypoint_t, times)))
+    span = len(grid)
+    owner = np.repeat(np.arange(num_drones, dtype=np.int64), np.diff(offsets))
+    keys = owner * span + np.searchsorted(grid, waypoint_t)
+    query_rank = np.searchsorted(grid, times)
+    query_keys = np.arange(num_drones, dtype=np.int64)[None, :] * span + query_rank[:, None]
+
+    # Index of the last waypoint at or before each query (within its drone)
+    last = np.searchsorted(keys, query_keys, side="right") - 1
+    lo, hi = offsets[:-1], offsets[1:] - 1
+    has_points = hi >= lo
+    last = np.clip(last, lo, np.maximum(hi, lo))
+    nxt = np.minimum(last + 1, np.maximum(hi, lo))
+
+    safe = np.minimum(last, len(waypoint_t) - 1), np.minimum(nxt, len(waypoint_t) - 1)
+    t0, t1 = waypoint_t[safe[0]], waypoint_t[safe[1]]
+    duration = t1 - t0
+    alpha = np.zeros_like(duration)
+    np.divide(times[:, None] - t0, duration, out=alpha, where=duration > 0)
+    alpha = np.clip(alpha, 0.0, 1.0)
+
+    p0, p1 = waypoint_xyz[safe[0]], waypoint_xyz[safe[1]]
+    out[:, has_points] = (p0 + alpha[..., None] * (p1 - p0))[:, has_points]
+    return out
+
+
+def interpolate_schedule(schedule: ScheduleLike, times: np.ndarray) -> np.ndarray:
+    """(Q, D, 3) positions of every drone of a schedule at `times`."""
+    if not isinstance(schedule, ColumnarSchedule):
+        schedule = ColumnarSchedule.from_schedule(schedule)
+    return interpolate_tracks(
+        times,
+        schedule.offsets,
+        schedule.t,
+        np.column_stack((schedule.x, schedule.y, schedule.z)),
+    )
+
+
+# ---------------- Scalar functions ----------------
+# Pure Python on purpose: the pairwise engines call these once per segment
+# pair, where building one-element arrays would cost more than the maths.
 
 
 def get_time_overlap(
@@ -0,0 +1,139 @@
+"""
+Compact binary on-disk format for flight schedules (.uavs).
+
+Layout (all integers and floats little-endian):
+
+    header   magic "UAVSCHD1", version u32, reserved u32,
+             num_drones u64, num_waypoints u64
+    table    (offset u64, nbytes u64) for each section below
+    sections each starting on a 64-byte boundary:
+        offsets       int64   (D + 1,)  drone i owns rows offsets[i]:offsets[i+1]
+        x, y, z, t    float64 (W,)
+        waypoint_ids  int64   (W,)
+        windows       float64 (D, 2)    mission time window, NaN for flights
+        string_index  int64   (3D + 1,) byte offsets into the string blob
+        strings       utf-8             ids, then names, then descriptions
+
+Reading maps the file with np.memmap; every numeric column is a zero-copy
+view of the mapping and only the D strings are decoded.
+"""
+
+import struct
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+
+from src.data.columnar import ColumnarSchedule
+
+MAGIC = b"UAVSCHD1"
+VERSION = 1
+BINARY_SUFFIX = ".uavs"
+
+SECTIONS = (
+    "offsets", "x", "y", "z", "t", "waypoint_ids", "windows", "string_index", "strings",
+)
+_HEADER = struct.Struct("<8sIIQQ")
+_TABLE_ENTRY = struct.Struct("<QQ")
+_ALIGN = 64
+
+
+def _aligned(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def write_binary_schedule(
+    schedule: ColumnarSchedule,
+    path: str | Path,
+    windows: Optional[np.ndarray] = None,
+) -> None:
+    """
+    Write a ColumnarSchedule. `windows` is an optional (D, 2) array of
+    mission time windows (NaN rows for plain flights).
+    """
+    num_drones = len(schedule)
+    if windows is None:
+        windows = np.full((num_drones, 2), np.nan)
+    windows = np.asarray(windows, dtype="<f8").reshape(num_drones, 2)
+
+    encoded = [
+        s.encode("utf-8")
+        for s in (*schedule.drone_ids, *schedule.names, *schedule.descriptions)
+    ]
+    string_index = np.zeros(len(encoded) + 1, dtype="<i8")
+    np.cumsum([len(b) for b in encoded], out=string_index[1:])
+
+    payloads = {
+        "offsets": np.asarray(schedule.offsets, dtype="<i8").tobytes(),
+        "x": np.asarray(schedule.x, dtype="<f8").tobytes(),
+        "y": np.asarray(schedule.y, dtype="<f8").tobytes(),
+        "z": np.asarray(schedule.z, dtype="<f8").tobytes(),
+        "t": np.asarray(schedule.t, dtype="<f8").tobytes(),
+        "waypoint_ids": np.asarray(schedule.waypoint_ids, dtype="<i8").tobytes(),
+        "windows": windows.tobytes(),
+        "string_index": string_index.tobytes(),
+        "strings": b"".join(encoded),
+    }
+
+    position = _aligned(_HEADER.size + _TABLE_ENTRY.size * len(SECTIONS))
+    table = []
+    for name in SECTIONS:
+        table.append((position, len(payloads[name])))
+        position = _aligned(position + len(payloads[name]))
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, num_drones, schedule.num_waypoints))
+        for entry in table:
+            f.write(_TABLE_ENTRY.pack(*entry))
+        for name, (offset, _) in zip(SECTIONS, table):
+            f.seek(offset)
+            f.write(payloads[name])
+        f.truncate(position)
+
+
+def read_binary_schedule(path: str | Path) -> Tuple[ColumnarSchedule, np.ndarray]:
+    """
+    Memory-map a .uavs file. Returns the schedule (numeric columns are
+    read-only views of the mapping) and its (D, 2) time windows.
+    """
+    mapped = np.memmap(path, dtype=np.uint8, mode="r")
+    if len(mapped) < _HEADER.size:
+        raise ValueError(f"{path}: file too short for a schedule header")
+
+    magic, version, _, num_drones, num_waypoints = _HEADER.unpack_from(mapped, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a binary schedule file")
+    if version != VERSION:
+        raise ValueError(f"{path}: unsupported schedule format version {version}")
+
+    sections = {}
+    for k, name in enumerate(SECTIONS):
+        offset, nbytes = _TABLE_ENTRY.unpack_from(mapped, _HEADER.size + k * _TABLE_ENTRY.size)
+        if offset + nbytes > len(mapped):
+            raise ValueError(f"{path}: section '{name}' runs past the end of the file")
+        sections[name] = (offset, nbytes)
+
+    def column(name: str, dtype: str, count: int) -> np.ndarray:
+        offset, nbytes = sections[name]
+        if nbytes != count * np.dtype(dtype).itemsize:
+            raise ValueError(f"{path}: section '{name}' has the wrong size")
+        return np.frombuffer(mapped, dtype=dtype, count=count, offset=offset)
+
+    string_index = column("string_index", "<i8", 3 * num_drones + 1)
+    blob_offset, _ = sections["strings"]
+    blob = mapped[blob_offset:blob_offset + int(string_index[-1])].tobytes()
+    bounds = string_index.tolist()
+    strings = [blob[a:b].decode("utf-8") for a, b in zip(bounds[:-1], bounds[1:])]
+
+    schedule = ColumnarSchedule(
+        drone_ids=strings[:num_drones],
+        offsets=column("offsets", "<i8", num_drones + 1),
+        x=column("x", "<f8", num_waypoints),
+        y=column("y", "<f8", num_waypoints),
+        z=column("z", "<f8", num_waypoints),
+        t=column("t", "<f8", num_waypoints),
+        waypoint_ids=column("waypoint_ids", "<i8", num_waypoints),
+        names=strings[num_drones:2 * num_drones],
+        descriptions=strings[2 * num_drones:],
+    )
+    return schedule, column("windows", "<f8", 2 * num_drones).reshape(num_drones, 2)
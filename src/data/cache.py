@@ -0,0 +1,222 @@
+"""
+Parsed-schedule cache.
+
+Loaded missions / schedules / scenarios are kept in a bounded in-process
+LRU keyed by (absolute path, kind). An entry is reused while the file's
+mtime and size are unchanged; when they change the content is hashed, so
+a touched-but-identical file is still not parsed again.
+
+With sidecars enabled, each ColumnarSchedule parse is also written next
+to the source file as ".<name>.<hash>.<kind>.uavs", and a new process
+with an unchanged file memory-maps that instead of parsing. Other values
+get no sidecar: the .uavs reader only accepts arrays and strings, so a
+sidecar planted in the data directory cannot run code.
+
+Files are parsed outside the cache-wide lock, under a lock per (file,
+kind): loads of different files run in parallel, and concurrent loads of
+one file wait for a single parse.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.data.binary_format import read_binary_schedule, write_binary_schedule
+from src.data.columnar import ColumnarSchedule
+from src.utils.config import get_config
+
+_HASH_CHUNK = 1 << 20
+_MISS = object()
+
+
+def file_digest(path: str | Path) -> str:
+    """BLAKE2b hex digest of a file's content."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@dataclass
+class _Entry:
+    mtime_ns: int
+    size: int
+    digest: str
+    value: Any
+
+
+class ScheduleCache:
+    """
+    Bounded LRU of parsed files. Cached values are shared between callers
+    and must not be modified; copy them first.
+    """
+
+    def __init__(self, max_entries: int = 16, sidecar: bool = False):
+        if max_entries < 1:
+            raise ValueError("Cache must hold at least one entry")
+        self.max_entries = max_entries
+        self.sidecar = sidecar
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self, path: str | Path, kind: str, loader: Callable[[str], Any]) -> Any:
+        """
+        Cached `loader(path)`. `kind` names what the loader produces, so
+        one file can be cached under several parses.
+        """
+        path = os.path.abspath(path)
+        key = (path, kind)
+        stat = os.stat(path)
+
+        with self._lock:
+            value = self._lookup(key, stat)
+            if value is not _MISS:
+                return value
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another thread may have parsed the file while we waited
+            with self._lock:
+                value = self._lookup(key, stat)
+            if value is not _MISS:
+                return value
+
+            digest = file_digest(path)
+            with self._lock:
+                value = self._lookup(key, stat, digest)
+            if value is not _MISS:
+                return value
+
+            value = self._read_sidecar(path, kind, digest) if self.sidecar else None
+            parsed = value is None
+            if parsed:
+                value = loader(path)
+                if self.sidecar:
+                    self._write_sidecar(path, kind, digest, value)
+
+            with self._lock:
+                if parsed:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                self._entries[key] = _Entry(stat.st_mtime_ns, stat.st_size, digest, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    evicted, _ = self._entries.popitem(last=False)
+                    self._key_locks.pop(evicted, None)
+            return value
+
+    def _lookup(self, key: Tuple[str, str], stat: os.stat_result, digest: Optional[str] = None) -> Any:
+        """
+        Cached value if the entry still matches the file's mtime and size
+        (or, given `digest`, its content), else _MISS. Needs self._lock.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISS
+        if (entry.mtime_ns, entry.size) != (stat.st_mtime_ns, stat.st_size):
+            if entry.digest != digest:
+                return _MISS
+            # Touched but unchanged
+            entry.mtime_ns, entry.size = stat.st_mtime_ns, stat.st_size
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def invalidate(self, path: Optional[str | Path] = None, sidecars: bool = False) -> None:
+        """
+        Drop cached parses of `path` (every file when None). With
+        sidecars=True the on-disk sidecars of those files are deleted too.
+        """
+        with self._lock:
+            if path is None:
+                targets = list(self._entries)
+            else:
+                path = os.path.abspath(path)
+                targets = [k for k in self._entries if k[0] == path]
+            for key in targets:
+                del self._entries[key]
+                self._key_locks.pop(key, None)
+            if sidecars:
+                for source in {k[0] for k in targets} | ({path} if path else set()):
+                    self._remove_sidecars(source)
+
+    def clear(self) -> None:
+        self.invalidate()
+        self.hits = self.misses = 0
+
+    # ---------------- Sidecars ----------------
+
+    @staticmethod
+    def _sidecar_prefix(path: str) -> str:
+        directory, name = os.path.split(path)
+        return os.path.join(directory, f".{name}.")
+
+    def _sidecar_path(self, path: str, kind: str, digest: str) -> str:
+        return f"{self._sidecar_prefix(path)}{digest}.{kind}.uavs"
+
+    def _read_sidecar(self, path: str, kind: str, digest: str) -> Optional[ColumnarSchedule]:
+        sidecar = self._sidecar_path(path, kind, digest)
+        if os.path.exists(sidecar):
+            return read_binary_schedule(sidecar)[0]
+        return None
+
+    def _write_sidecar(self, path: str, kind: str, digest: str, value: Any) -> None:
+        if not isinstance(value, ColumnarSchedule):
+            return
+        # Older sidecars of this file / kind describe stale content
+        self._remove_sidecars(path, kind)
+        target = self._sidecar_path(path, kind, digest)
+        tmp = f"{target}.{os.getpid()}.tmp"
+        try:
+            write_binary_schedule(value, tmp)
+            os.replace(tmp, target)
+        except OSError:
+            # A read-only data directory just means no sidecar
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def _remove_sidecars(self, path: str, kind: Optional[str] = None) -> None:
+        prefix = self._sidecar_prefix(path)
+        directory, stem = os.path.split(prefix)
+        try:
+            names = os.listdir(directory or ".")
+        except OSError:
+            return
+        for name in names:
+            if not name.startswith(stem):
+                continue
+            if kind is not None and f".{kind}." not in name[len(stem):]:
+                continue
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+
+
+_default_cache: Optional[ScheduleCache] = None
+_default_lock = threading.Lock()
+
+
+def get_schedule_cache() -> ScheduleCache:
+    """Process-wide cache, sized from Config."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            config = get_config()
+            _default_cache = ScheduleCache(
+                max_entries=config.SCHEDULE_CACHE_SIZE,
+                sidecar=config.SCHEDULE_CACHE_SIDECAR,
+            )
+        return _default_cache
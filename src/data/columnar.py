@@ -0,0 +1,278 @@
+"""
+Columnar (structure-of-arrays) flight schedule.
+
+Stores every waypoint of every drone in flat float64 arrays instead of one
+Waypoint dataclass per point:
+
+    x, y, z, t      : (W,) float64 waypoint coordinates and timestamps
+    waypoint_ids    : (W,) int64 waypoint ids
+    offsets         : (D + 1,) int64, drone i owns rows offsets[i]:offsets[i+1]
+    drone_ids       : interned drone id strings
+
+Converts losslessly to and from FlightSchedule / Drone / Waypoint.
+"""
+
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.data.models import Waypoint, Drone, FlightSchedule
+
+
+@dataclass
+class ColumnarSchedule:
+    """
+    Array-backed equivalent of FlightSchedule.
+    """
+    drone_ids: List[str]
+    offsets: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+    t: np.ndarray
+    waypoint_ids: np.ndarray
+    names: List[str] = field(default_factory=list)
+    descriptions: List[str] = field(default_factory=list)
+
+    _segments: Optional[Tuple[np.ndarray, np.ndarray]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _bounds: Optional[Tuple[np.ndarray, np.ndarray]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self.drone_ids = [sys.intern(str(d)) for d in self.drone_ids]
+        self.offsets = np.asarray(self.offsets, dtype=np.int64)
+        self.x = np.asarray(self.x, dtype=np.float64)
+        self.y = np.asarray(self.y, dtype=np.float64)
+        self.z = np.asarray(self.z, dtype=np.float64)
+        self.t = np.asarray(self.t, dtype=np.float64)
+        self.waypoint_ids = np.asarray(self.waypoint_ids, dtype=np.int64)
+
+        num_drones = len(self.drone_ids)
+        if not self.names:
+            self.names = [""] * num_drones
+        if not self.descriptions:
+            self.descriptions = [""] * num_drones
+
+        if len(self.offsets) != num_drones + 1:
+            raise ValueError("offsets must have one entry per drone plus one")
+        if len(self.names) != num_drones or len(self.descriptions) != num_drones:
+            raise ValueError("names/descriptions must have one entry per drone")
+        num_waypoints = int(self.offsets[-1]) if num_drones else 0
+        for column in (self.x, self.y, self.z, self.t, self.waypoint_ids):
+            if len(column) != num_waypoints:
+                raise ValueError("waypoint columns must match offsets[-1]")
+
+    # ---------------- Conversion ----------------
+
+    @classmethod
+    def from_drones(cls, drones: Sequence[Drone]) -> "ColumnarSchedule":
+        counts = [len(d.waypoints) for d in drones]
+        offsets = np.zeros(len(drones) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        wps = [wp for d in drones for wp in d.waypoints]
+        return cls(
+            drone_ids=[d.drone_id for d in drones],
+            offsets=offsets,
+            x=np.fromiter((wp.x for wp in wps), dtype=np.float64, count=len(wps)),
+            y=np.fromiter((wp.y for wp in wps), dtype=np.float64, count=len(wps)),
+            z=np.fromiter((wp.z for wp in wps), dtype=np.float64, count=len(wps)),
+            t=np.fromiter((wp.t for wp in wps), dtype=np.float64, count=len(wps)),
+            waypoint_ids=np.fromiter((wp.id for wp in wps), dtype=np.int64, count=len(wps)),
+            names=[d.name for d in drones],
+            descriptions=[d.description for d in drones],
+        )
+
+    @classmethod
+    def from_drone_stream(cls, drones: Iterable[Drone]) -> "ColumnarSchedule":
+        """
+        Build from an iterable of drones (e.g. loader.iter_flights) without
+        holding them all: each drone is appended to compact typed buffers
+        and dropped, so peak memory is the arrays themselves.
+        """
+        columns = {name: array("d") for name in ("x", "y", "z", "t")}
+        waypoint_ids = array("q")
+        offsets = array("q", [0])
+        drone_ids: List[str] = []
+        names: List[str] = []
+        descriptions: List[str] = []
+
+        for d in drones:
+            for wp in d.waypoints:
+                columns["x"].append(wp.x)
+                columns["y"].append(wp.y)
+                columns["z"].append(wp.z)
+                columns["t"].append(wp.t)
+                waypoint_ids.append(wp.id)
+            offsets.append(len(waypoint_ids))
+            drone_ids.append(d.drone_id)
+            names.append(d.name)
+            descriptions.append(d.description)
+
+        return cls(
+            drone_ids=drone_ids,
+            offsets=np.frombuffer(offsets, dtype=np.int64),
+            waypoint_ids=np.frombuffer(waypoint_ids, dtype=np.int64),
+            names=names,
+            descriptions=descriptions,
+            **{name: np.frombuffer(col, dtype=np.float64) for name, col in columns.items()},
+        )
+
+    @classmethod
+    def from_schedule(cls, schedule: FlightSchedule) -> "ColumnarSchedule":
+        return cls.from_drones(schedule.drones)
+
+    @classmethod
+    def concat(cls, parts: Sequence["ColumnarSchedule"]) -> "ColumnarSchedule":
+        """
+        Drones of every part, in order. Packed segments that every part
+        has already built are joined instead of being rebuilt.
+        """
+        row_starts = np.cumsum([0] + [p.num_waypoints for p in parts[:-1]])
+        joined = cls(
+            drone_ids=[d for p in parts for d in p.drone_ids],
+            offsets=np.concatenate([[0]] + [p.offsets[1:] + s for p, s in zip(parts, row_starts)]),
+            names=[n for p in parts for n in p.names],
+            descriptions=[d for p in parts for d in p.descriptions],
+            **{
+                name: np.concatenate([getattr(p, name) for p in parts])
+                for name in ("x", "y", "z", "t", "waypoint_ids")
+            },
+        )
+        if all(p._segments is not None for p in parts):
+            drone_starts = np.cumsum([0] + [len(p) for p in parts[:-1]])
+            joined._segments = (
+                np.concatenate([p._segments[0] for p in parts]),
+                np.concatenate([p._segments[1] + s for p, s in zip(parts, drone_starts)]),
+            )
+        return joined
+
+    def drone(self, index: int) -> Drone:
+        """Materialize drone `index` as a Drone dataclass."""
+        lo, hi = int(self.offsets[index]), int(self.offsets[index + 1])
+        waypoints = [
+            Waypoint(id=int(i), x=float(x), y=float(y), z=float(z), t=float(t))
+            for i, x, y, z, t in zip(
+                self.waypoint_ids[lo:hi],
+                self.x[lo:hi],
+                self.y[lo:hi],
+                self.z[lo:hi],
+                self.t[lo:hi],
+            )
+        ]
+        return Drone(
+            drone_id=self.drone_ids[index],
+            name=self.names[index],
+            description=self.descriptions[index],
+            waypoints=waypoints,
+        )
+
+    @property
+    def drones(self) -> List[Drone]:
+        """
+        Materialized Drone list, so code written against FlightSchedule
+        (plotters, pairwise engines) accepts a ColumnarSchedule directly.
+        """
+        return [self.drone(i) for i in range(len(self.drone_ids))]
+
+    def to_schedule(self) -> FlightSchedule:
+        return FlightSchedule(drones=self.drones)
+
+    # ---------------- Array views ----------------
+
+    def __len__(self) -> int:
+        return len(self.drone_ids)
+
+    @property
+    def num_waypoints(self) -> int:
+        return len(self.t)
+
+    def positions(self, index: int) -> np.ndarray:
+        """(n, 3) waypoint positions of drone `index`."""
+        lo, hi = int(self.offsets[index]), int(self.offsets[index + 1])
+        return np.column_stack((self.x[lo:hi], self.y[lo:hi], self.z[lo:hi]))
+
+    def times(self, index: int) -> np.ndarray:
+        """(n,) waypoint timestamps of drone `index` (a view, not a copy)."""
+        return self.t[int(self.offsets[index]):int(self.offsets[index + 1])]
+
+    def slice_drones(self, start: int, stop: int) -> "ColumnarSchedule":
+        """
+        Drones start..stop-1 as a schedule whose columns are views of this
+        one, so a memory-mapped schedule can be processed chunk by chunk.
+        Packed segments already built here are sliced along.
+        """
+        lo, hi = int(self.offsets[start]), int(self.offsets[stop])
+        sliced = ColumnarSchedule(
+            drone_ids=self.drone_ids[start:stop],
+            offsets=self.offsets[start:stop + 1] - lo,
+            x=self.x[lo:hi],
+            y=self.y[lo:hi],
+            z=self.z[lo:hi],
+            t=self.t[lo:hi],
+            waypoint_ids=self.waypoint_ids[lo:hi],
+            names=self.names[start:stop],
+            descriptions=self.descriptions[start:stop],
+        )
+        if self._segments is not None:
+            packed, owner = self._segments
+            # owner is sorted, so the drones' segments are one run of rows
+            first, last = np.searchsorted(owner, (start, stop))
+            sliced._segments = (packed[first:last], owner[first:last] - start)
+        return sliced
+
+    def owner_of_waypoints(self) -> np.ndarray:
+        """(W,) index of the drone owning each waypoint row."""
+        return np.repeat(np.arange(len(self.drone_ids), dtype=np.int64), np.diff(self.offsets))
+
+    def segment_array(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Packed (N, 8) segments and (N,) owner indices, equivalent to
+        batch_kernel.pack_drone_segments(self.drones) but built without
+        materializing any Drone. Segments with non-increasing time are
+        dropped, as in Drone.to_segments().
+        """
+        if self._segments is None:
+            owner = self.owner_of_waypoints()
+            keep = (owner[1:] == owner[:-1]) & (self.t[1:] > self.t[:-1])
+            start = np.nonzero(keep)[0]
+            end = start + 1
+
+            packed = np.column_stack((
+                self.x[start], self.y[start], self.z[start],
+                self.x[end], self.y[end], self.z[end],
+                self.t[start], self.t[end],
+            )) if len(start) else np.empty((0, 8), dtype=np.float64)
+
+            self._segments = (packed, owner[start])
+        return self._segments
+
+    def drone_bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (D, 4) lows and highs of each drone's [x, y, z, t] over its
+        segments, as in Drone.trajectory (+inf / -inf for drones without
+        segments).
+        """
+        if self._bounds is None:
+            packed, owner = self.segment_array()
+            num_drones = len(self.drone_ids)
+            lo = np.full((num_drones, 4), np.inf)
+            hi = np.full((num_drones, 4), -np.inf)
+            if len(owner):
+                seg_lo = np.column_stack((np.minimum(packed[:, 0:3], packed[:, 3:6]), packed[:, 6]))
+                seg_hi = np.column_stack((np.maximum(packed[:, 0:3], packed[:, 3:6]), packed[:, 7]))
+                # owner is sorted: reduce each drone's run of rows
+                drones, first = np.unique(owner, return_index=True)
+                lo[drones] = np.minimum.reduceat(seg_lo, first, axis=0)
+                hi[drones] = np.maximum.reduceat(seg_hi, first, axis=0)
+            self._bounds = (lo, hi)
+        return self._bounds
+
+
+ScheduleLike = Union[FlightSchedule, ColumnarSchedule]
@@ -1,6 +1,8 @@
 import json
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
 
 from .models import (
     Waypoint,
@@ -9,95 +11,294 @@ from .models import (
     FlightSchedule,
     TestScenario
 )
+from .cache import get_schedule_cache
+from .binary_format import BINARY_SUFFIX, read_binary_schedule, write_binary_schedule
+from .columnar import ColumnarSchedule
+from .validation import ScheduleValidationError, ValidationIssue, validate_flight_records
+
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+STREAM_CHUNK_SIZE = 1 << 20  # characters read per step when streaming
+
+
+# ---------------- Streaming ----------------
+
+class _JSONStream:
+    """
+    Incremental reader over a JSON text file: values are decoded one at a
+    time from a buffer that only ever holds the unconsumed tail of the file.
+    """
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, f, chunk_size: int):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, min_size: int) -> bool:
+        """Read until at least `min_size` unconsumed characters (or EOF)."""
+        if self._pos:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        while len(self._buf) < min_size and not self._eof:
+            chunk = self._f.read(max(self._chunk_size, min_size - len(self._buf)))
+            if not chunk:
+                self._eof = True
+            self._buf += chunk
+        return len(self._buf) >= min_size
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at end of input)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill(1):
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Malformed JSON: expected '{char}', found '{found or 'EOF'}'")
+        self._pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        want = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                # Value straddles the buffer end: read more (doubling)
+                self._fill(len(self._buf) - self._pos + want)
+                want *= 2
+                continue
+            # A number at the buffer end may continue in the next chunk
+            if end == len(self._buf) and not self._eof:
+                self._fill(len(self._buf) - self._pos + want)
+                continue
+            self._pos = end
+            return value
+
+
+def iter_json_array(
+    path: str | Path, key: str, chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[dict]:
+    """
+    Yield the elements of the top-level array `key` of a JSON document one
+    at a time, never holding the whole file or parse tree in memory.
+    Other top-level values are decoded and skipped.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        stream = _JSONStream(f, chunk_size)
+        stream.expect("{")
+        if stream.peek() == "}":
+            return
+        while True:
+            name = stream.value()
+            stream.expect(":")
+            if name == key:
+                stream.expect("[")
+                if stream.peek() != "]":
+                    while True:
+                        yield stream.value()
+                        if stream.peek() != ",":
+                            break
+                        stream.expect(",")
+                stream.expect("]")
+            else:
+                stream.value()
+            if stream.peek() != ",":
+                break
+            stream.expect(",")
+        stream.expect("}")
+
+
+def iter_ndjson(path: str | Path) -> Iterator[dict]:
+    """Yield one object per non-blank line of a newline-delimited JSON file."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_no}: invalid JSON line ({e.msg})") from None
 
-# ---------------- Validation ----------------
 
-def validate_waypoint(wp: dict):
-    required = ["id", "x", "y", "timestamp"]
-    for key in required:
-        if key not in wp:
-            raise ValueError(f"Waypoint missing required field: '{key}'")
+def _iter_records(path: str | Path, key: str, ndjson: Optional[bool]) -> Iterator[dict]:
+    if ndjson is None:
+        ndjson = Path(path).suffix.lower() in NDJSON_SUFFIXES
+    return iter_ndjson(path) if ndjson else iter_json_array(path, key)
 
-    # numerical checks
-    float(wp["x"])
-    float(wp["y"])
-    float(wp["timestamp"])
-    if "z" in wp:
-        float(wp["z"])
 
+# ---------------- Waypoints ----------------
 
 def load_waypoints(raw_wps: List[dict]) -> List[Waypoint]:
     waypoints = []
     for wp in raw_wps:
-        validate_waypoint(wp)
-        waypoints.append(
-            Waypoint(
-                id=int(wp["id"]),
-                x=float(wp["x"]),
-                y=float(wp["y"]),
-                z=float(wp.get("z", 0.0)),
-                t=float(wp["timestamp"])
+        # Convert once: a missing key is reported by name, and a
+        # non-numeric value raises ValueError from int() / float()
+        try:
+            waypoints.append(
+                Waypoint(
+                    id=int(wp["id"]),
+                    x=float(wp["x"]),
+                    y=float(wp["y"]),
+                    z=float(wp.get("z", 0.0)),
+                    t=float(wp["timestamp"])
+                )
             )
-        )
+        except KeyError as e:
+            raise ValueError(f"Waypoint missing required field: '{e.args[0]}'") from None
     return waypoints
 
 
 # ---------------- Mission Loader ----------------
 
+def parse_mission(m: dict) -> Mission:
+    """Build a Mission from one entry of a missions JSON document."""
+    mission_id = m["id"]
+    name = m["name"]
+    desc = m["description"]
+    tw = m["time_window"]
+
+    wp = load_waypoints(m["waypoints"])
+
+    drone = Drone(
+        drone_id=mission_id,
+        name=name,
+        description=desc,
+        waypoints=wp
+    )
+
+    return Mission(
+        mission_id=mission_id,
+        name=name,
+        description=desc,
+        time_window=(tw["start_time"], tw["end_time"]),
+        drone=drone
+    )
+
+
+def iter_missions(path: str | Path, ndjson: Optional[bool] = None) -> Iterator[Mission]:
+    """
+    Stream missions from a missions JSON file, or from NDJSON with one
+    mission per line (auto-detected from a .ndjson / .jsonl suffix).
+    """
+    for m in _iter_records(path, "missions", ndjson):
+        yield parse_mission(m)
+
+
 def load_missions(path: str | Path) -> List[Mission]:
-    data = json.loads(Path(path).read_text())
+    return list(iter_missions(path))
+
+
+# ---------------- Other Flights Loader ----------------
+
+def parse_flight(f: dict) -> Drone:
+    """Build a Drone from one entry of a flights JSON document."""
+    return Drone(
+        drone_id=f["id"],
+        name=f["name"],
+        description=f["description"],
+        waypoints=load_waypoints(f["waypoints"])
+    )
 
-    missions = []
-    for m in data["missions"]:
-        mission_id = m["id"]
-        name = m["name"]
-        desc = m["description"]
-        tw = m["time_window"]
-
-        wp = load_waypoints(m["waypoints"])
-
-        drone = Drone(
-            drone_id=mission_id,
-            name=name,
-            description=desc,
-            waypoints=wp
-        )
 
+def iter_flights(path: str | Path, ndjson: Optional[bool] = None) -> Iterator[Drone]:
+    """
+    Stream flights from a flights JSON file, or from NDJSON with one
+    flight per line (auto-detected from a .ndjson / .jsonl suffix).
+    Only one flight's parse tree is alive at a time.
+    """
+    for f in _iter_records(path, "flights", ndjson):
+        yield parse_flight(f)
+
+
+def load_simulated_flights(path: str | Path) -> FlightSchedule:
+    return FlightSchedule(drones=list(iter_flights(path)))
+
+
+def load_simulated_flights_columnar(
+    path: str | Path, ndjson: Optional[bool] = None
+) -> ColumnarSchedule:
+    """
+    Stream flights straight into a ColumnarSchedule: no Drone list is
+    kept, so peak memory is close to the size of the packed arrays.
+    A .uavs file is memory-mapped instead of parsed.
+    """
+    if Path(path).suffix.lower() == BINARY_SUFFIX:
+        return load_binary_schedule(path)
+    return ColumnarSchedule.from_drone_stream(iter_flights(path, ndjson=ndjson))
+
+
+def load_validated_flights(
+    path: str | Path, ndjson: Optional[bool] = None, strict: bool = True
+) -> Tuple[ColumnarSchedule, List[ValidationIssue]]:
+    """
+    Bulk-validated ingest: records are streamed, checked in batches
+    (fields, numeric types, NaN/inf, strictly increasing timestamps) and
+    packed into a ColumnarSchedule without building Waypoints.
+
+    With strict=True any issue raises ScheduleValidationError listing
+    them all; otherwise invalid flights are left out and the issues are
+    returned alongside the schedule.
+    """
+    schedule, issues = validate_flight_records(_iter_records(path, "flights", ndjson))
+    if strict and issues:
+        raise ScheduleValidationError(issues)
+    return schedule, issues
+
+
+# ---------------- Binary Schedules ----------------
+
+def load_binary_schedule(path: str | Path) -> ColumnarSchedule:
+    """Memory-map a .uavs schedule; the waypoint columns are not copied."""
+    schedule, _ = read_binary_schedule(path)
+    return schedule
+
+
+def load_binary_missions(path: str | Path) -> List[Mission]:
+    """Missions from a .uavs file written by convert_missions_to_binary."""
+    schedule, windows = read_binary_schedule(path)
+    missions = []
+    for i, (start, end) in enumerate(windows.tolist()):
+        drone = schedule.drone(i)
         missions.append(
             Mission(
-                mission_id=mission_id,
-                name=name,
-                description=desc,
-                time_window=(tw["start_time"], tw["end_time"]),
+                mission_id=drone.drone_id,
+                name=drone.name,
+                description=drone.description,
+                time_window=(start, end),
                 drone=drone
             )
         )
-
     return missions
 
 
-# ---------------- Other Flights Loader ----------------
+def convert_flights_to_binary(json_path: str | Path, out_path: str | Path) -> ColumnarSchedule:
+    """Convert a flights JSON / NDJSON file to the binary schedule format."""
+    schedule = load_simulated_flights_columnar(json_path)
+    write_binary_schedule(schedule, out_path)
+    return schedule
 
-def load_simulated_flights(path: str | Path) -> FlightSchedule:
-    data = json.loads(Path(path).read_text())
 
-    drones = []
-    for f in data["flights"]:
-        drone_id = f["id"]
-        name = f["name"]
-        desc = f["description"]
-        wp = load_waypoints(f["waypoints"])
-
-        drones.append(
-            Drone(
-                drone_id=drone_id,
-                name=name,
-                description=desc,
-                waypoints=wp
-            )
-        )
-
-    return FlightSchedule(drones=drones)
+def convert_missions_to_binary(json_path: str | Path, out_path: str | Path) -> List[Mission]:
+    """Convert a missions JSON / NDJSON file; time windows are kept."""
+    missions = list(iter_missions(json_path))
+    write_binary_schedule(
+        ColumnarSchedule.from_drones([m.drone for m in missions]),
+        out_path,
+        windows=np.array([m.time_window for m in missions], dtype=float).reshape(-1, 2),
+    )
+    return missions
 
 
 # ---------------- Scenario Loader ----------------
@@ -120,3 +321,19 @@ def load_test_scenarios(path: str | Path) -> List[TestScenario]:
         )
 
     return scenarios
+
+
+# ---------------- Cached Loading ----------------
+# Parsed results are shared through the schedule cache: unchanged files
+# are never parsed twice. Copy a result before modifying it.
+
+def load_missions_cached(path: str | Path) -> List[Mission]:
+    return get_schedule_cache().load(path, "missions", load_missions)
+
+
+def load_flights_cached(path: str | Path) -> ColumnarSchedule:
+    return get_schedule_cache().load(path, "columnar", load_simulated_flights_columnar)
+
+
+def load_test_scenarios_cached(path: str | Path) -> List[TestScenario]:
+    return get_schedule_cache().load(path, "scenarios", load_test_scenarios)
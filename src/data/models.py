@@ -1,6 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import List, Tuple, Optional
 
+from src.data.trajectory import Trajectory
+
 
 @dataclass
 class Waypoint:
@@ -11,6 +14,10 @@ class Waypoint:
     t: float  # timestamp
 
 
+# What a trajectory is built from; compared to detect stale caches
+_coordinates = attrgetter("x", "y", "z", "t")
+
+
 @dataclass
 class Drone:
     """
@@ -21,6 +28,32 @@ class Drone:
     description: str
     waypoints: List[Waypoint]
 
+    # (waypoint coordinates, trajectory built from them)
+    _trajectory_cache: Optional[Tuple[Tuple, Trajectory]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def trajectory(self) -> Trajectory:
+        """
+        Compiled segments and bounding boxes, built on first use. Rebuilt
+        whenever the waypoint coordinates differ from the ones it was built
+        from, including in-place edits of a waypoint.
+        """
+        fingerprint = tuple(map(_coordinates, self.waypoints))
+        cache = self._trajectory_cache
+        if cache is not None and cache[0] == fingerprint:
+            return cache[1]
+        trajectory = Trajectory.from_waypoints(self.waypoints)
+        self._trajectory_cache = (fingerprint, trajectory)
+        return trajectory
+
+    def __getstate__(self):
+        # Copies and pickles start without the cache and rebuild on use
+        state = self.__dict__.copy()
+        state["_trajectory_cache"] = None
+        return state
+
     def to_segments(self) -> List[Tuple[Tuple[float, float, float],
                                        Tuple[float, float, float],
                                        float, float]]:
@@ -29,20 +62,7 @@ class Drone:
         Returns list of:
         (start_xyz, end_xyz, start_time, end_time)
         """
-        segments = []
-        if len(self.waypoints) < 2:
-            return segments
-
-        for wp1, wp2 in zip(self.waypoints[:-1], self.waypoints[1:]):
-            if wp2.t <= wp1.t:
-                # Invalid segment (non-increasing time)
-                continue
-
-            start = (wp1.x, wp1.y, wp1.z)
-            end = (wp2.x, wp2.y, wp2.z)
-            segments.append((start, end, wp1.t, wp2.t))
-
-        return segments
+        return list(self.trajectory.segments)
 
 
 @dataclass
@@ -0,0 +1,95 @@
+"""
+Compiled drone trajectories.
+
+A Trajectory is everything derived from a drone's waypoints that the
+conflict checks need: the segment tuples of Drone.to_segments(), the
+same segments packed as an (N, 8) array, per-segment and whole-flight
+4D bounding boxes ([x, y, z, t] lows and highs), the time extent and
+the top speed. Drone.trajectory builds it lazily and rebuilds it whenever
+the waypoint coordinates change.
+
+may_conflict compares two whole-flight boxes, so most drones of a
+schedule can be ruled out before any segment is looked at.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+Segment = Tuple[Tuple[float, float, float], Tuple[float, float, float], float, float]
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    # Shared by every caller of the drone: guard against in-place edits
+    array.flags.writeable = False
+    return array
+
+
+@dataclass
+class Trajectory:
+    segments: List[Segment]
+    packed: np.ndarray        # (N, 8) [x0, y0, z0, x1, y1, z1, t_start, t_end]
+    segment_lo: np.ndarray    # (N, 4) per-segment [x, y, z, t] minimum
+    segment_hi: np.ndarray    # (N, 4) per-segment [x, y, z, t] maximum
+    lo: np.ndarray            # (4,) whole-flight minimum, +inf without segments
+    hi: np.ndarray            # (4,) whole-flight maximum, -inf without segments
+    max_speed: float
+
+    @classmethod
+    def from_waypoints(cls, waypoints: Sequence) -> "Trajectory":
+        """Segments with non-increasing time are dropped, as in Drone.to_segments()."""
+        segments: List[Segment] = []
+        for wp1, wp2 in zip(waypoints[:-1], waypoints[1:]):
+            if wp2.t <= wp1.t:
+                # Invalid segment (non-increasing time)
+                continue
+            segments.append(((wp1.x, wp1.y, wp1.z), (wp2.x, wp2.y, wp2.z), wp1.t, wp2.t))
+
+        packed = np.array(
+            [(*start, *end, t0, t1) for start, end, t0, t1 in segments], dtype=float
+        ).reshape(-1, 8)
+        segment_lo = np.column_stack((np.minimum(packed[:, 0:3], packed[:, 3:6]), packed[:, 6]))
+        segment_hi = np.column_stack((np.maximum(packed[:, 0:3], packed[:, 3:6]), packed[:, 7]))
+
+        if len(segments):
+            lo, hi = segment_lo.min(axis=0), segment_hi.max(axis=0)
+            speed = np.linalg.norm(packed[:, 3:6] - packed[:, 0:3], axis=1) / (packed[:, 7] - packed[:, 6])
+            max_speed = float(speed.max())
+        else:
+            lo, hi = np.full(4, np.inf), np.full(4, -np.inf)
+            max_speed = 0.0
+
+        return cls(
+            segments=segments,
+            packed=_frozen(packed),
+            segment_lo=_frozen(segment_lo),
+            segment_hi=_frozen(segment_hi),
+            lo=_frozen(lo),
+            hi=_frozen(hi),
+            max_speed=max_speed,
+        )
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    @property
+    def time_span(self) -> Optional[Tuple[float, float]]:
+        """(t_start, t_end) of the flight, None without segments."""
+        if not self.segments:
+            return None
+        return (float(self.lo[3]), float(self.hi[3]))
+
+    def gap_to(self, other: "Trajectory") -> float:
+        """
+        Lower bound on the separation of two flights: the distance between
+        their spatial boxes, or inf when they are never airborne together.
+        """
+        if not (self.lo[3] < other.hi[3] and other.lo[3] < self.hi[3]):
+            return float("inf")
+        gap = np.maximum(0.0, np.maximum(other.lo[:3] - self.hi[:3], self.lo[:3] - other.hi[:3]))
+        return float(np.sqrt(gap @ gap))
+
+    def may_conflict(self, other: "Trajectory", safety_buffer: float) -> bool:
+        """False when no segment pair of the two flights can breach the buffer."""
+        return self.gap_to(other) < safety_buffer
@@ -0,0 +1,260 @@
+"""
+Bulk validation of raw flight records.
+
+validate_flight_records checks many flights at once and builds the
+ColumnarSchedule arrays directly, without a Waypoint per point. Each
+field is gathered into one list per batch of flights and converted with
+a single NumPy call; records are only inspected one by one when that
+conversion shows something is wrong. Checks:
+
+    - flight has "id" and a "waypoints" list
+    - waypoint has "id", "x", "y", "timestamp" ("z" defaults to 0.0)
+    - values are numbers (not strings, booleans or null) and finite
+    - timestamps strictly increase within a flight (Drone.to_segments
+      would otherwise drop the segment silently)
+
+Every problem is reported as a ValidationIssue with its flight and
+waypoint index.
+"""
+
+import numbers
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.data.columnar import ColumnarSchedule
+
+REQUIRED_WAYPOINT_FIELDS = ("id", "x", "y", "timestamp")
+VALIDATION_BATCH_SIZE = 4096  # flights converted per NumPy call
+
+_MISSING = object()
+_PLAIN_NUMBERS = {int, float}
+
+
+@dataclass
+class ValidationIssue:
+    flight_index: int
+    flight_id: Optional[str]
+    waypoint_index: Optional[int]
+    field: Optional[str]
+    message: str
+
+    def __str__(self) -> str:
+        where = f"flight {self.flight_index}"
+        if self.flight_id is not None:
+            where += f" ('{self.flight_id}')"
+        if self.waypoint_index is not None:
+            where += f", waypoint {self.waypoint_index}"
+        if self.field is not None:
+            where += f", field '{self.field}'"
+        return f"{where}: {self.message}"
+
+
+class ScheduleValidationError(ValueError):
+    """Raised with every ValidationIssue found in the input."""
+
+    MAX_LISTED = 20
+
+    def __init__(self, issues: List[ValidationIssue]):
+        self.issues = issues
+        lines = [str(i) for i in issues[:self.MAX_LISTED]]
+        if len(issues) > self.MAX_LISTED:
+            lines.append(f"... and {len(issues) - self.MAX_LISTED} more")
+        super().__init__(f"{len(issues)} validation issue(s):\n" + "\n".join(lines))
+
+
+def _describe_bad_value(value) -> str:
+    if value is _MISSING:
+        return "missing required field"
+    if value is None:
+        return "value is null"
+    if isinstance(value, bool) or not isinstance(value, numbers.Real):
+        return f"expected a number, got {type(value).__name__}"
+    return f"value is not finite ({value})"
+
+
+def _numeric_column(
+    values: List,
+    field: str,
+    owner: np.ndarray,
+    local: np.ndarray,
+    refs: List[Tuple[int, Optional[str]]],
+    issues: List[ValidationIssue],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert one field of every waypoint in a batch. Returns the float64
+    column and a mask of rows that failed.
+    """
+    arr = None
+    # Fast path only for plain numbers: NumPy would coerce booleans to
+    # 0/1 and fail on nested lists
+    if set(map(type, values)) <= _PLAIN_NUMBERS:
+        try:
+            arr = np.asarray(values) if values else np.empty(0)
+        except (ValueError, TypeError):
+            arr = None
+    if arr is not None and arr.dtype.kind in "iuf" and arr.ndim == 1:
+        column = arr.astype(np.float64)
+        bad = ~np.isfinite(column)
+    else:
+        # Slow path: something is missing or not a number
+        bad = np.fromiter(
+            (
+                v is _MISSING or v is None or isinstance(v, bool)
+                or not isinstance(v, numbers.Real)
+                for v in values
+            ),
+            dtype=bool,
+            count=len(values),
+        )
+        column = np.full(len(values), np.nan)
+        good = np.nonzero(~bad)[0]
+        column[good] = np.asarray([values[k] for k in good.tolist()], dtype=np.float64)
+        bad |= ~np.isfinite(column)
+
+    for k in np.nonzero(bad)[0].tolist():
+        flight_index, flight_id = refs[owner[k]]
+        issues.append(ValidationIssue(
+            flight_index, flight_id, int(local[k]), field, _describe_bad_value(values[k])
+        ))
+    return column, bad
+
+
+def _validate_batch(
+    records: List,
+    first_index: int,
+    issues: List[ValidationIssue],
+) -> Tuple[Dict[str, np.ndarray], np.ndarray, List[int]]:
+    """
+    Validate a batch of flight records. Returns the columns of every
+    waypoint in the batch, the per-flight waypoint counts, and the
+    positions (within the batch) of the flights without issues.
+    """
+    first_issue = len(issues)
+    refs: List[Tuple[int, Optional[str]]] = []
+    waypoint_lists: List[List] = []
+    flight_ok = np.ones(len(records), dtype=bool)
+
+    for i, rec in enumerate(records):
+        index = first_index + i
+        flight_id = rec.get("id") if isinstance(rec, dict) else None
+        refs.append((index, None if flight_id is None else str(flight_id)))
+        wps = rec.get("waypoints", _MISSING) if isinstance(rec, dict) else _MISSING
+
+        problem = None
+        if not isinstance(rec, dict):
+            problem = "flight record is not an object"
+        elif flight_id is None:
+            problem = "flight is missing 'id'"
+        elif not isinstance(wps, list):
+            problem = "flight has no 'waypoints' list"
+        elif not all(isinstance(wp, dict) for wp in wps):
+            problem = "every waypoint must be an object"
+        if problem is not None:
+            issues.append(ValidationIssue(index, refs[-1][1], None, None, problem))
+            flight_ok[i] = False
+            wps = []
+        waypoint_lists.append(wps)
+
+    counts = np.fromiter((len(w) for w in waypoint_lists), dtype=np.int64, count=len(records))
+    owner = np.repeat(np.arange(len(records)), counts)
+    local = np.arange(len(owner)) - np.repeat(np.cumsum(counts) - counts, counts)
+    flat = [wp for wps in waypoint_lists for wp in wps]
+
+    columns: Dict[str, np.ndarray] = {}
+    row_bad = np.zeros(len(flat), dtype=bool)
+    for field in REQUIRED_WAYPOINT_FIELDS:
+        values = [wp.get(field, _MISSING) for wp in flat]
+        columns[field], bad = _numeric_column(values, field, owner, local, refs, issues)
+        row_bad |= bad
+    z_values = [wp.get("z", 0.0) for wp in flat]
+    columns["z"], bad = _numeric_column(z_values, "z", owner, local, refs, issues)
+    row_bad |= bad
+
+    ids = columns["id"]
+    non_integer = ~row_bad & (ids != np.floor(ids))
+    for k in np.nonzero(non_integer)[0].tolist():
+        flight_index, flight_id = refs[owner[k]]
+        issues.append(ValidationIssue(
+            flight_index, flight_id, int(local[k]), "id", "waypoint id must be an integer"
+        ))
+    row_bad |= non_integer
+
+    # Timestamps must strictly increase within each flight
+    t = columns["timestamp"]
+    same_flight = owner[1:] == owner[:-1]
+    not_after = same_flight & ~row_bad[1:] & ~row_bad[:-1] & (t[1:] <= t[:-1])
+    for k in (np.nonzero(not_after)[0] + 1).tolist():
+        flight_index, flight_id = refs[owner[k]]
+        issues.append(ValidationIssue(
+            flight_index, flight_id, int(local[k]), "timestamp",
+            f"timestamp {t[k]} is not after the previous waypoint ({t[k - 1]})"
+        ))
+    row_bad[1:] |= not_after
+
+    flight_ok &= np.bincount(owner[row_bad], minlength=len(records)) == 0
+    # Report in input order rather than field by field
+    issues[first_issue:] = sorted(
+        issues[first_issue:],
+        key=lambda i: (i.flight_index, -1 if i.waypoint_index is None else i.waypoint_index),
+    )
+    return columns, counts, np.nonzero(flight_ok)[0].tolist()
+
+
+def validate_flight_records(
+    records: Iterable,
+    batch_size: int = VALIDATION_BATCH_SIZE,
+) -> Tuple[ColumnarSchedule, List[ValidationIssue]]:
+    """
+    Validate raw flight dicts (as in simulated_flights.json) in bulk.
+
+    Returns the ColumnarSchedule of the flights that passed and every
+    issue found; flights with any issue are left out of the schedule.
+    """
+    issues: List[ValidationIssue] = []
+    parts: Dict[str, List[np.ndarray]] = {k: [] for k in ("x", "y", "z", "t", "id")}
+    counts_out = array("q")
+    drone_ids: List[str] = []
+    names: List[str] = []
+    descriptions: List[str] = []
+
+    def flush(batch: List, first_index: int) -> None:
+        columns, counts, ok = _validate_batch(batch, first_index, issues)
+        keep = np.zeros(len(batch), dtype=bool)
+        keep[ok] = True
+        rows = np.repeat(keep, counts)
+        for key, field in (("x", "x"), ("y", "y"), ("z", "z"), ("t", "timestamp"), ("id", "id")):
+            parts[key].append(columns[field][rows])
+        for i in ok:
+            counts_out.append(int(counts[i]))
+            drone_ids.append(str(batch[i]["id"]))
+            names.append(str(batch[i].get("name", "")))
+            descriptions.append(str(batch[i].get("description", "")))
+
+    batch: List = []
+    first_index = 0
+    for rec in records:
+        batch.append(rec)
+        if len(batch) >= batch_size:
+            flush(batch, first_index)
+            first_index += len(batch)
+            batch = []
+    if batch or first_index == 0:
+        flush(batch, first_index)
+
+    offsets = np.zeros(len(counts_out) + 1, dtype=np.int64)
+    np.cumsum(np.frombuffer(counts_out, dtype=np.int64), out=offsets[1:])
+    schedule = ColumnarSchedule(
+        drone_ids=drone_ids,
+        offsets=offsets,
+        x=np.concatenate(parts["x"]),
+        y=np.concatenate(parts["y"]),
+        z=np.concatenate(parts["z"]),
+        t=np.concatenate(parts["t"]),
+        waypoint_ids=np.concatenate(parts["id"]).astype(np.int64),
+        names=names,
+        descriptions=descriptions,
+    )
+    return schedule, issues
@@ -2,13 +2,19 @@
 High-level Query API for UAV Deconfliction System.
 """
 
-from typing import Dict, List
+import time
+from typing import Dict, List, Optional, Sequence, Union
 from src.utils.logger import get_logger
 from src.utils.config import get_config
 
-from src.core.conflict_resolver import resolve_conflicts_for_mission
-from src.data.models import Mission, FlightSchedule
-from src.data.loader import load_missions, load_simulated_flights, load_test_scenarios
+from src.core.conflict_resolver import (
+    resolve_airspace_conflicts,
+    resolve_conflicts_for_missions,
+)
+from src.data.columnar import ScheduleLike
+from src.data.models import Mission
+from src.data.loader import load_flights_cached, load_missions_cached
+from src.query.service import DeconflictionService, get_service
 
 logger = get_logger(__name__)
 
@@ -24,22 +30,106 @@ def check_mission_conflicts(
     missions_path: str,
     flights_path: str,
     mission_id: str,
+    workers: Optional[int] = None,
+    first_conflict_only: bool = False,
+    intervals: bool = False,
 ) -> Dict:
     """
     Public API: Check conflicts for a single mission.
+
+    `workers` overrides Config.NUM_WORKERS. The data files are parsed once
+    and kept in a shared DeconflictionService until they change on disk.
+    With `first_conflict_only` the check stops at the first breach and
+    reports at most one conflict (for yes/no approval). With `intervals`
+    each conflict is a merged [t_enter, t_exit] loss-of-separation interval;
+    asking for both raises ValueError.
+    """
+    return get_service(missions_path, flights_path).check_mission(
+        mission_id,
+        workers=workers,
+        first_conflict_only=first_conflict_only,
+        intervals=intervals,
+    )
+
+
+def check_missions_conflicts(
+    missions: Sequence[Union[str, Mission]],
+    schedule: Union[ScheduleLike, str],
+    missions_path: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> Dict:
+    """
+    Public API: Check many candidate missions against one schedule.
+
+    `missions` holds Mission objects and/or mission ids (ids are looked up
+    in `missions_path`). `schedule` is a FlightSchedule / ColumnarSchedule
+    or a path to a flights file. The schedule's segment arrays (or index,
+    when Config.PRUNING is set) are built once and all missions are
+    evaluated in one shared pass.
+
+    Returns:
+        {
+          "results": [<check_mission_conflicts result>, ...],  # input order
+          "total_missions": int,
+          "conflicting_missions": int,
+          "timings": {"load_s", "evaluate_s", "total_s", "per_mission_s"},
+        }
     """
     config = get_config()
+    start = time.perf_counter()
 
-    missions = load_missions(missions_path)
-    flights = load_simulated_flights(flights_path)
+    if isinstance(schedule, str):
+        schedule = load_flights_cached(schedule)
 
-    mission = get_mission_by_id(missions, mission_id)
+    if any(isinstance(m, str) for m in missions):
+        if missions_path is None:
+            raise ValueError("missions_path is required to look up missions by id")
+        loaded = load_missions_cached(missions_path)
+        missions = [get_mission_by_id(loaded, m) if isinstance(m, str) else m for m in missions]
+    loaded_at = time.perf_counter()
 
-    return resolve_conflicts_for_mission(
-        mission=mission,
-        schedule=flights,
+    results = resolve_conflicts_for_missions(
+        missions,
+        schedule,
         safety_buffer=config.SAFETY_BUFFER_DISTANCE,
         num_samples=config.NUM_SAMPLES,
+        engine=config.CONFLICT_ENGINE,
+        chunk_size=config.BATCH_CHUNK_SIZE,
+        pruning=config.PRUNING,
+        workers=config.NUM_WORKERS if workers is None else workers,
+    )
+    done = time.perf_counter()
+
+    return {
+        "results": results,
+        "total_missions": len(results),
+        "conflicting_missions": sum(r["status"] != "clear" for r in results),
+        "timings": {
+            "load_s": loaded_at - start,
+            "evaluate_s": done - loaded_at,
+            "total_s": done - start,
+            "per_mission_s": (done - start) / max(len(results), 1),
+        },
+    }
+
+
+def check_airspace_conflicts(schedule: Union[ScheduleLike, str]) -> Dict:
+    """
+    Public API: Find every conflicting pair among all filed flights.
+
+    `schedule` is a FlightSchedule / ColumnarSchedule or a path to a
+    simulated flights JSON file (loaded once into the columnar cache).
+    Each unordered pair is evaluated once.
+    """
+    config = get_config()
+
+    if isinstance(schedule, str):
+        schedule = load_flights_cached(schedule)
+
+    return resolve_airspace_conflicts(
+        schedule,
+        safety_buffer=config.SAFETY_BUFFER_DISTANCE,
+        chunk_size=config.BATCH_CHUNK_SIZE,
     )
 
 
@@ -48,32 +138,11 @@ def run_scenario(
     flights_path: str,
     scenarios_path: str,
     scenario_id: str,
+    workers: Optional[int] = None,
 ) -> Dict:
     """
     Public API: Run a scenario defined in scenarios.json.
     """
-    scenarios = load_test_scenarios(scenarios_path)
-
-    scenario = None
-    for s in scenarios:
-        if s.id == scenario_id:
-            scenario = s
-            break
-
-    if scenario is None:
-        raise ValueError(f"Scenario '{scenario_id}' not found")
-
-    result = check_mission_conflicts(
-        missions_path,
-        flights_path,
-        scenario.primary_mission_id,
+    return get_service(missions_path, flights_path).run_scenario(
+        scenarios_path, scenario_id, workers=workers
     )
-
-    return {
-        "scenario_id": scenario.id,
-        "scenario_name": scenario.name,
-        "expected_status": scenario.expected_result,
-        "actual_status": result["status"],
-        "match": scenario.expected_result == result["status"],
-        "raw_output": result
-    }
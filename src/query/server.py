@@ -0,0 +1,353 @@
+"""
+Local asyncio HTTP server for mission conflict queries.
+
+Keeps one DeconflictionService hot so each query skips interpreter
+startup and JSON parsing. Endpoints:
+
+    POST /missions/check   {"mission_id": "..."} or {"mission": {...}},
+                           optionally with "first_conflict_only": true
+    POST /flights          one flight object, or {"flights": [...]}
+
+Mission checks arriving within a short window are collected into one
+batch and evaluated by a single executor call as one shared pass over
+the schedule (identical mission ids in a batch share one evaluation).
+A semaphore caps the batches in flight, and requests beyond
+SERVER_MAX_PENDING are rejected with 503 instead of queueing without
+bound. Only the standard library is used.
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
+
+from src.data.loader import parse_flight, parse_mission
+from src.data.models import Mission
+from src.query.service import DeconflictionService
+from src.utils.config import Config
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+_REASONS = {
+    200: "OK",
+    201: "Created",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _parsed(parse, obj, what: str):
+    """parse(obj), with malformed input reported as a 400."""
+    try:
+        return parse(obj)
+    except (KeyError, TypeError, ValueError) as e:
+        raise HTTPError(400, f"Invalid {what}: {e}") from None
+
+
+class MissionCheckBatcher:
+    """
+    Collects mission checks for up to `window` seconds (or `max_batch`
+    requests) and runs each batch in one executor call.
+    """
+
+    def __init__(
+        self,
+        service: DeconflictionService,
+        executor: ThreadPoolExecutor,
+        limit: asyncio.Semaphore,
+        window: float,
+        max_batch: int,
+    ):
+        self.service = service
+        self.executor = executor
+        self.limit = limit
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: List[Tuple[Union[str, Mission], asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+
+    async def submit(self, mission: Union[str, Mission]) -> Dict:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((mission, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[Union[str, Mission], asyncio.Future]]) -> None:
+        missions = [m for m, _ in batch]
+        async with self.limit:
+            loop = asyncio.get_running_loop()
+            try:
+                results = await loop.run_in_executor(
+                    self.executor, self._check_batch, missions
+                )
+            except Exception as e:  # never leave a request hanging
+                results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _check_batch(self, missions: List[Union[str, Mission]]) -> List:
+        """
+        Executor side: evaluate a batch in one shared pass, once per
+        distinct mission id. Unknown ids fail only their own requests.
+        """
+        results: List = [None] * len(missions)
+        unique: List[Mission] = []
+        slot: Dict[Union[str, int], int] = {}
+        rows = []
+        for i, mission in enumerate(missions):
+            key = mission if isinstance(mission, str) else id(mission)
+            if key not in slot:
+                try:
+                    resolved = self.service.get_mission(mission) if isinstance(mission, str) else mission
+                except ValueError as e:
+                    results[i] = e
+                    continue
+                slot[key] = len(unique)
+                unique.append(resolved)
+            rows.append((i, slot[key]))
+
+        checked = self.service.check_missions(unique) if unique else []
+        for i, k in rows:
+            results[i] = checked[k]
+        return results
+
+
+class DeconflictionServer:
+    """asyncio HTTP/1.1 front end over a DeconflictionService."""
+
+    def __init__(self, service: DeconflictionService, config: Optional[Config] = None):
+        self.service = service
+        self.config = config or service.config
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.SERVER_MAX_CONCURRENCY,
+            thread_name_prefix="deconfliction",
+        )
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._batcher: Optional[MissionCheckBatcher] = None
+        self._limit: Optional[asyncio.Semaphore] = None
+        self._in_flight = 0
+
+    async def start(self, host: Optional[str] = None, port: Optional[int] = None) -> Tuple[str, int]:
+        """Start listening; returns the bound (host, port). Port 0 picks a free port."""
+        self._limit = asyncio.Semaphore(self.config.SERVER_MAX_CONCURRENCY)
+        self._batcher = MissionCheckBatcher(
+            self.service,
+            self._executor,
+            self._limit,
+            window=self.config.SERVER_BATCH_WINDOW,
+            max_batch=self.config.SERVER_MAX_BATCH,
+        )
+        self._server = await asyncio.start_server(
+            self._handle_connection,
+            host or self.config.SERVER_HOST,
+            self.config.SERVER_PORT if port is None else port,
+        )
+        address = self._server.sockets[0].getsockname()[:2]
+        logger.info(f"Deconfliction server listening on http://{address[0]}:{address[1]}")
+        return address
+
+    async def serve_forever(self) -> None:
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self._executor.shutdown(wait=False)
+
+    # ---------------- HTTP plumbing ----------------
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request = await self._read_request(reader, writer)
+                if request is None:
+                    break
+                method, path, body, keep_alive = request
+                status, payload = await self._dispatch(method, path, body)
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader, writer):
+        try:
+            request_line = await reader.readline()
+        except ValueError:
+            return None
+        if not request_line.strip():
+            return None
+
+        try:
+            method, path, version = request_line.decode("latin-1").split()
+        except ValueError:
+            self._write_response(writer, 400, {"error": "Malformed request line"}, False)
+            return None
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length", 0) or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._write_response(writer, 400, {"error": "Invalid Content-Length"}, False)
+            return None
+        if length > MAX_BODY_BYTES:
+            self._write_response(writer, 413, {"error": "Request body too large"}, False)
+            return None
+        body = await reader.readexactly(length) if length else b""
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        return method.upper(), path.split("?", 1)[0], body, keep_alive
+
+    @staticmethod
+    def _write_response(writer, status: int, payload: Dict, keep_alive: bool) -> None:
+        body = json.dumps(payload).encode()
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Dict]:
+        routes = {
+            "/missions/check": self._check_mission,
+            "/flights": self._file_flights,
+        }
+        handler = routes.get(path)
+        if handler is None:
+            return 404, {"error": f"Unknown path '{path}'"}
+        if method != "POST":
+            return 405, {"error": "Only POST is supported"}
+
+        if self._in_flight >= self.config.SERVER_MAX_PENDING:
+            return 503, {"error": "Server busy, retry later"}
+        self._in_flight += 1
+        try:
+            try:
+                data = json.loads(body or b"{}")
+            except ValueError:
+                raise HTTPError(400, "Request body is not valid JSON")
+            if not isinstance(data, dict):
+                raise HTTPError(400, "Request body must be a JSON object")
+            return await handler(data)
+        except HTTPError as e:
+            return e.status, {"error": e.message}
+        except Exception as e:
+            logger.exception("Unhandled error while serving request")
+            return 500, {"error": str(e)}
+        finally:
+            self._in_flight -= 1
+
+    # ---------------- Endpoints ----------------
+
+    async def _check_mission(self, data: Dict) -> Tuple[int, Dict]:
+        if "mission" in data:
+            mission = _parsed(parse_mission, data["mission"], "mission")
+        elif "mission_id" in data:
+            mission = str(data["mission_id"])
+        else:
+            raise HTTPError(400, "Expected 'mission_id' or 'mission'")
+
+        if isinstance(mission, str):
+            # Only an unknown id is a 404; other ValueErrors are bad requests
+            try:
+                self.service.get_mission(mission)
+            except ValueError as e:
+                raise HTTPError(404, str(e))
+
+        if data.get("first_conflict_only"):
+            # Approval checks exit early; batching would only delay them
+            async with self._limit:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._executor,
+                    lambda: self.service.check_mission(mission, first_conflict_only=True),
+                )
+            return 200, result
+        return 200, await self._batcher.submit(mission)
+
+    async def _file_flights(self, data: Dict) -> Tuple[int, Dict]:
+        flights = data.get("flights", [data])
+        if not isinstance(flights, list):
+            raise HTTPError(400, "'flights' must be a list")
+        flights = [_parsed(parse_flight, f, "flight") for f in flights]
+
+        def file_all():
+            for drone in flights:
+                self.service.add_flight(drone)
+
+        async with self._limit:
+            await asyncio.get_running_loop().run_in_executor(self._executor, file_all)
+        return 201, {"filed": [d.drone_id for d in flights]}
+
+
+async def _serve(service: DeconflictionService, host: Optional[str], port: Optional[int]) -> None:
+    server = DeconflictionServer(service)
+    await server.start(host, port)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def run_server(
+    service: DeconflictionService,
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+) -> None:
+    """Serve until interrupted (Ctrl+C)."""
+    try:
+        asyncio.run(_serve(service, host, port))
+    except KeyboardInterrupt:
+        logger.info("Deconfliction server stopped")
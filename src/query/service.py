@@ -0,0 +1,362 @@
+"""
+Long-lived, in-memory deconfliction service.
+
+Loads missions and the flight schedule once and keeps them hot together
+with the packed segment arrays and (when pruning is enabled) a live
+segment index, so repeated mission checks skip JSON parsing entirely.
+The functions in deconfliction_api.py are thin wrappers around it.
+"""
+
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from src.core.conflict_resolver import (
+    build_segment_index,
+    resolve_airspace_conflicts,
+    resolve_conflicts_for_mission,
+    resolve_conflicts_for_missions,
+)
+from src.core.conflict_state import ConflictDiff, ConflictStateStore
+from src.core.spatial_index import BaseSegmentIndex
+from src.data.columnar import ColumnarSchedule, ScheduleLike
+from src.data.loader import (
+    load_flights_cached,
+    load_missions_cached,
+    load_test_scenarios_cached,
+)
+from src.data.models import Drone, Mission, TestScenario
+from src.utils.config import Config, get_config
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _mtime(path: Optional[str]) -> Optional[float]:
+    return os.path.getmtime(path) if path else None
+
+
+class DeconflictionService:
+    """
+    Holds one schedule in memory and answers mission checks against it.
+
+    Flights can be filed and cancelled while the service runs; the
+    columnar arrays are spliced rather than rebuilt and the segment index
+    is updated in place.
+    """
+
+    def __init__(
+        self,
+        missions: List[Mission],
+        schedule: ScheduleLike,
+        config: Optional[Config] = None,
+    ):
+        self.config = config or get_config()
+        self._missions: Dict[str, Mission] = {m.mission_id: m for m in missions}
+        if not isinstance(schedule, ColumnarSchedule):
+            schedule = ColumnarSchedule.from_schedule(schedule)
+        self._columnar = schedule
+        # Flights filed (Drone) and cancelled (None) since loading, in order
+        self._amendments: Dict[str, Optional[Drone]] = {}
+        self._index: Optional[BaseSegmentIndex] = None
+        self._conflict_state: Optional[ConflictStateStore] = None
+        self._lock = threading.RLock()
+
+        # Source files, for staleness checks (None when built in memory)
+        self.missions_path: Optional[str] = None
+        self.flights_path: Optional[str] = None
+        self._source_mtimes: Tuple[Optional[float], Optional[float]] = (None, None)
+
+    # ---------------- Construction ----------------
+
+    @classmethod
+    def from_files(
+        cls,
+        missions_path: str,
+        flights_path: str,
+        config: Optional[Config] = None,
+    ) -> "DeconflictionService":
+        service = cls(
+            load_missions_cached(missions_path),
+            load_flights_cached(flights_path),
+            config=config,
+        )
+        service.missions_path = missions_path
+        service.flights_path = flights_path
+        service._source_mtimes = (_mtime(missions_path), _mtime(flights_path))
+        logger.debug(f"Loaded service from {missions_path} and {flights_path}")
+        return service
+
+    def is_stale(self) -> bool:
+        """True if a source file changed on disk since it was loaded."""
+        if self.missions_path is None:
+            return False
+        return self._source_mtimes != (_mtime(self.missions_path), _mtime(self.flights_path))
+
+    # ---------------- State ----------------
+
+    @property
+    def schedule(self) -> ColumnarSchedule:
+        """Current schedule; replaced, never modified, when flights change."""
+        with self._lock:
+            return self._columnar
+
+    def _without(self, drone_id: str) -> Optional[List[ColumnarSchedule]]:
+        """The schedule split around `drone_id`, or None if it is not filed."""
+        schedule = self._columnar
+        try:
+            i = schedule.drone_ids.index(drone_id)
+        except ValueError:
+            return None
+        return [schedule.slice_drones(0, i), schedule.slice_drones(i + 1, len(schedule))]
+
+    @property
+    def missions(self) -> List[Mission]:
+        return list(self._missions.values())
+
+    @property
+    def index(self) -> Optional[BaseSegmentIndex]:
+        """Live segment index, or None when Config.PRUNING is "none"."""
+        with self._lock:
+            if self.config.PRUNING == "none":
+                return None
+            if self._index is None:
+                self._index = build_segment_index(
+                    self.schedule, self.config.SAFETY_BUFFER_DISTANCE, self.config.PRUNING
+                )
+            return self._index
+
+    @property
+    def conflict_state(self) -> ConflictStateStore:
+        """
+        Per-pair conflicts among the filed flights, seeded on first use and
+        then kept up to date by add_flight / remove_flight.
+        """
+        with self._lock:
+            if self._conflict_state is None:
+                pruning = "tree" if self.config.PRUNING == "none" else self.config.PRUNING
+                self._conflict_state = ConflictStateStore.from_schedule(
+                    self.schedule, self.config.SAFETY_BUFFER_DISTANCE, pruning=pruning
+                )
+            return self._conflict_state
+
+    def get_mission(self, mission_id: str) -> Mission:
+        """
+        Loaded mission by id. The object is shared with the service;
+        copy it before modifying it.
+        """
+        try:
+            return self._missions[mission_id]
+        except KeyError:
+            raise ValueError(f"Mission with ID '{mission_id}' not found") from None
+
+    def add_mission(self, mission: Mission) -> None:
+        with self._lock:
+            self._missions[mission.mission_id] = mission
+
+    def add_flight(self, drone: Drone) -> Optional[ConflictDiff]:
+        """
+        File a flight, replacing any flight with the same drone id.
+        Returns the conflict diff once conflict_state is in use, else None.
+        """
+        with self._lock:
+            added = ColumnarSchedule.from_drones([drone])
+            added.segment_array()
+            parts = self._without(drone.drone_id) or [self._columnar]
+            self._columnar = ColumnarSchedule.concat(parts + [added])
+            self._amendments.pop(drone.drone_id, None)
+            self._amendments[drone.drone_id] = drone
+            if self._index is not None:
+                self._index.insert(drone)
+            if self._conflict_state is not None:
+                return self._conflict_state.add_flight(drone)
+            return None
+
+    def remove_flight(self, drone_id: str) -> bool:
+        """Cancel a flight. Returns False if no such flight was filed."""
+        with self._lock:
+            parts = self._without(drone_id)
+            if parts is None:
+                return False
+            self._columnar = ColumnarSchedule.concat(parts)
+            self._amendments.pop(drone_id, None)
+            self._amendments[drone_id] = None
+            if self._index is not None:
+                self._index.remove(drone_id)
+            if self._conflict_state is not None:
+                self._conflict_state.remove_flight(drone_id)
+            return True
+
+    def replay_amendments(self, other: "DeconflictionService") -> int:
+        """
+        File and cancel, in order, the flights filed and cancelled on
+        `other` since it was loaded. Returns how many were replayed.
+        """
+        amendments = list(other._amendments.items())
+        for drone_id, drone in amendments:
+            if drone is None:
+                self.remove_flight(drone_id)
+            else:
+                self.add_flight(drone)
+        return len(amendments)
+
+    # ---------------- Queries ----------------
+
+    def check_mission(
+        self,
+        mission: Union[str, Mission],
+        workers: Optional[int] = None,
+        first_conflict_only: bool = False,
+        intervals: bool = False,
+    ) -> Dict:
+        """
+        Check a mission (by id, or a Mission object) against the schedule.
+        `workers` overrides Config.NUM_WORKERS; `first_conflict_only`
+        stops at the first breach and `intervals` reports merged
+        loss-of-separation intervals (see resolve_conflicts_for_mission);
+        the two cannot be combined.
+        """
+        if not first_conflict_only:
+            return self.check_missions([mission], workers=workers, intervals=intervals)[0]
+
+        if isinstance(mission, str):
+            mission = self.get_mission(mission)
+        with self._lock:
+            schedule, index = self.schedule, self.index
+            if index is not None:
+                return self._resolve_first(mission, schedule, index, intervals)
+        return self._resolve_first(mission, schedule, None, intervals)
+
+    def is_clear(self, mission: Union[str, Mission]) -> bool:
+        """Yes/no approval check with early exit."""
+        return self.check_mission(mission, first_conflict_only=True)["status"] == "clear"
+
+    def check_missions(
+        self,
+        missions: Sequence[Union[str, Mission]],
+        workers: Optional[int] = None,
+        intervals: bool = False,
+    ) -> List[Dict]:
+        """
+        Check several missions (ids or Mission objects) in one shared pass
+        over the schedule; results come back in input order.
+        """
+        missions = [self.get_mission(m) if isinstance(m, str) else m for m in missions]
+
+        with self._lock:
+            schedule, index = self.schedule, self.index
+            if index is not None:
+                # Index queries may rebuild it, so they must not interleave
+                return self._resolve(missions, schedule, index, workers, intervals)
+
+        # The packed schedule is immutable: no lock needed
+        return self._resolve(missions, schedule, None, workers, intervals)
+
+    def _resolve(
+        self,
+        missions: List[Mission],
+        schedule: ColumnarSchedule,
+        index: Optional[BaseSegmentIndex],
+        workers: Optional[int],
+        intervals: bool = False,
+    ) -> List[Dict]:
+        return resolve_conflicts_for_missions(
+            missions=missions,
+            schedule=schedule,
+            safety_buffer=self.config.SAFETY_BUFFER_DISTANCE,
+            num_samples=self.config.NUM_SAMPLES,
+            engine=self.config.CONFLICT_ENGINE,
+            chunk_size=self.config.BATCH_CHUNK_SIZE,
+            pruning=self.config.PRUNING,
+            index=index,
+            workers=self.config.NUM_WORKERS if workers is None else workers,
+            intervals=intervals,
+        )
+
+    def _resolve_first(
+        self,
+        mission: Mission,
+        schedule: ColumnarSchedule,
+        index: Optional[BaseSegmentIndex],
+        intervals: bool = False,
+    ) -> Dict:
+        return resolve_conflicts_for_mission(
+            mission=mission,
+            schedule=schedule,
+            safety_buffer=self.config.SAFETY_BUFFER_DISTANCE,
+            num_samples=self.config.NUM_SAMPLES,
+            engine=self.config.CONFLICT_ENGINE,
+            chunk_size=self.config.BATCH_CHUNK_SIZE,
+            pruning=self.config.PRUNING,
+            index=index,
+            first_conflict_only=True,
+            intervals=intervals,
+        )
+
+    def check_airspace(self) -> Dict:
+        """Every conflicting pair among the filed flights."""
+        return resolve_airspace_conflicts(
+            self.schedule,
+            safety_buffer=self.config.SAFETY_BUFFER_DISTANCE,
+            chunk_size=self.config.BATCH_CHUNK_SIZE,
+        )
+
+    def get_scenario(self, scenarios_path: str, scenario_id: str) -> TestScenario:
+        """Scenario by id; each scenarios file is parsed once per change."""
+        for s in load_test_scenarios_cached(scenarios_path):
+            if s.id == scenario_id:
+                return s
+        raise ValueError(f"Scenario '{scenario_id}' not found")
+
+    def run_scenario(
+        self,
+        scenarios_path: str,
+        scenario_id: str,
+        workers: Optional[int] = None,
+    ) -> Dict:
+        scenario = self.get_scenario(scenarios_path, scenario_id)
+        result = self.check_mission(scenario.primary_mission_id, workers=workers)
+
+        return {
+            "scenario_id": scenario.id,
+            "scenario_name": scenario.name,
+            "expected_status": scenario.expected_result,
+            "actual_status": result["status"],
+            "match": scenario.expected_result == result["status"],
+            "raw_output": result
+        }
+
+
+# ---------------- Shared instances ----------------
+
+_services: Dict[Tuple[str, str], DeconflictionService] = {}
+_services_lock = threading.Lock()
+
+
+def get_service(missions_path: str, flights_path: str) -> DeconflictionService:
+    """
+    Shared service for a pair of data files, reloaded when either file
+    changes on disk. Flights filed or cancelled on the old service are
+    replayed on top of the reloaded files.
+    """
+    key = (os.path.abspath(missions_path), os.path.abspath(flights_path))
+    with _services_lock:
+        stale = _services.get(key)
+        if stale is not None and not stale.is_stale():
+            return stale
+        service = DeconflictionService.from_files(missions_path, flights_path)
+        if stale is not None:
+            replayed = service.replay_amendments(stale)
+            if replayed:
+                logger.warning(
+                    f"Reloaded {missions_path} and {flights_path}; replayed "
+                    f"{replayed} flights filed or cancelled at runtime"
+                )
+        _services[key] = service
+        return service
+
+
+def clear_services() -> None:
+    """Drop every shared service (e.g. after changing configuration)."""
+    with _services_lock:
+        _services.clear()
@@ -16,9 +16,44 @@ class Config:
     # Stage 5 sampling
     NUM_SAMPLES = 50
 
+    # Conflict engine: "vectorized" (batched exact closest approach),
+    # "analytic" (exact, one pair at a time) or "sampling"
+    CONFLICT_ENGINE = "vectorized"
+    BATCH_CHUNK_SIZE = 250_000  # segment pairs per vectorized batch
+
+    # Candidate pruning before the exact check: "none", "tree" (BVH)
+    # or "grid" (hash grid with time buckets)
+    PRUNING = "none"
+
+    # Worker processes for the vectorized engine (1 = in-process)
+    NUM_WORKERS = 1
+
+    # Parsed-file cache: entries kept in memory, and whether to also
+    # write on-disk .uavs sidecars of parsed schedules next to the data files
+    SCHEDULE_CACHE_SIZE = 16
+    SCHEDULE_CACHE_SIDECAR = False
+
+    # Local HTTP server (main.py --serve)
+    SERVER_HOST = "127.0.0.1"
+    SERVER_PORT = 8080
+    SERVER_MAX_CONCURRENCY = 4  # batches evaluated at once
+    SERVER_MAX_PENDING = 1024  # requests in flight before answering 503
+    SERVER_BATCH_WINDOW = 0.005  # seconds to collect a batch of checks
+    SERVER_MAX_BATCH = 64
+
     # Visualization
     PLOT_DPI = 100
+    PLOT_LOD_THRESHOLD = 50  # drones above which static plots switch to level-of-detail mode
+    PLOT_CLUSTER_PIXELS = 12  # conflict markers closer than this (in pixels) are merged
     ANIMATION_FPS = 10
+    RENDER_WORKERS = 0  # headless video rendering processes (0 = one per CPU core)
+    RENDER_CHUNK_FRAMES = 32  # frames rasterized per worker task
+    RENDER_VIEWS = ("2d", "3d")  # animations the headless renderer can draw
+    HEATMAP_CELL_SIZE = 100.0  # meters per occupancy grid cell
+    HEATMAP_WINDOW = 60.0  # seconds per heatmap time window
+    HEATMAP_SAMPLE_STEP = 1.0  # seconds between position samples
+    HEATMAP_CHUNK_DRONES = 4096  # drones read per chunk
+    HEATMAP_CHUNK_SAMPLES = 1_000_000  # positions interpolated at once
     
     # Logging
     LOG_LEVEL = "INFO"
@@ -1,25 +1,48 @@
 """
 Logging utilities for the deconfliction system.
+
+Logging is configured on the first get_logger call, and the log file
+(and its directory) is only created when the first record is written,
+so importing a module never touches the filesystem.
 """
 import logging
 import os
 from src.utils.config import get_config
 
-config = get_config()
+_configured = False
+
+
+class _DeferredFileHandler(logging.FileHandler):
+    """FileHandler that creates the log directory when the file is first opened."""
+
+    def __init__(self, filename: str):
+        super().__init__(filename, delay=True)
+
+    def _open(self):
+        directory = os.path.dirname(self.baseFilename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return super()._open()
+
+
+def _configure() -> None:
+    global _configured
+    if _configured:
+        return
+    _configured = True
 
-# Create logs directory if needed
-os.makedirs(os.path.dirname(config.LOG_FILE), exist_ok=True)
+    config = get_config()
+    logging.basicConfig(
+        level=config.LOG_LEVEL,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            _DeferredFileHandler(config.LOG_FILE),
+            logging.StreamHandler()
+        ]
+    )
 
-# Configure logging
-logging.basicConfig(
-    level=config.LOG_LEVEL,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(config.LOG_FILE),
-        logging.StreamHandler()
-    ]
-)
 
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance."""
-    return logging.getLogger(name)
\ No newline at end of file
+    _configure()
+    return logging.getLogger(name)
@@ -0,0 +1,59 @@
+"""
+Frame precomputation for the animations.
+
+Every drone's position at every frame is interpolated up front into one
+(frames, 1 + drones, 3) array (mission drone first), so drawing a frame
+is a single artist update instead of a per-drone waypoint scan.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+from src.core.temporal_checker import interpolate_tracks
+from src.data.columnar import ColumnarSchedule, ScheduleLike
+from src.data.models import Mission
+
+
+def _with_mission(mission: Mission, schedule: ScheduleLike) -> ColumnarSchedule:
+    """Columns of the mission drone followed by every drone of the schedule."""
+    if not isinstance(schedule, ColumnarSchedule):
+        return ColumnarSchedule.from_drones([mission.drone] + schedule.drones)
+
+    head = ColumnarSchedule.from_drones([mission.drone])
+    return ColumnarSchedule(
+        drone_ids=head.drone_ids + schedule.drone_ids,
+        offsets=np.concatenate((head.offsets, schedule.offsets[1:] + head.offsets[-1])),
+        x=np.concatenate((head.x, schedule.x)),
+        y=np.concatenate((head.y, schedule.y)),
+        z=np.concatenate((head.z, schedule.z)),
+        t=np.concatenate((head.t, schedule.t)),
+        waypoint_ids=np.concatenate((head.waypoint_ids, schedule.waypoint_ids)),
+    )
+
+
+def precompute_frames(
+    mission: Mission, schedule: ScheduleLike, fps: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Frame times spanning every waypoint of the mission and schedule at
+    `fps`, and the (frames, 1 + drones, 3) positions at those times.
+    """
+    columns = _with_mission(mission, schedule)
+    t_min, t_max = float(columns.t.min()), float(columns.t.max())
+    times = np.linspace(t_min, t_max, int((t_max - t_min) * fps))
+
+    positions = interpolate_tracks(
+        times, columns.offsets, columns.t, np.column_stack((columns.x, columns.y, columns.z))
+    )
+    return times, positions
+
+
+def track_lines(mission: Mission, schedule: ScheduleLike, dims: int = 2) -> List[np.ndarray]:
+    """
+    Waypoint polylines of the mission drone and every scheduled drone as
+    (n, dims) arrays, for drawing all background paths as one collection.
+    """
+    columns = _with_mission(mission, schedule)
+    points = np.column_stack((columns.x, columns.y, columns.z)[:dims])
+    return np.split(points, columns.offsets[1:-1])
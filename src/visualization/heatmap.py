@@ -0,0 +1,266 @@
+"""
+Time-windowed occupancy heatmaps of the airspace.
+
+Instead of drawing tracks, every drone is sampled every
+Config.HEATMAP_SAMPLE_STEP seconds along its segments (on one time grid
+shared by all drones) and the samples are counted into an
+(windows, x cells, y cells) grid with np.bincount. A cell's occupancy is
+the mean number of drones inside it during the window.
+
+The grid is accumulated chunk by chunk: drones are read
+HEATMAP_CHUNK_DRONES at a time (a memory-mapped .uavs schedule or a
+streamed flights file is never loaded whole), and at most
+HEATMAP_CHUNK_SAMPLES positions are interpolated at once. Conflicts from
+the resolver are counted into the same grid for the overlay.
+"""
+
+import math
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from src.core.temporal_checker import interpolate_segment_positions
+from src.data.columnar import ColumnarSchedule
+from src.data.models import Drone, FlightSchedule
+from src.utils.config import get_config
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (x_min, x_max, y_min, y_max, t_min, t_max)
+Bounds = Tuple[float, float, float, float, float, float]
+DroneSource = Union[ColumnarSchedule, FlightSchedule, Iterable[Drone]]
+
+
+def _edges(lo: float, hi: float, width: float) -> np.ndarray:
+    # Enough equal bins that `hi` itself falls inside the last one
+    return lo + width * np.arange(int((hi - lo) // width) + 2)
+
+
+@dataclass
+class OccupancyGrid:
+    x_edges: np.ndarray   # (X + 1,) cell boundaries along x
+    y_edges: np.ndarray   # (Y + 1,) cell boundaries along y
+    t_edges: np.ndarray   # (W + 1,) time window boundaries
+    sample_step: float
+    counts: np.ndarray    # (W, X, Y) int64 position samples per window and cell
+
+    @classmethod
+    def empty(cls, bounds: Bounds, cell_size: float, window: float, sample_step: float) -> "OccupancyGrid":
+        if cell_size <= 0 or window <= 0 or sample_step <= 0:
+            raise ValueError("cell_size, window and sample_step must be positive")
+        x_min, x_max, y_min, y_max, t_min, t_max = bounds
+        x_edges = _edges(x_min, x_max, cell_size)
+        y_edges = _edges(y_min, y_max, cell_size)
+        t_edges = _edges(t_min, t_max, window)
+        shape = (len(t_edges) - 1, len(x_edges) - 1, len(y_edges) - 1)
+        return cls(x_edges, y_edges, t_edges, sample_step, np.zeros(shape, dtype=np.int64))
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        return self.counts.shape
+
+    @property
+    def occupancy(self) -> np.ndarray:
+        """(W, X, Y) mean number of drones in each cell during each window."""
+        window = self.t_edges[1] - self.t_edges[0]
+        return self.counts * (self.sample_step / window)
+
+    def bin_points(self, x: np.ndarray, y: np.ndarray, t: np.ndarray) -> np.ndarray:
+        """(W, X, Y) number of the points (x, y) at times t in each cell; outside points are dropped."""
+        index = [
+            np.floor((np.asarray(v, dtype=float) - edges[0]) / (edges[1] - edges[0])).astype(np.int64)
+            for v, edges in ((t, self.t_edges), (x, self.x_edges), (y, self.y_edges))
+        ]
+        inside = np.ones(len(index[0]), dtype=bool)
+        for i, n in zip(index, self.shape):
+            inside &= (i >= 0) & (i < n)
+        flat = np.ravel_multi_index([i[inside] for i in index], self.shape)
+        return np.bincount(flat, minlength=self.counts.size).reshape(self.shape)
+
+    def add_segments(self, segments: np.ndarray, chunk_samples: int) -> None:
+        """
+        Sample packed (N, 8) segments at every grid sample time in
+        [t_start, t_end) and add the samples to the counts.
+        """
+        if len(segments) == 0:
+            return
+        t_min, step = self.t_edges[0], self.sample_step
+        k_start = np.ceil((segments[:, 6] - t_min) / step).astype(np.int64)
+        k_end = np.ceil((segments[:, 7] - t_min) / step).astype(np.int64)
+        samples = np.maximum(k_end - k_start, 0)
+        ends = np.cumsum(samples)
+
+        lo = 0
+        while lo < len(segments):
+            done = ends[lo - 1] if lo else 0
+            hi = max(lo + 1, int(np.searchsorted(ends, done + chunk_samples, side="right")))
+
+            n = samples[lo:hi]
+            owner = np.repeat(np.arange(lo, hi), n)
+            k = k_start[owner] + np.arange(len(owner)) - np.repeat(ends[lo:hi] - n - done, n)
+            times = t_min + k * step
+            positions = interpolate_segment_positions(segments[owner], times)
+            self.counts += self.bin_points(positions[:, 0], positions[:, 1], times)
+            lo = hi
+
+
+def schedule_extent(source: DroneSource) -> Bounds:
+    """x, y and time extent of a schedule's waypoints."""
+    if isinstance(source, ColumnarSchedule):
+        if source.num_waypoints == 0:
+            raise ValueError("Cannot size an occupancy grid for an empty schedule")
+        columns = (source.x, source.y, source.t)
+        return tuple(float(f(c)) for c in columns for f in (np.min, np.max))
+
+    if isinstance(source, FlightSchedule):
+        source = source.drones
+    if not isinstance(source, Sequence):
+        raise ValueError("bounds are required when drones are streamed")
+
+    trajectories = [d.trajectory for d in source if len(d.trajectory)]
+    if not trajectories:
+        raise ValueError("Cannot size an occupancy grid for an empty schedule")
+    lo = np.min([tr.lo for tr in trajectories], axis=0)
+    hi = np.max([tr.hi for tr in trajectories], axis=0)
+    return (float(lo[0]), float(hi[0]), float(lo[1]), float(hi[1]), float(lo[3]), float(hi[3]))
+
+
+def _segment_chunks(source: DroneSource, chunk_drones: int) -> Iterable[np.ndarray]:
+    """Packed segments of `chunk_drones` drones at a time."""
+    if isinstance(source, ColumnarSchedule):
+        for lo in range(0, len(source), chunk_drones):
+            yield source.slice_drones(lo, min(lo + chunk_drones, len(source))).segment_array()[0]
+        return
+
+    drones = iter(source.drones if isinstance(source, FlightSchedule) else source)
+    while True:
+        batch = list(islice(drones, chunk_drones))
+        if not batch:
+            return
+        yield np.concatenate([d.trajectory.packed for d in batch])
+
+
+def occupancy_grid(
+    source: DroneSource,
+    bounds: Optional[Bounds] = None,
+    cell_size: Optional[float] = None,
+    window: Optional[float] = None,
+    sample_step: Optional[float] = None,
+    chunk_drones: Optional[int] = None,
+    chunk_samples: Optional[int] = None,
+) -> OccupancyGrid:
+    """
+    Occupancy of a ColumnarSchedule (e.g. a memory-mapped .uavs file), a
+    FlightSchedule, or any iterable of Drones such as loader.iter_flights.
+
+    bounds defaults to the schedule's extent; it is required for a
+    one-shot iterable, which can only be read once. The other arguments
+    default to the Config.HEATMAP_* settings.
+    """
+    config = get_config()
+    grid = OccupancyGrid.empty(
+        bounds or schedule_extent(source),
+        cell_size or config.HEATMAP_CELL_SIZE,
+        window or config.HEATMAP_WINDOW,
+        sample_step or config.HEATMAP_SAMPLE_STEP,
+    )
+    chunk_samples = chunk_samples or config.HEATMAP_CHUNK_SAMPLES
+    for segments in _segment_chunks(source, chunk_drones or config.HEATMAP_CHUNK_DRONES):
+        grid.add_segments(segments, chunk_samples)
+
+    logger.info(f"Occupancy grid {grid.shape} (windows, x, y) filled with {int(grid.counts.sum())} samples")
+    return grid
+
+
+def _conflict_location(conflict: Dict) -> Dict:
+    # Mission checks report one location; airspace sweeps one per drone
+    if "location" in conflict:
+        return conflict["location"]
+    a, b = conflict["location_a"], conflict["location_b"]
+    return {k: (a[k] + b[k]) / 2 for k in ("x", "y", "z")}
+
+
+def conflict_density(grid: OccupancyGrid, conflicts: List[Dict]) -> np.ndarray:
+    """
+    (W, X, Y) number of conflicts in each cell and window. Accepts the
+    conflicts of a mission check or of an airspace sweep's pairs.
+    """
+    locations = [_conflict_location(c) for c in conflicts]
+    return grid.bin_points(
+        np.array([loc["x"] for loc in locations], dtype=float),
+        np.array([loc["y"] for loc in locations], dtype=float),
+        np.array([c["conflict_time"] for c in conflicts], dtype=float),
+    )
+
+
+def hotspots(grid: OccupancyGrid, top: int = 10) -> List[Dict]:
+    """The `top` busiest (window, cell) pairs, busiest first."""
+    occupancy = grid.occupancy.ravel()
+    order = np.argsort(-occupancy, kind="stable")[:top]
+    result = []
+    for flat in order[occupancy[order] > 0]:
+        w, i, j = np.unravel_index(flat, grid.shape)
+        result.append({
+            "window": (float(grid.t_edges[w]), float(grid.t_edges[w + 1])),
+            "x": (float(grid.x_edges[i]), float(grid.x_edges[i + 1])),
+            "y": (float(grid.y_edges[j]), float(grid.y_edges[j + 1])),
+            "occupancy": float(occupancy[flat]),
+        })
+    return result
+
+
+def plot_occupancy_heatmaps(
+    grid: OccupancyGrid,
+    conflicts: List[Dict] = None,
+    windows: Optional[Sequence[int]] = None,
+    columns: int = 4,
+    save_path: str = None,
+):
+    """
+    One heatmap panel per time window (all windows by default) on a
+    shared color scale, with red circles sized by the number of
+    conflicts in each cell.
+    """
+    windows = list(range(grid.shape[0]) if windows is None else windows)
+    columns = max(1, min(columns, len(windows)))
+    rows = math.ceil(len(windows) / columns)
+
+    fig, axes = plt.subplots(
+        rows, columns, figsize=(4 * columns, 4 * rows), sharex=True, sharey=True, squeeze=False
+    )
+    occupancy = grid.occupancy
+    vmax = max(float(occupancy[windows].max()), 1e-9) if windows else 1.0
+    density = conflict_density(grid, conflicts) if conflicts else None
+    cx = (grid.x_edges[:-1] + grid.x_edges[1:]) / 2
+    cy = (grid.y_edges[:-1] + grid.y_edges[1:]) / 2
+    cx, cy = np.meshgrid(cx, cy, indexing="ij")
+    extent = (grid.x_edges[0], grid.x_edges[-1], grid.y_edges[0], grid.y_edges[-1])
+
+    image = None
+    for ax, w in zip(axes.flat, windows):
+        image = ax.imshow(
+            occupancy[w].T, origin="lower", extent=extent, cmap="viridis",
+            vmin=0, vmax=vmax, interpolation="nearest",
+        )
+        if density is not None and density[w].any():
+            hit = density[w] > 0
+            ax.scatter(cx[hit], cy[hit], s=30 * np.sqrt(density[w][hit]),
+                       facecolors="none", edgecolors="red")
+        ax.set_title(f"t = {grid.t_edges[w]:.0f}-{grid.t_edges[w + 1]:.0f} s", fontsize=9)
+    for ax in axes.flat[len(windows):]:
+        ax.axis("off")
+
+    if image is not None:
+        fig.colorbar(image, ax=axes, label="Mean drones per cell")
+    fig.suptitle("Airspace Occupancy (red: conflicts)")
+    fig.supxlabel("X (meters)")
+    fig.supylabel("Y (meters)")
+
+    if save_path:
+        plt.savefig(save_path, dpi=120)
+
+    plt.show()
@@ -0,0 +1,112 @@
+"""
+Level-of-detail helpers for plotting large schedules.
+
+Static plots of thousands of drones draw every background track as one
+line collection. Before that, tracks are decimated to screen resolution
+(consecutive waypoints that fall in the same pixel are dropped) and
+dense conflict markers are merged into one marker per cluster cell. All
+of it is vectorized over the flat waypoint columns.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.data.columnar import ColumnarSchedule, ScheduleLike
+from src.data.models import Mission
+from src.utils.config import get_config
+from src.visualization.frames import track_lines
+
+
+def schedule_size(schedule: ScheduleLike) -> int:
+    """Number of drones, without materializing a ColumnarSchedule."""
+    if isinstance(schedule, ColumnarSchedule):
+        return len(schedule)
+    return len(schedule.drones)
+
+
+def pixel_size(points: np.ndarray, figsize: Tuple[float, float], dpi: float) -> float:
+    """Data units covered by one pixel when `points` fill the figure."""
+    if len(points) == 0:
+        return 1.0
+    extent = float(np.max(points.max(axis=0) - points.min(axis=0)))
+    return max(extent, 1e-9) / (max(figsize) * dpi)
+
+
+def decimate_tracks(lines: List[np.ndarray], pixel: float) -> List[np.ndarray]:
+    """
+    Drop waypoints that land in the same pixel cell as the previous
+    waypoint of their track; the first and last waypoint of each track
+    are always kept.
+    """
+    if not lines:
+        return []
+    counts = np.fromiter((len(line) for line in lines), dtype=np.int64, count=len(lines))
+    points = np.concatenate(lines)
+    if len(points) == 0:
+        return lines
+
+    owner = np.repeat(np.arange(len(lines)), counts)
+    boundary = np.ones(len(points) + 1, dtype=bool)
+    boundary[1:-1] = owner[1:] != owner[:-1]
+    first, last = boundary[:-1], boundary[1:]
+
+    cells = np.floor(points / pixel).astype(np.int64)
+    moved = np.ones(len(points), dtype=bool)
+    moved[1:] = (cells[1:] != cells[:-1]).any(axis=1)
+    keep = first | last | moved
+
+    kept = np.bincount(owner[keep], minlength=len(lines))
+    return np.split(points[keep], np.cumsum(kept)[:-1])
+
+
+def cluster_points(points: np.ndarray, cell: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge points sharing a grid cell of side `cell`. Returns the
+    centroid of each occupied cell and the number of points in it.
+    """
+    points = np.asarray(points, dtype=float)
+    if len(points) == 0:
+        return points, np.empty(0, dtype=np.int64)
+
+    _, inverse, counts = np.unique(
+        np.floor(points / cell).astype(np.int64), axis=0, return_inverse=True, return_counts=True
+    )
+    inverse = inverse.reshape(-1)
+    centroids = np.column_stack([
+        np.bincount(inverse, weights=points[:, k]) / counts for k in range(points.shape[1])
+    ])
+    return centroids, counts
+
+
+def use_lod(schedule: ScheduleLike, lod: Optional[bool] = None) -> bool:
+    """An explicit `lod` wins; otherwise above Config.PLOT_LOD_THRESHOLD drones."""
+    if lod is not None:
+        return lod
+    return schedule_size(schedule) > get_config().PLOT_LOD_THRESHOLD
+
+
+def lod_layers(
+    mission: Mission,
+    schedule: ScheduleLike,
+    conflicts: Optional[List[Dict]],
+    dims: int,
+    figsize: Tuple[float, float],
+) -> Tuple[List[np.ndarray], np.ndarray, np.ndarray]:
+    """
+    Everything a level-of-detail static plot draws: the decimated tracks
+    (mission first, as in track_lines), and the conflict cluster
+    centroids with their conflict counts. Resolution follows
+    Config.PLOT_DPI and clusters are Config.PLOT_CLUSTER_PIXELS wide.
+    """
+    config = get_config()
+    lines = track_lines(mission, schedule, dims=dims)
+    pixel = pixel_size(np.concatenate(lines), figsize, config.PLOT_DPI)
+    lines = decimate_tracks(lines, pixel)
+
+    axes = ("x", "y", "z")[:dims]
+    points = np.array(
+        [[c["location"][k] for k in axes] for c in conflicts or []], dtype=float
+    ).reshape(-1, dims)
+    centroids, counts = cluster_points(points, config.PLOT_CLUSTER_PIXELS * pixel)
+    return lines, centroids, counts
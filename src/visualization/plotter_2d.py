@@ -4,34 +4,52 @@
 
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+from matplotlib.collections import LineCollection
 import numpy as np
-from typing import List, Dict
-from src.data.models import Mission, FlightSchedule
+from typing import List, Dict, Optional
+from src.data.columnar import ScheduleLike
+from src.data.models import Mission
+from src.visualization.frames import precompute_frames, track_lines
+from src.visualization.lod import lod_layers, schedule_size, use_lod
+
+STATIC_FIGSIZE = (8, 8)
 
 
 def plot_2d_static(
     mission: Mission,
-    schedule: FlightSchedule,
+    schedule: ScheduleLike,
     conflicts: List[Dict] = None,
     save_path: str = None,
+    lod: Optional[bool] = None,
 ):
     """
     Create a static 2D plot showing:
     - Primary mission path
     - Other drone paths
     - Conflict points (if any)
+
+    With `lod` (default: above Config.PLOT_LOD_THRESHOLD drones) the other
+    paths are decimated and drawn as one collection, nearby conflicts are
+    merged into counted markers and there is no per-drone legend.
     """
 
-    plt.figure(figsize=(8, 8))
+    plt.figure(figsize=STATIC_FIGSIZE)
     ax = plt.gca()
 
+    if use_lod(schedule, lod):
+        _draw_static_lod(ax, mission, schedule, conflicts)
+        _finish_static(ax, save_path)
+        return
+
+    drones = schedule.drones
+
     # Plot mission
     mx = [wp.x for wp in mission.drone.waypoints]
     my = [wp.y for wp in mission.drone.waypoints]
     ax.plot(mx, my, '-o', label=f"Primary Mission: {mission.mission_id}", linewidth=2)
 
     # Plot other drones
-    for drone in schedule.drones:
+    for drone in drones:
         ox = [wp.x for wp in drone.waypoints]
         oy = [wp.y for wp in drone.waypoints]
         ax.plot(ox, oy, '--o', label=f"{drone.drone_id}")
@@ -45,6 +63,28 @@ def plot_2d_static(
             ax.text(x, y, f"  {c['other_drone_id']}\n  t~{c['conflict_time']:.1f}",
                     color='red', fontsize=8)
 
+    _finish_static(ax, save_path)
+
+
+def _draw_static_lod(ax, mission: Mission, schedule: ScheduleLike, conflicts: List[Dict]):
+    lines, centroids, counts = lod_layers(mission, schedule, conflicts, 2, STATIC_FIGSIZE)
+
+    ax.add_collection(LineCollection(
+        lines[1:], colors="tab:gray", linewidths=0.5, alpha=0.4,
+        label=f"{schedule_size(schedule)} other drones",
+    ))
+    ax.plot(lines[0][:, 0], lines[0][:, 1], '-o', label=f"Primary Mission: {mission.mission_id}", linewidth=2)
+
+    if len(counts):
+        ax.scatter(centroids[:, 0], centroids[:, 1], color='red', s=80 + 40 * np.sqrt(counts), marker='x',
+                   label=f"{int(counts.sum())} conflicts")
+        for (x, y), n in zip(centroids, counts):
+            if n > 1:
+                ax.text(x, y, f"  {n}", color='red', fontsize=8)
+    ax.autoscale_view()
+
+
+def _finish_static(ax, save_path: str):
     ax.set_title("2D UAV Trajectories (Top-Down View)")
     ax.set_xlabel("X (meters)")
     ax.set_ylabel("Y (meters)")
@@ -57,49 +97,28 @@ def plot_2d_static(
     plt.show()
 
 
-def animate_2d(
-    mission: Mission,
-    schedule: FlightSchedule,
-    conflicts: List[Dict] = None,
-    save_path: str = None,
-    fps: int = 10,
-):
-    """
-    Animate UAV movements over time.
-
-    Shows:
-    - Mission trajectory animation
-    - Other drone animations
-    - Dynamic playback for demo video
-    """
-
-    # Gather all timestamps to find animation range
-    all_times = []
-    all_times.extend([wp.t for wp in mission.drone.waypoints])
-    for drone in schedule.drones:
-        all_times.extend([wp.t for wp in drone.waypoints])
+ANIMATION_FIGSIZE = (8, 8)
 
-    t_min = min(all_times)
-    t_max = max(all_times)
 
-    fig, ax = plt.subplots(figsize=(8, 8))
+def draw_animation_scene(ax, lines: List[np.ndarray], start: np.ndarray, conflicts: List[Dict] = None):
+    """
+    Draw the 2D animation's static layers on `ax`: every waypoint path
+    (lines from track_lines, mission first) and the conflict markers,
+    plus one scatter for the drones at `start` ((1 + drones, 3)).
 
-    # Static trajectories in background
-    mx = [wp.x for wp in mission.drone.waypoints]
-    my = [wp.y for wp in mission.drone.waypoints]
+    Returns update(frame_positions, frame_time), which moves the drones
+    and returns the artists it changed.
+    """
+    # Static trajectories in background, one collection for every drone
+    ax.add_collection(LineCollection(lines[1:], colors="k", linestyles=":", alpha=0.3))
+    mx, my = lines[0][:, 0], lines[0][:, 1]
     ax.plot(mx, my, 'k--', alpha=0.4)
 
-    for drone in schedule.drones:
-        ox = [wp.x for wp in drone.waypoints]
-        oy = [wp.y for wp in drone.waypoints]
-        ax.plot(ox, oy, 'k:', alpha=0.3)
-
-    # Dynamic points
-    mission_point, = ax.plot([], [], 'bo', label="Mission Drone")
-    other_points = [
-        ax.plot([], [], 'ro')[0]
-        for _ in schedule.drones
-    ]
+    # Dynamic points: one scatter for every drone, mission drone first
+    count = len(start)
+    points = ax.scatter(
+        start[:, 0], start[:, 1], c=["blue"] + ["red"] * (count - 1), s=36, zorder=3
+    )
 
     # conflict markers
     conflict_markers = []
@@ -116,33 +135,44 @@ def animate_2d(
     ax.set_ylabel("Y")
     ax.grid(True)
 
-    def interp_path(drone, t):
-        """Interpolate position at time t."""
-        for wp1, wp2 in zip(drone.waypoints[:-1], drone.waypoints[1:]):
-            if wp1.t <= t <= wp2.t:
-                alpha = (t - wp1.t) / (wp2.t - wp1.t)
-                x = wp1.x + alpha * (wp2.x - wp1.x)
-                y = wp1.y + alpha * (wp2.y - wp1.y)
-                return x, y
-        return drone.waypoints[-1].x, drone.waypoints[-1].y
+    def update(frame_positions: np.ndarray, frame_time: float):
+        points.set_offsets(frame_positions[:, :2])
+        return [points] + conflict_markers
+
+    return update
+
+
+def animate_2d(
+    mission: Mission,
+    schedule: ScheduleLike,
+    conflicts: List[Dict] = None,
+    save_path: str = None,
+    fps: int = 10,
+):
+    """
+    Animate UAV movements over time.
+
+    Shows:
+    - Mission trajectory animation
+    - Other drone animations
+    - Dynamic playback for demo video
 
-    def update(frame_time):
-        # Update mission
-        mx, my = interp_path(mission.drone, frame_time)
-        mission_point.set_data(mx, my)
+    For headless video files use render.render_animation instead.
+    """
 
-        # Update each drone
-        for i, drone in enumerate(schedule.drones):
-            ox, oy = interp_path(drone, frame_time)
-            other_points[i].set_data(ox, oy)
+    times, positions = precompute_frames(mission, schedule, fps)
 
-        return [mission_point] + other_points + conflict_markers
+    fig, ax = plt.subplots(figsize=ANIMATION_FIGSIZE)
+    start = positions[0] if len(times) else np.zeros(positions.shape[1:])
+    move = draw_animation_scene(ax, track_lines(mission, schedule, dims=2), start, conflicts)
 
-    frames = np.linspace(t_min, t_max, int((t_max - t_min) * fps))
+    def update(frame):
+        return move(positions[frame], times[frame])
 
-    ani = FuncAnimation(fig, update, frames=frames, interval=1000/fps, blit=True)
+    ani = FuncAnimation(fig, update, frames=len(times), interval=1000/fps, blit=True)
 
     if save_path:
         ani.save(save_path, writer="ffmpeg", fps=fps)
 
     plt.show()
+    return ani
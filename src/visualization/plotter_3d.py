@@ -9,32 +9,50 @@ Provides:
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
-from typing import List, Dict
+from typing import List, Dict, Optional
 from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
-from src.data.models import Mission, FlightSchedule
+from src.data.columnar import ScheduleLike
+from src.data.models import Mission
+from src.visualization.frames import precompute_frames, track_lines
+from src.visualization.lod import lod_layers, schedule_size, use_lod
 
 
 # ---------------------------------------------------
 # 3D STATIC PLOT
 # ---------------------------------------------------
 
+STATIC_FIGSIZE = (10, 10)
+
+
 def plot_3d_static(
     mission: Mission,
-    schedule: FlightSchedule,
+    schedule: ScheduleLike,
     conflicts: List[Dict] = None,
-    save_path: str = None
+    save_path: str = None,
+    lod: Optional[bool] = None,
 ):
     """
     Creates a 3D static plot showing:
     - Primary mission trajectory
     - Other drone trajectories
     - Conflict points in 3D
+
+    `lod` works as in plot_2d_static: decimated trajectories in one
+    collection, clustered conflicts, no per-drone legend.
     """
 
-    fig = plt.figure(figsize=(10, 10))
+    fig = plt.figure(figsize=STATIC_FIGSIZE)
     ax = fig.add_subplot(111, projection="3d")
 
+    if use_lod(schedule, lod):
+        _draw_static_lod(ax, mission, schedule, conflicts)
+        _finish_static(ax, save_path)
+        return
+
+    drones = schedule.drones
+
     # Plot primary mission
     mx = [wp.x for wp in mission.drone.waypoints]
     my = [wp.y for wp in mission.drone.waypoints]
@@ -42,7 +60,7 @@ def plot_3d_static(
     ax.plot(mx, my, mz, '-o', linewidth=2, label=f"Primary Mission: {mission.mission_id}")
 
     # Plot other drones
-    for drone in schedule.drones:
+    for drone in drones:
         ox = [wp.x for wp in drone.waypoints]
         oy = [wp.y for wp in drone.waypoints]
         oz = [wp.z for wp in drone.waypoints]
@@ -57,6 +75,33 @@ def plot_3d_static(
             ax.scatter(cx, cy, cz, color="red", s=80, marker='x')
             ax.text(cx, cy, cz, f"{c['other_drone_id']}", color='red')
 
+    _finish_static(ax, save_path)
+
+
+def _draw_static_lod(ax, mission: Mission, schedule: ScheduleLike, conflicts: List[Dict]):
+    lines, centroids, counts = lod_layers(mission, schedule, conflicts, 3, STATIC_FIGSIZE)
+
+    ax.add_collection3d(Line3DCollection(
+        lines[1:], colors="tab:gray", linewidths=0.5, alpha=0.4,
+        label=f"{schedule_size(schedule)} other drones",
+    ))
+    mission_line = lines[0]
+    ax.plot(mission_line[:, 0], mission_line[:, 1], mission_line[:, 2], '-o', linewidth=2,
+            label=f"Primary Mission: {mission.mission_id}")
+
+    if len(counts):
+        ax.scatter(centroids[:, 0], centroids[:, 1], centroids[:, 2], color="red",
+                   s=60 + 30 * np.sqrt(counts), marker='x', label=f"{int(counts.sum())} conflicts")
+        for (cx, cy, cz), n in zip(centroids, counts):
+            if n > 1:
+                ax.text(cx, cy, cz, f"{n}", color='red')
+
+    # Collections do not grow the 3D data limits on their own
+    points = np.concatenate(lines)
+    ax.auto_scale_xyz(points[:, 0], points[:, 1], points[:, 2])
+
+
+def _finish_static(ax, save_path: str):
     ax.set_title("3D UAV Trajectories")
     ax.set_xlabel("X")
     ax.set_ylabel("Y")
@@ -74,42 +119,31 @@ def plot_3d_static(
 # 4D ANIMATION
 # ---------------------------------------------------
 
-def animate_3d(
-    mission: Mission,
-    schedule: FlightSchedule,
-    conflicts: List[Dict] = None,
-    fps: int = 12,
-    save_path: str = None,
-):
-    """
-    Animate UAV movement in 3D over time (4D visualization).
-    """
-
-    # Get all timestamps
-    times = []
-    times.extend([wp.t for wp in mission.drone.waypoints])
-    for drone in schedule.drones:
-        times.extend([wp.t for wp in drone.waypoints])
+ANIMATION_FIGSIZE = (10, 10)
 
-    t_min, t_max = min(times), max(times)
-    frames = np.linspace(t_min, t_max, int((t_max - t_min) * fps))
 
-    fig = plt.figure(figsize=(10, 10))
-    ax = fig.add_subplot(111, projection="3d")
-
-    # Background path lines
-    for drone in [mission.drone] + schedule.drones:
-        xs = [wp.x for wp in drone.waypoints]
-        ys = [wp.y for wp in drone.waypoints]
-        zs = [wp.z for wp in drone.waypoints]
-        ax.plot(xs, ys, zs, 'k--', alpha=0.3)
+def draw_animation_scene(ax, lines: List[np.ndarray], start: np.ndarray, conflicts: List[Dict] = None):
+    """
+    Draw the 3D animation's static layers on a 3D `ax`: every waypoint
+    path (lines from track_lines, mission first) and the conflict
+    markers, plus one scatter for the drones at `start` ((1 + drones, 3)).
 
-    # Dynamic points
-    mission_point, = ax.plot([], [], [], 'bo', markersize=8)
-    other_points = [
-        ax.plot([], [], [], 'ro')[0]
-        for _ in schedule.drones
-    ]
+    Returns update(frame_positions, frame_time), which moves the drones,
+    orbits the camera and returns the artists it changed.
+    """
+    # Background path lines, one collection for every drone
+    ax.add_collection3d(Line3DCollection(lines, colors="k", linestyles="--", alpha=0.3))
+    waypoints = np.concatenate(lines)
+    ax.auto_scale_xyz(waypoints[:, 0], waypoints[:, 1], waypoints[:, 2])
+
+    # Dynamic points: one scatter for every drone, mission drone first
+    count = len(start)
+    points = ax.scatter(
+        start[:, 0], start[:, 1], start[:, 2],
+        c=["blue"] + ["red"] * (count - 1),
+        s=[64] + [36] * (count - 1),
+        depthshade=False,
+    )
 
     # Conflict markers
     conflict_markers = []
@@ -123,39 +157,44 @@ def animate_3d(
             )
             conflict_markers.append(marker)
 
-    # Helper function: linear interpolation
-    def interp(drone, t):
-        for wp1, wp2 in zip(drone.waypoints[:-1], drone.waypoints[1:]):
-            if wp1.t <= t <= wp2.t:
-                alpha = (t - wp1.t) / (wp2.t - wp1.t)
-                return (
-                    wp1.x + alpha * (wp2.x - wp1.x),
-                    wp1.y + alpha * (wp2.y - wp1.y),
-                    wp1.z + alpha * (wp2.z - wp1.z)
-                )
-        last = drone.waypoints[-1]
-        return (last.x, last.y, last.z)
-
-    # Update frame
-    def update(frame_time):
-        # Mission drone
-        mx, my, mz = interp(mission.drone, frame_time)
-        mission_point.set_data(mx, my)
-        mission_point.set_3d_properties(mz)
-
-        # Other drones
-        for i, drone in enumerate(schedule.drones):
-            x, y, z = interp(drone, frame_time)
-            other_points[i].set_data(x, y)
-            other_points[i].set_3d_properties(z)
+    def update(frame_positions: np.ndarray, frame_time: float):
+        points.set_offsets(frame_positions[:, :2])
+        points.set_3d_properties(frame_positions[:, 2], "z")
 
         ax.view_init(elev=30, azim=40 + frame_time * 2)  # orbit camera slowly
 
-        return [mission_point] + other_points + conflict_markers
+        return [points] + conflict_markers
+
+    return update
+
+
+def animate_3d(
+    mission: Mission,
+    schedule: ScheduleLike,
+    conflicts: List[Dict] = None,
+    fps: int = 12,
+    save_path: str = None,
+):
+    """
+    Animate UAV movement in 3D over time (4D visualization).
+    For headless video files use render.render_animation instead.
+    """
+
+    times, positions = precompute_frames(mission, schedule, fps)
+
+    fig = plt.figure(figsize=ANIMATION_FIGSIZE)
+    ax = fig.add_subplot(111, projection="3d")
+    start = positions[0] if len(times) else np.zeros(positions.shape[1:])
+    move = draw_animation_scene(ax, track_lines(mission, schedule, dims=3), start, conflicts)
+
+    # Update frame
+    def update(frame):
+        return move(positions[frame], times[frame])
 
-    ani = FuncAnimation(fig, update, frames=frames, interval=1000/fps, blit=False)
+    ani = FuncAnimation(fig, update, frames=len(times), interval=1000/fps, blit=False)
 
     if save_path:
         ani.save(save_path, writer="ffmpeg", fps=fps)
 
     plt.show()
+    return ani
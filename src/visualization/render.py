@@ -0,0 +1,142 @@
+"""
+Headless, parallel rendering of the animations to video / GIF files.
+
+The figure is drawn on a plain Agg canvas (never through pyplot), so no
+window is opened and no display is needed. Frame positions are computed
+once (frames.precompute_frames); the frame range is split into chunks,
+worker processes rasterize their chunks to raw RGB buffers, and the
+parent appends the chunks to the output file in frame order, keeping a
+bounded number of chunks in flight. matplotlib is imported only when a
+scene is drawn, and imageio (an optional dependency) only when a file is
+written.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.data.columnar import ScheduleLike
+from src.data.models import Mission
+from src.utils.config import get_config
+from src.utils.logger import get_logger
+from src.visualization.frames import precompute_frames, track_lines
+
+logger = get_logger(__name__)
+
+RENDER_VIEWS = get_config().RENDER_VIEWS
+
+# Per-process scene, built once by _init_scene (in each worker, or in
+# the parent when rendering in-process)
+_scene: Dict = {}
+
+
+def _check_view(view: str) -> None:
+    if view not in RENDER_VIEWS:
+        raise ValueError(f"Unknown render view '{view}' (expected one of {RENDER_VIEWS})")
+
+
+def _init_scene(view: str, lines: List[np.ndarray], start: np.ndarray, conflicts, dpi: int) -> None:
+    """Draw the static scene on an Agg canvas for this process."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    if view == "3d":
+        from src.visualization.plotter_3d import ANIMATION_FIGSIZE, draw_animation_scene
+    else:
+        from src.visualization.plotter_2d import ANIMATION_FIGSIZE, draw_animation_scene
+
+    fig = Figure(figsize=ANIMATION_FIGSIZE, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111, projection="3d" if view == "3d" else None)
+    _scene.update(canvas=canvas, update=draw_animation_scene(ax, lines, start, conflicts))
+
+
+def _render_chunk(positions: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """Rasterize frames to a (n, height, width, 3) uint8 array."""
+    canvas, update = _scene["canvas"], _scene["update"]
+    frames = []
+    for frame_positions, frame_time in zip(positions, times):
+        update(frame_positions, float(frame_time))
+        canvas.draw()
+        frames.append(np.asarray(canvas.buffer_rgba())[..., :3].copy())
+    width, height = canvas.get_width_height()
+    return np.stack(frames) if frames else np.empty((0, height, width, 3), dtype=np.uint8)
+
+
+def _open_writer(path: str, fps: float):
+    try:
+        import imageio.v2 as imageio
+    except ImportError as e:
+        raise ImportError(
+            "Rendering animations to files requires imageio (pip install imageio)"
+        ) from e
+
+    if path.lower().endswith(".gif"):
+        return imageio.get_writer(path, mode="I", duration=1000.0 / fps, loop=0)
+    return imageio.get_writer(path, mode="I", fps=fps)
+
+
+def render_animation(
+    mission: Mission,
+    schedule: ScheduleLike,
+    output_path: str,
+    conflicts: List[Dict] = None,
+    view: str = "2d",
+    fps: Optional[float] = None,
+    workers: Optional[int] = None,
+    chunk_frames: Optional[int] = None,
+    dpi: Optional[int] = None,
+) -> int:
+    """
+    Render animate_2d / animate_3d (view "2d" or "3d") frames straight to
+    a video or GIF without opening a window. The format follows the file
+    extension (.gif, or .mp4 etc. with imageio's ffmpeg plugin).
+
+    fps, workers, chunk_frames and dpi default to Config.ANIMATION_FPS,
+    RENDER_WORKERS (0 = one per CPU core), RENDER_CHUNK_FRAMES and
+    PLOT_DPI. Returns the number of frames written.
+    """
+    _check_view(view)
+    config = get_config()
+    fps = config.ANIMATION_FPS if fps is None else fps
+    workers = config.RENDER_WORKERS if workers is None else workers
+    workers = workers or os.cpu_count() or 1
+    chunk_frames = chunk_frames or config.RENDER_CHUNK_FRAMES
+    dpi = dpi or config.PLOT_DPI
+
+    times, positions = precompute_frames(mission, schedule, fps)
+    lines = track_lines(mission, schedule, dims=3 if view == "3d" else 2)
+    start = positions[0] if len(times) else np.zeros(positions.shape[1:])
+    scene = (view, lines, start, conflicts, dpi)
+    bounds = [(lo, min(lo + chunk_frames, len(times))) for lo in range(0, len(times), chunk_frames)]
+    workers = max(1, min(workers, len(bounds)))
+
+    logger.info(
+        f"Rendering {len(times)} frames ({view}) to {output_path} with {workers} worker(s)"
+    )
+    writer = _open_writer(output_path, fps)
+    try:
+        if workers == 1:
+            _init_scene(*scene)
+            for lo, hi in bounds:
+                for image in _render_chunk(positions[lo:hi], times[lo:hi]):
+                    writer.append_data(image)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_scene, initargs=scene
+            ) as pool:
+                # Keep a couple of chunks per worker queued; write in order
+                pending = []
+                for lo, hi in bounds:
+                    pending.append(pool.submit(_render_chunk, positions[lo:hi], times[lo:hi]))
+                    if len(pending) >= 2 * workers:
+                        for image in pending.pop(0).result():
+                            writer.append_data(image)
+                for future in pending:
+                    for image in future.result():
+                        writer.append_data(image)
+    finally:
+        writer.close()
+    return len(times)
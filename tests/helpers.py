@@ -0,0 +1,8 @@
+"""Shared builders for the test modules."""
+
+from src.data.models import Drone, Waypoint
+
+
+def make_drone(drone_id, points):
+    """Drone with one waypoint per (x, y, z, t) in `points`, ids in order."""
+    return Drone(drone_id, "", "", [Waypoint(i, x, y, z, t) for i, (x, y, z, t) in enumerate(points)])
@@ -30,3 +30,38 @@ def test_run_scenario_2():
     assert scenario_result["expected_status"] == "conflict_detected"
     assert scenario_result["actual_status"] == "conflict_detected"
     assert scenario_result["match"] is True
+
+
+def test_check_airspace_conflicts_from_path():
+    """
+    Airspace sweep over the sample flights returns a consistent
+    pair-indexed report.
+    """
+    from src.query.deconfliction_api import check_airspace_conflicts
+
+    report = check_airspace_conflicts("data/simulated_flights.json")
+
+    assert report["status"] in ["clear", "conflict_detected"]
+    assert report["total_conflicting_pairs"] == len(report["pairs"])
+    for pair in report["pairs"]:
+        assert pair["drone_a"] != pair["drone_b"]
+        assert pair["min_distance"] == min(c["min_distance"] for c in pair["conflicts"])
+
+
+def test_check_missions_conflicts_matches_single_checks():
+    from src.query.deconfliction_api import check_missions_conflicts
+
+    report = check_missions_conflicts(
+        ["mission_1", "mission_2", "mission_1"],
+        "data/simulated_flights.json",
+        missions_path="data/sample_missions.json",
+    )
+
+    assert report["total_missions"] == 3
+    assert set(report["timings"]) == {"load_s", "evaluate_s", "total_s", "per_mission_s"}
+    for result in report["results"]:
+        assert result == check_mission_conflicts(
+            missions_path="data/sample_missions.json",
+            flights_path="data/simulated_flights.json",
+            mission_id=result["mission_id"],
+        )
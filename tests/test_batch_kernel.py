@@ -0,0 +1,134 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.core.batch_kernel import (
+    closest_approach_pairs,
+    find_conflicting_pairs,
+    iter_likely_conflict_pairs,
+    pack_drone_segments,
+    segments_to_array,
+    separation_intervals,
+)
+from src.core.conflict_resolver import (
+    evaluate_segment_pair_analytic,
+    resolve_conflicts_for_mission,
+)
+from src.data.models import Mission
+from src.utils.random_flights import generate_random_drone, generate_random_flight_schedule
+
+
+def test_pack_drone_segments_keeps_order_and_owner():
+    random.seed(1)
+    schedule = generate_random_flight_schedule(num_drones=4)
+
+    packed, owner = pack_drone_segments(schedule.drones)
+
+    expected = [seg for d in schedule.drones for seg in d.to_segments()]
+    assert packed.shape == (len(expected), 8)
+    assert np.allclose(packed, segments_to_array(expected))
+    assert list(owner) == [
+        i for i, d in enumerate(schedule.drones) for _ in d.to_segments()
+    ]
+
+
+def test_closest_approach_pairs_matches_scalar():
+    random.seed(2)
+    segs_a = generate_random_drone("a", max_waypoints=8).to_segments()
+    segs_b = generate_random_drone("b", max_waypoints=8).to_segments()
+
+    pairs = [(a, b) for a in segs_a for b in segs_b]
+    res = closest_approach_pairs(
+        segments_to_array([p[0] for p in pairs]),
+        segments_to_array([p[1] for p in pairs]),
+    )
+
+    for k, (a, b) in enumerate(pairs):
+        scalar = evaluate_segment_pair_analytic(a, b, safety_buffer=50.0)
+        assert res["min_distance"][k] == pytest.approx(scalar["min_distance"])
+        if scalar["conflict_time"] is not None:
+            assert res["conflict_time"][k] == pytest.approx(scalar["conflict_time"])
+
+
+def test_find_conflicting_pairs_independent_of_chunk_size():
+    random.seed(3)
+    schedule = generate_random_flight_schedule(num_drones=20)
+    packed, _ = pack_drone_segments(schedule.drones)
+
+    full = find_conflicting_pairs(packed, packed, 30.0, chunk_size=10**9)
+    tiny = find_conflicting_pairs(packed, packed, 30.0, chunk_size=7)
+
+    order_full = np.lexsort((full["index_b"], full["index_a"]))
+    order_tiny = np.lexsort((tiny["index_b"], tiny["index_a"]))
+    assert np.array_equal(full["index_a"][order_full], tiny["index_a"][order_tiny])
+    assert np.allclose(full["min_distance"][order_full], tiny["min_distance"][order_tiny])
+
+
+def test_vectorized_engine_matches_analytic_engine():
+    random.seed(4)
+    drone = generate_random_drone("mission_drone", max_waypoints=6)
+    mission = Mission("m", "M", "", (0.0, 100.0), drone)
+    schedule = generate_random_flight_schedule(num_drones=30)
+
+    analytic = resolve_conflicts_for_mission(mission, schedule, 40.0, engine="analytic")
+    vectorized = resolve_conflicts_for_mission(
+        mission, schedule, 40.0, engine="vectorized", chunk_size=16
+    )
+
+    assert vectorized["total_conflicts"] == analytic["total_conflicts"] > 0
+    for cv, ca in zip(vectorized["conflicts"], analytic["conflicts"]):
+        assert cv["other_drone_id"] == ca["other_drone_id"]
+        assert cv["min_distance"] == pytest.approx(ca["min_distance"])
+        assert cv["conflict_time"] == pytest.approx(ca["conflict_time"])
+        for axis in "xyz":
+            assert cv["location"][axis] == pytest.approx(ca["location"][axis])
+
+
+def test_likely_pairs_cover_every_conflict():
+    random.seed(5)
+    packed, _ = pack_drone_segments(generate_random_flight_schedule(num_drones=20).drones)
+    seg_a, seg_b = packed[:12], packed[12:]
+    hits = find_conflicting_pairs(seg_a, seg_b, 20.0)
+    chunks = list(iter_likely_conflict_pairs(seg_a, seg_b, 20.0, chunk_size=50))
+
+    assert len(chunks) > 1
+    candidates = [pair for index_a, index_b in chunks for pair in zip(index_a.tolist(), index_b.tolist())]
+    assert set(zip(hits["index_a"].tolist(), hits["index_b"].tolist())) <= set(candidates)
+    assert len(set(candidates)) == len(candidates)
+
+
+def test_separation_intervals_match_sampling():
+    rng = np.random.default_rng(3)
+    k = 300
+    start = rng.uniform(0, 50, (k, 2, 3))
+    end = rng.uniform(0, 50, (k, 2, 3))
+    t0 = rng.uniform(0, 10, (k, 2))
+    t1 = t0 + rng.uniform(1, 10, (k, 2))
+    seg_a = np.column_stack([start[:, 0], end[:, 0], t0[:, 0], t1[:, 0]])
+    seg_b = np.column_stack([start[:, 1], end[:, 1], t0[:, 1], t1[:, 1]])
+    # A few parallel pairs: identical velocity, constant offset
+    seg_b[:20] = seg_a[:20] + np.array([3.0, 0, 0, 3.0, 0, 0, 0, 0])
+
+    res = separation_intervals(seg_a, seg_b, 15.0)
+
+    def position(seg, t):
+        frac = (t - seg[6]) / (seg[7] - seg[6])
+        return seg[:3] + (seg[3:6] - seg[:3]) * frac
+
+    for i in range(k):
+        lo, hi = max(seg_a[i, 6], seg_b[i, 6]), min(seg_a[i, 7], seg_b[i, 7])
+        if lo >= hi:
+            assert not res["valid"][i]
+            continue
+        times = np.linspace(lo, hi, 2001)
+        close = [np.linalg.norm(position(seg_a[i], t) - position(seg_b[i], t)) < 15.0 for t in times]
+        if not any(close):
+            assert not res["valid"][i]
+            continue
+        assert res["valid"][i]
+        inside = times[close]
+        step = times[1] - times[0]
+        assert res["t_enter"][i] == pytest.approx(inside[0], abs=step)
+        assert res["t_exit"][i] == pytest.approx(inside[-1], abs=step)
+    assert res["valid"][:20].all()
@@ -0,0 +1,36 @@
+import pytest
+
+from src.data.loader import (
+    convert_flights_to_binary,
+    convert_missions_to_binary,
+    load_binary_missions,
+    load_binary_schedule,
+    load_missions,
+    load_simulated_flights,
+    load_simulated_flights_columnar,
+)
+
+
+def test_flights_round_trip(tmp_path):
+    path = tmp_path / "flights.uavs"
+    convert_flights_to_binary("data/simulated_flights.json", path)
+
+    loaded = load_binary_schedule(path)
+    assert loaded.drones == load_simulated_flights("data/simulated_flights.json").drones
+    # Numeric columns are views of the file mapping, not copies
+    assert not loaded.x.flags.owndata and not loaded.x.flags.writeable
+    assert load_simulated_flights_columnar(path).drone_ids == loaded.drone_ids
+
+
+def test_missions_round_trip(tmp_path):
+    path = tmp_path / "missions.uavs"
+    convert_missions_to_binary("data/sample_missions.json", path)
+
+    assert load_binary_missions(path) == load_missions("data/sample_missions.json")
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "bogus.uavs"
+    path.write_bytes(b"not a schedule" * 10)
+    with pytest.raises(ValueError):
+        load_binary_schedule(path)
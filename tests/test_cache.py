@@ -0,0 +1,110 @@
+import os
+import shutil
+import threading
+
+import numpy as np
+import pytest
+
+from src.data.cache import ScheduleCache
+from src.data.loader import load_missions, load_simulated_flights_columnar
+
+
+def _copy(tmp_path, name="flights.json"):
+    path = tmp_path / name
+    shutil.copy("data/simulated_flights.json", path)
+    return path
+
+
+def _counting(loader):
+    calls = []
+
+    def wrapped(path):
+        calls.append(path)
+        return loader(path)
+    return wrapped, calls
+
+
+def test_unchanged_file_is_parsed_once(tmp_path):
+    path = _copy(tmp_path)
+    cache = ScheduleCache()
+    loader, calls = _counting(load_simulated_flights_columnar)
+
+    first = cache.load(path, "columnar", loader)
+    assert cache.load(path, "columnar", loader) is first
+
+    # Touching without changing content is still a hit
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert cache.load(path, "columnar", loader) is first
+    assert len(calls) == 1
+
+    path.write_text(path.read_text().replace('"drone_a"', '"drone_z"'))
+    assert cache.load(path, "columnar", loader).drone_ids[0] == "drone_z"
+    assert len(calls) == 2
+
+
+def test_lru_bound_and_invalidation(tmp_path):
+    paths = [_copy(tmp_path, f"f{i}.json") for i in range(3)]
+    cache = ScheduleCache(max_entries=2)
+    loader, calls = _counting(load_simulated_flights_columnar)
+
+    for p in paths:
+        cache.load(p, "columnar", loader)
+    assert len(cache) == 2
+
+    cache.load(paths[0], "columnar", loader)  # evicted, parsed again
+    cache.invalidate(paths[0])
+    cache.load(paths[0], "columnar", loader)
+    assert len(calls) == 5
+
+    with pytest.raises(ValueError):
+        ScheduleCache(max_entries=0)
+
+
+def test_sidecars_survive_a_new_cache(tmp_path):
+    path = _copy(tmp_path)
+    missions = tmp_path / "missions.json"
+    shutil.copy("data/sample_missions.json", missions)
+    loader, calls = _counting(load_simulated_flights_columnar)
+
+    expected = ScheduleCache(sidecar=True).load(path, "columnar", loader)
+    ScheduleCache(sidecar=True).load(missions, "missions", load_missions)
+    # Only schedules get a (.uavs) sidecar; there is nothing to unpickle
+    assert [n.endswith(".uavs") for n in os.listdir(tmp_path) if n.startswith(".")] == [True]
+
+    fresh = ScheduleCache(sidecar=True)
+    reloaded = fresh.load(path, "columnar", loader)
+    assert len(calls) == 1
+    assert np.array_equal(reloaded.x, expected.x)
+    assert fresh.load(missions, "missions", load_missions) == load_missions(missions)
+
+    fresh.invalidate(path, sidecars=True)
+    assert not [n for n in os.listdir(tmp_path) if n.startswith(".flights")]
+
+
+def test_files_are_parsed_outside_the_cache_lock(tmp_path):
+    first, second = _copy(tmp_path, "a.json"), _copy(tmp_path, "b.json")
+    cache = ScheduleCache()
+    second_loaded = threading.Event()
+    calls = []
+
+    def slow_loader(path):
+        calls.append(path)
+        # Only returns if the other file can be loaded meanwhile
+        assert second_loaded.wait(timeout=10)
+        return load_simulated_flights_columnar(path)
+
+    def fast_loader(path):
+        value = load_simulated_flights_columnar(path)
+        second_loaded.set()
+        return value
+
+    waiters = [threading.Thread(target=cache.load, args=(first, "columnar", slow_loader)) for _ in range(3)]
+    for thread in waiters:
+        thread.start()
+    cache.load(second, "columnar", fast_loader)
+    for thread in waiters:
+        thread.join(timeout=10)
+
+    assert len(calls) == 1
+    assert cache.misses == 2 and cache.hits == 2
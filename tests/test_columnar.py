@@ -0,0 +1,74 @@
+import random
+
+import numpy as np
+
+from src.core.batch_kernel import pack_drone_segments
+from src.core.conflict_resolver import resolve_conflicts_for_mission
+from src.data.columnar import ColumnarSchedule
+from src.data.loader import load_missions, load_simulated_flights
+from src.data.models import Waypoint, Drone
+from src.utils.random_flights import generate_random_flight_schedule
+
+
+def test_round_trip_is_lossless():
+    random.seed(5)
+    schedule = generate_random_flight_schedule(num_drones=6)
+
+    columnar = ColumnarSchedule.from_schedule(schedule)
+
+    assert len(columnar) == 6
+    assert columnar.num_waypoints == sum(len(d.waypoints) for d in schedule.drones)
+    assert columnar.to_schedule() == schedule
+
+
+def test_segment_array_matches_drone_segments():
+    drone = Drone(
+        drone_id="d1",
+        name="D1",
+        description="",
+        waypoints=[
+            Waypoint(0, 0.0, 0.0, 0.0, 0.0),
+            Waypoint(1, 10.0, 0.0, 0.0, 10.0),
+            Waypoint(2, 20.0, 0.0, 0.0, 10.0),  # non-increasing time: dropped
+            Waypoint(3, 30.0, 0.0, 0.0, 20.0),
+        ],
+    )
+    other = Drone("d2", "D2", "", [Waypoint(0, 1.0, 1.0, 1.0, 0.0),
+                                   Waypoint(1, 2.0, 2.0, 2.0, 5.0)])
+    columnar = ColumnarSchedule.from_drones([drone, other])
+
+    packed, owner = columnar.segment_array()
+    expected, expected_owner = pack_drone_segments([drone, other])
+
+    assert np.array_equal(packed, expected)
+    assert np.array_equal(owner, expected_owner)
+
+
+def test_resolver_accepts_columnar_schedule():
+    missions = load_missions("data/sample_missions.json")
+    flights = load_simulated_flights("data/simulated_flights.json")
+    columnar = ColumnarSchedule.from_schedule(flights)
+    mission = next(m for m in missions if m.mission_id == "mission_2")
+
+    for engine in ("vectorized", "analytic"):
+        expected = resolve_conflicts_for_mission(mission, flights, 50.0, engine=engine)
+        result = resolve_conflicts_for_mission(mission, columnar, 50.0, engine=engine)
+        assert result == expected
+
+
+def test_slice_and_concat_keep_packed_segments():
+    random.seed(9)
+    columnar = ColumnarSchedule.from_schedule(generate_random_flight_schedule(num_drones=8))
+    columnar.segment_array()
+
+    # Drop drone 3 and append it again at the end
+    spliced = ColumnarSchedule.concat([
+        columnar.slice_drones(0, 3), columnar.slice_drones(4, 8), columnar.slice_drones(3, 4)
+    ])
+    rebuilt = ColumnarSchedule.from_drones(spliced.drones)
+
+    assert spliced._segments is not None
+    assert spliced.drone_ids == rebuilt.drone_ids
+    assert np.array_equal(spliced.offsets, rebuilt.offsets)
+    for joined, expected in zip(spliced.segment_array(), rebuilt.segment_array()):
+        assert np.array_equal(joined, expected)
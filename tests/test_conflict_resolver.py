@@ -1,7 +1,11 @@
+import math
 from src.data.models import Waypoint, Drone, Mission, FlightSchedule
+import pytest
+
 from src.core.conflict_resolver import (
     resolve_conflicts_for_mission,
     evaluate_segment_pair_spatiotemporal,
+    evaluate_segment_pair_analytic,
 )
 
 
@@ -122,3 +126,170 @@ def test_segment_pair_spatiotemporal_no_overlap_time():
     assert result["conflict"] is False
     assert result["min_distance"] == float("inf")
     assert result["conflict_time"] is None
+
+
+def test_segment_pair_analytic_exact_crossing():
+    """
+    Crossing drones meet exactly at (5,0,10) at t=5.
+    """
+    seg_a = ((0.0, 0.0, 10.0), (10.0, 0.0, 10.0), 0.0, 10.0)
+    seg_b = ((5.0, -5.0, 10.0), (5.0, 5.0, 10.0), 0.0, 10.0)
+
+    result = evaluate_segment_pair_analytic(seg_a, seg_b, safety_buffer=1.0)
+
+    assert result["conflict"] is True
+    assert result["min_distance"] == pytest.approx(0.0, abs=1e-9)
+    assert result["conflict_time"] == pytest.approx(5.0)
+    assert result["position_a"] == pytest.approx((5.0, 0.0, 10.0))
+    assert result["position_b"] == pytest.approx((5.0, 0.0, 10.0))
+
+
+def test_segment_pair_analytic_catches_fast_pass_between_samples():
+    """
+    Fast head-on drones pass each other between two sampling instants.
+    Sampling misses the encounter, the closed-form solver does not.
+    """
+    seg_a = ((0.0, 0.0, 0.0), (1000.0, 0.0, 0.0), 0.0, 10.0)
+    seg_b = ((1000.0, 0.0, 0.0), (0.0, 0.0, 0.0), 0.0, 10.0)
+
+    sampled = evaluate_segment_pair_spatiotemporal(
+        seg_a, seg_b, safety_buffer=5.0, num_samples=50
+    )
+    exact = evaluate_segment_pair_analytic(seg_a, seg_b, safety_buffer=5.0)
+
+    assert not sampled["conflict"]
+    assert exact["conflict"] is True
+    assert exact["conflict_time"] == pytest.approx(5.0)
+
+
+def test_resolve_conflicts_unknown_engine():
+    drone = Drone(
+        drone_id="d",
+        name="D",
+        description="",
+        waypoints=[
+            _make_waypoint(0, 0.0, 0.0, 0.0, 0.0),
+            _make_waypoint(1, 1.0, 0.0, 0.0, 1.0),
+        ],
+    )
+    mission = Mission("m", "M", "", (0.0, 1.0), drone)
+
+    with pytest.raises(ValueError):
+        resolve_conflicts_for_mission(
+            mission, FlightSchedule(drones=[]), safety_buffer=1.0, engine="bogus"
+        )
+
+
+def test_airspace_sweep_matches_pairwise_mission_checks():
+    """
+    Every conflicting drone pair is reported once, with the same
+    segment-level conflicts as checking each drone against later ones.
+    """
+    import random
+
+    from src.core.conflict_resolver import resolve_airspace_conflicts
+    from src.utils.random_flights import generate_random_flight_schedule
+
+    random.seed(21)
+    schedule = generate_random_flight_schedule(num_drones=40, area_size=300.0)
+
+    report = resolve_airspace_conflicts(schedule, safety_buffer=25.0, chunk_size=50)
+
+    expected = {}
+    for i, drone in enumerate(schedule.drones):
+        mission = Mission(drone.drone_id, "", "", (0.0, 100.0), drone)
+        later = FlightSchedule(drones=schedule.drones[i + 1:])
+        result = resolve_conflicts_for_mission(mission, later, 25.0, engine="analytic")
+        for c in result["conflicts"]:
+            expected.setdefault((drone.drone_id, c["other_drone_id"]), []).append(
+                c["min_distance"]
+            )
+
+    got = {
+        (p["drone_a"], p["drone_b"]): [c["min_distance"] for c in p["conflicts"]]
+        for p in report["pairs"]
+    }
+    assert report["total_conflicting_pairs"] == len(expected) > 0
+    assert got.keys() == expected.keys()
+    for key in expected:
+        assert sorted(got[key]) == pytest.approx(sorted(expected[key]))
+
+
+def test_batched_missions_match_one_at_a_time():
+    from src.core.conflict_resolver import resolve_conflicts_for_missions
+    from src.data.loader import load_missions, load_simulated_flights
+
+    missions = load_missions("data/sample_missions.json")
+    schedule = load_simulated_flights("data/simulated_flights.json")
+
+    for pruning in ("none", "tree"):
+        batched = resolve_conflicts_for_missions(missions, schedule, 10.0, pruning=pruning)
+        single = [
+            resolve_conflicts_for_mission(m, schedule, 10.0, pruning=pruning)
+            for m in missions
+        ]
+        assert batched == single
+    assert resolve_conflicts_for_missions([], schedule, 10.0) == []
+
+
+def test_first_conflict_only_agrees_with_full_check():
+    import random
+    from src.core.conflict_resolver import is_mission_clear
+    from src.utils.random_flights import generate_random_flight_schedule
+
+    random.seed(3)
+    schedule = generate_random_flight_schedule(num_drones=30, area_size=300.0)
+    for drone in generate_random_flight_schedule(num_drones=8, area_size=300.0).drones:
+        mission = Mission(drone.drone_id, "", "", (0.0, 100.0), drone)
+        full = resolve_conflicts_for_mission(mission, schedule, 15.0)
+
+        for engine, pruning in (("vectorized", "none"), ("vectorized", "grid"), ("analytic", "tree")):
+            quick = resolve_conflicts_for_mission(
+                mission, schedule, 15.0, engine=engine, pruning=pruning, first_conflict_only=True
+            )
+            assert quick["status"] == full["status"]
+            assert quick["total_conflicts"] == min(full["total_conflicts"], 1)
+            if quick["conflicts"]:
+                found = quick["conflicts"][0]
+                assert found["min_distance"] < 15.0
+                assert found["other_drone_id"] in {c["other_drone_id"] for c in full["conflicts"]}
+
+        assert is_mission_clear(mission, schedule, 15.0) == (full["status"] == "clear")
+
+
+def test_intervals_merge_a_long_encounter():
+    # The other drone shadows the mission 5 m away across three segments
+    path = [(0, 0, 0.0), (50, 0, 25.0), (50, 50, 50.0), (100, 50, 75.0)]
+    mission_drone = Drone("m", "", "", [Waypoint(i, x, y, 10.0, t) for i, (x, y, t) in enumerate(path)])
+    shadow = Drone("s", "", "", [Waypoint(i, x, y, 15.0, t) for i, (x, y, t) in enumerate(path)])
+    # A crossing drone that is only briefly within 10 m
+    crossing = Drone("c", "", "", [Waypoint(0, 25, -50, 10.0, 0.0), Waypoint(1, 25, 50, 10.0, 25.0)])
+
+    mission = Mission("m", "", "", (0.0, 75.0), mission_drone)
+    schedule = FlightSchedule(drones=[shadow, crossing])
+
+    points = resolve_conflicts_for_mission(mission, schedule, 10.0)
+    merged = resolve_conflicts_for_mission(mission, schedule, 10.0, intervals=True)
+
+    assert sum(c["other_drone_id"] == "s" for c in points["conflicts"]) > 1
+    by_drone = {c["other_drone_id"]: c for c in merged["conflicts"]}
+    assert merged["total_conflicts"] == 2
+    assert by_drone["s"]["t_enter"] == pytest.approx(0.0)
+    assert by_drone["s"]["t_exit"] == pytest.approx(75.0)
+    assert by_drone["s"]["min_distance"] == pytest.approx(5.0)
+
+    # Mission at x = 2t, crossing drone at y = 4t - 50: distance < 10 near t = 12.5
+    c = by_drone["c"]
+    assert c["t_enter"] < c["conflict_time"] < c["t_exit"]
+    for t in (c["t_enter"], c["t_exit"]):
+        assert math.hypot(2 * t - 25, 4 * t - 50) == pytest.approx(10.0)
+
+
+def test_intervals_cannot_stop_at_first_conflict():
+    drone = Drone("m", "", "", [Waypoint(0, 0, 0, 10.0, 0.0), Waypoint(1, 50, 0, 10.0, 25.0)])
+    mission = Mission("m", "", "", (0.0, 25.0), drone)
+
+    with pytest.raises(ValueError):
+        resolve_conflicts_for_mission(
+            mission, FlightSchedule(drones=[]), 10.0, first_conflict_only=True, intervals=True
+        )
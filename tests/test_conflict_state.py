@@ -0,0 +1,75 @@
+import copy
+import random
+
+from src.core.conflict_resolver import resolve_airspace_conflicts
+from src.core.conflict_state import ConflictStateStore
+from src.data.loader import load_simulated_flights
+from src.data.models import Waypoint, Drone, FlightSchedule
+from src.utils.random_flights import generate_random_flight_schedule
+
+
+BUFFER = 10.0
+
+
+def _pair_summary(pairs):
+    return {
+        (p.drone_a, p.drone_b): (round(p.min_distance, 6), len(p.conflicts))
+        for p in pairs
+    }
+
+
+def _sweep_summary(drones):
+    report = resolve_airspace_conflicts(FlightSchedule(drones=drones), BUFFER)
+    return {
+        tuple(sorted((p["drone_a"], p["drone_b"]))): (round(p["min_distance"], 6), len(p["conflicts"]))
+        for p in report["pairs"]
+    }
+
+
+def test_seeded_state_matches_airspace_sweep():
+    schedule = load_simulated_flights("data/simulated_flights.json")
+    store = ConflictStateStore.from_schedule(schedule, BUFFER)
+
+    assert _pair_summary(store.pairs()) == _sweep_summary(schedule.drones)
+
+
+def test_add_modify_remove_emit_diffs():
+    store = ConflictStateStore(BUFFER)
+    a = Drone("a", "A", "", [Waypoint(0, 0, 0, 10, 0), Waypoint(1, 100, 0, 10, 100)])
+    b = Drone("b", "B", "", [Waypoint(0, 50, -50, 10, 0), Waypoint(1, 50, 50, 10, 100)])
+
+    assert not store.add_flight(a)
+    diff = store.add_flight(b)
+    assert [p.key for p in diff.new] == [("a", "b")]
+
+    # Re-filing an identical flight is a no-op
+    assert not store.add_flight(copy.deepcopy(b))
+
+    # Shift b's crossing later: still in conflict, but somewhere else
+    moved = copy.deepcopy(b)
+    moved.waypoints[0].x = moved.waypoints[1].x = 60.0
+    diff = store.update_flight(moved)
+    assert [p.key for p in diff.changed] == [("a", "b")]
+    assert not diff.new and not diff.cleared
+
+    diff = store.remove_flight("a")
+    assert [p.key for p in diff.cleared] == [("a", "b")]
+    assert len(store) == 0 and "a" not in store
+
+
+def test_incremental_updates_match_full_recompute():
+    random.seed(7)
+    drones = generate_random_flight_schedule(
+        num_drones=25, area_size=150.0, t_min=0.0, t_max=100.0
+    ).drones
+    store = ConflictStateStore.from_schedule(FlightSchedule(drones=drones[:20]), BUFFER)
+    live = list(drones[:20])
+
+    for drone in drones[20:]:
+        store.add_flight(drone)
+        live.append(drone)
+    for drone_id in [d.drone_id for d in drones[::4]]:
+        store.remove_flight(drone_id)
+        live = [d for d in live if d.drone_id != drone_id]
+
+    assert _pair_summary(store.pairs()) == _sweep_summary(live)
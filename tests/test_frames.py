@@ -0,0 +1,55 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pytest
+
+from src.data.columnar import ColumnarSchedule
+from src.data.models import FlightSchedule, Mission
+from src.visualization.frames import precompute_frames, track_lines
+from src.visualization.plotter_2d import animate_2d
+from src.visualization.plotter_3d import animate_3d
+from tests.helpers import make_drone
+
+
+@pytest.fixture
+def mission_and_schedule():
+    mission = Mission("m", "", "", (0.0, 4.0), make_drone("m", [(0, 0, 0, 0.0), (40, 0, 20, 4.0)]))
+    schedule = FlightSchedule(drones=[
+        make_drone("a", [(0, 10, 5, 1.0), (0, 30, 5, 3.0)]),
+        make_drone("b", [(10, 10, 0, 0.0), (20, 10, 0, 2.0), (20, 20, 10, 4.0)]),
+    ])
+    return mission, schedule
+
+
+def test_precompute_frames_positions(mission_and_schedule):
+    mission, schedule = mission_and_schedule
+    for s in (schedule, ColumnarSchedule.from_schedule(schedule)):
+        times, positions = precompute_frames(mission, s, fps=2)
+
+        assert positions.shape == (len(times), 3, 3)
+        assert times[0] == 0.0 and times[-1] == 4.0
+        k = int(np.searchsorted(times, 2.0))
+        t = times[k]
+        np.testing.assert_allclose(positions[k, 0], [10 * t, 0, 5 * t])
+        # Drone a holds its first position before take-off
+        np.testing.assert_allclose(positions[0, 1], [0, 10, 5])
+        np.testing.assert_allclose(positions[-1, 2], [20, 20, 10])
+
+        lines = track_lines(mission, s, dims=3)
+        assert [len(line) for line in lines] == [2, 2, 3]
+
+
+@pytest.mark.parametrize("animate", [animate_2d, animate_3d])
+def test_animation_renders_every_frame(animate, mission_and_schedule, tmp_path, monkeypatch):
+    import matplotlib.pyplot as plt
+
+    monkeypatch.setattr(plt, "show", lambda: None)
+    mission, schedule = mission_and_schedule
+    conflicts = [{"location": {"x": 5, "y": 5, "z": 5}, "other_drone_id": "a", "conflict_time": 1.0}]
+
+    ani = animate(mission, schedule, conflicts=conflicts, fps=2)
+    ani.save(tmp_path / "replay.gif", writer="pillow", fps=2)
+    plt.close("all")
+    assert (tmp_path / "replay.gif").stat().st_size > 0
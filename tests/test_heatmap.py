@@ -0,0 +1,77 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pytest
+
+from src.data.binary_format import read_binary_schedule, write_binary_schedule
+from src.data.columnar import ColumnarSchedule
+from src.data.models import FlightSchedule
+from src.visualization.heatmap import (
+    conflict_density,
+    hotspots,
+    occupancy_grid,
+    plot_occupancy_heatmaps,
+    schedule_extent,
+)
+from tests.helpers import make_drone
+
+
+def _random_schedule(count, seed=5):
+    rng = np.random.default_rng(seed)
+    drones = []
+    for i in range(count):
+        t = np.sort(rng.uniform(0, 300, 6))
+        xyz = rng.uniform(0, 1000, (6, 3))
+        drones.append(make_drone(f"d{i}", [(*p, s) for p, s in zip(xyz, t)]))
+    return FlightSchedule(drones=drones)
+
+
+def test_occupancy_counts_samples_per_window_and_cell():
+    # 10 m/s along x for 10 s, sampled every second: 5 samples per cell
+    schedule = FlightSchedule(drones=[make_drone("a", [(0, 0, 0, 0.0), (100, 0, 0, 10.0)])])
+    grid = occupancy_grid(schedule, cell_size=50.0, window=5.0, sample_step=1.0)
+
+    assert grid.shape == (3, 3, 1)
+    assert grid.counts[0, 0, 0] == 5 and grid.counts[1, 1, 0] == 5
+    assert grid.counts.sum() == 10
+    np.testing.assert_allclose(grid.occupancy[0, 0, 0], 1.0)
+    assert hotspots(grid, top=1)[0]["window"] == (0.0, 5.0)
+
+
+def test_chunked_sources_match(tmp_path):
+    schedule = _random_schedule(40)
+    columnar = ColumnarSchedule.from_schedule(schedule)
+    write_binary_schedule(columnar, tmp_path / "flights.uavs")
+    mapped, _ = read_binary_schedule(tmp_path / "flights.uavs")
+    bounds = schedule_extent(columnar)
+    settings = dict(bounds=bounds, cell_size=100.0, window=30.0, sample_step=0.5)
+
+    expected = occupancy_grid(columnar, **settings)
+    assert expected.counts.sum() > 0
+    for source in (schedule, mapped, iter(schedule.drones)):
+        grid = occupancy_grid(source, chunk_drones=7, chunk_samples=50, **settings)
+        np.testing.assert_array_equal(grid.counts, expected.counts)
+
+    with pytest.raises(ValueError):
+        occupancy_grid(iter(schedule.drones))
+
+
+def test_conflict_overlay_and_plot(tmp_path, monkeypatch):
+    import matplotlib.pyplot as plt
+
+    monkeypatch.setattr(plt, "show", lambda: None)
+    grid = occupancy_grid(_random_schedule(10), cell_size=250.0, window=100.0)
+    conflicts = [
+        {"conflict_time": 10.0, "location": {"x": 10.0, "y": 10.0, "z": 5.0}},
+        {"conflict_time": 20.0, "location_a": {"x": 0.0, "y": 0.0, "z": 0.0},
+         "location_b": {"x": 20.0, "y": 20.0, "z": 0.0}},
+        {"conflict_time": 1e6, "location": {"x": 10.0, "y": 10.0, "z": 5.0}},  # outside the grid
+    ]
+    density = conflict_density(grid, conflicts)
+    assert density[0, 0, 0] == 2 and density.sum() == 2
+
+    plot_occupancy_heatmaps(grid, conflicts=conflicts, save_path=tmp_path / "heat.png")
+    plt.close("all")
+    assert (tmp_path / "heat.png").stat().st_size > 0
@@ -0,0 +1,67 @@
+import json
+
+import numpy as np
+import pytest
+
+from src.data.columnar import ColumnarSchedule
+from src.data.loader import (
+    iter_flights,
+    iter_json_array,
+    load_missions,
+    load_simulated_flights,
+    load_simulated_flights_columnar,
+    load_waypoints,
+)
+
+
+FLIGHTS = "data/simulated_flights.json"
+
+
+def test_streamed_array_matches_json_load():
+    with open(FLIGHTS) as f:
+        expected = json.load(f)["flights"]
+
+    # A tiny chunk size forces values to straddle buffer boundaries
+    assert list(iter_json_array(FLIGHTS, "flights", chunk_size=5)) == expected
+    assert list(iter_json_array(FLIGHTS, "missing")) == []
+
+
+def test_ndjson_flights(tmp_path):
+    with open(FLIGHTS) as f:
+        records = json.load(f)["flights"]
+    path = tmp_path / "flights.ndjson"
+    path.write_text("\n".join(json.dumps(r) for r in records) + "\n\n")
+
+    streamed = list(iter_flights(path))
+    assert streamed == load_simulated_flights(FLIGHTS).drones
+
+
+def test_columnar_stream_matches_schedule():
+    schedule = load_simulated_flights(FLIGHTS)
+    streamed = load_simulated_flights_columnar(FLIGHTS)
+    expected = ColumnarSchedule.from_schedule(schedule)
+
+    assert streamed.drone_ids == expected.drone_ids
+    assert np.array_equal(streamed.offsets, expected.offsets)
+    assert np.array_equal(streamed.t, expected.t)
+    assert streamed.drones == schedule.drones
+
+
+def test_missions_still_load():
+    assert [m.mission_id for m in load_missions("data/sample_missions.json")][:2] == [
+        "mission_1", "mission_2"
+    ]
+
+
+def test_truncated_file_raises(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text(open(FLIGHTS).read()[:200])
+    with pytest.raises(ValueError):
+        list(iter_flights(path))
+
+
+def test_bad_waypoints_raise_value_error():
+    with pytest.raises(ValueError, match="Waypoint missing required field: 'timestamp'"):
+        load_waypoints([{"id": 0, "x": 1, "y": 2}])
+    with pytest.raises(ValueError):
+        load_waypoints([{"id": 0, "x": "east", "y": 2, "timestamp": 0}])
@@ -0,0 +1,63 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pytest
+
+from src.data.columnar import ColumnarSchedule
+from src.data.models import FlightSchedule, Mission
+from src.visualization.lod import cluster_points, decimate_tracks, use_lod
+from src.visualization.plotter_2d import plot_2d_static
+from src.visualization.plotter_3d import plot_3d_static
+from tests.helpers import make_drone
+
+
+def test_decimate_tracks_keeps_endpoints_and_moves():
+    lines = [
+        np.array([[0.0, 0.0], [0.1, 0.0], [0.2, 0.1], [5.0, 0.0], [5.1, 0.0]]),
+        np.empty((0, 2)),
+        np.array([[1.0, 1.0]]),
+        np.array([[0.0, 0.0], [0.1, 0.1]]),
+    ]
+    kept = decimate_tracks(lines, pixel=1.0)
+
+    np.testing.assert_array_equal(kept[0], [[0.0, 0.0], [5.0, 0.0], [5.1, 0.0]])
+    assert kept[1].shape == (0, 2)
+    np.testing.assert_array_equal(kept[2], lines[2])
+    np.testing.assert_array_equal(kept[3], lines[3])
+
+
+def test_cluster_points_counts_and_centroids():
+    centroids, counts = cluster_points(np.array([[0.1, 0.1], [0.2, 0.3], [5.0, 5.0]]), cell=1.0)
+
+    np.testing.assert_allclose(centroids, [[0.15, 0.2], [5.0, 5.0]])
+    np.testing.assert_array_equal(counts, [2, 1])
+    assert cluster_points(np.empty((0, 3)), cell=1.0)[1].size == 0
+
+
+@pytest.mark.parametrize("plot", [plot_2d_static, plot_3d_static])
+def test_lod_static_plot_has_one_collection_and_short_legend(plot, monkeypatch):
+    import matplotlib.pyplot as plt
+
+    monkeypatch.setattr(plt, "show", lambda: None)
+    rng = np.random.default_rng(3)
+    drones = [
+        make_drone(f"d{i}", [(*rng.uniform(0, 500, 3), t) for t in np.arange(0.0, 40.0, 2.0)])
+        for i in range(200)
+    ]
+    schedule = ColumnarSchedule.from_schedule(FlightSchedule(drones=drones))
+    mission = Mission("m", "", "", (0.0, 40.0), make_drone("m", [(0, 0, 0, 0.0), (500, 500, 100, 40.0)]))
+    conflicts = [
+        {"location": {"x": 250.0 + d, "y": 250.0, "z": 50.0}, "other_drone_id": "d0", "conflict_time": 1.0}
+        for d in (0.0, 0.5, 1.0)
+    ]
+    assert use_lod(schedule)
+
+    plot(mission, schedule, conflicts=conflicts)
+    ax = plt.gcf().axes[0]
+    labels = [text.get_text() for text in ax.get_legend().get_texts()]
+    plt.close("all")
+
+    assert len(ax.collections) == 2  # background tracks + one clustered conflict marker
+    assert labels == ["200 other drones", "Primary Mission: m", "3 conflicts"]
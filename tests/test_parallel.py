@@ -0,0 +1,53 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.core.conflict_resolver import resolve_conflicts_for_mission
+from src.data.columnar import ColumnarSchedule
+from src.core import parallel
+from src.core.parallel import shard_bounds
+from src.data.models import Mission
+from src.utils.random_flights import generate_random_drone, generate_random_flight_schedule
+
+
+def test_shard_bounds_cover_rows_without_splitting_drones():
+    owner = np.array([0, 0, 0, 1, 2, 2, 3, 3, 3, 3], dtype=np.int64)
+
+    shards = shard_bounds(owner, 3)
+
+    assert shards[0][0] == 0 and shards[-1][1] == len(owner)
+    for (lo, hi), (next_lo, _) in zip(shards[:-1], shards[1:]):
+        assert hi == next_lo
+        assert owner[hi - 1] != owner[hi]
+
+
+def test_parallel_workers_match_single_process():
+    random.seed(31)
+    drone = generate_random_drone("mission_drone", max_waypoints=6)
+    mission = Mission("m", "M", "", (0.0, 100.0), drone)
+    schedule = generate_random_flight_schedule(num_drones=60)
+
+    single = resolve_conflicts_for_mission(mission, schedule, 30.0)
+    multi = resolve_conflicts_for_mission(mission, schedule, 30.0, workers=3, chunk_size=8)
+
+    assert multi["total_conflicts"] == single["total_conflicts"] > 0
+    for cm, cs in zip(multi["conflicts"], single["conflicts"]):
+        assert cm["other_drone_id"] == cs["other_drone_id"]
+        assert cm["min_distance"] == pytest.approx(cs["min_distance"])
+
+
+def test_shared_block_is_reused_for_the_same_segments():
+    random.seed(32)
+    drone = generate_random_drone("mission_drone", max_waypoints=6)
+    mission = Mission("m", "M", "", (0.0, 100.0), drone)
+    schedule = ColumnarSchedule.from_schedule(generate_random_flight_schedule(num_drones=40))
+
+    resolve_conflicts_for_mission(mission, schedule, 1e6, workers=2, chunk_size=8)
+    shm = parallel._shared[1]
+    resolve_conflicts_for_mission(mission, schedule, 1e6, workers=2, chunk_size=8)
+
+    assert parallel._shared[0] is schedule.segment_array()[0]
+    assert parallel._shared[1] is shm
+    parallel.release_shared()
+    assert parallel._shared is None
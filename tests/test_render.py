@@ -0,0 +1,42 @@
+import imageio.v2 as imageio
+import numpy as np
+import pytest
+
+from src.data.models import FlightSchedule, Mission
+from src.visualization.render import render_animation
+from tests.helpers import make_drone
+
+
+@pytest.fixture
+def mission_and_schedule():
+    mission = Mission("m", "", "", (0.0, 4.0), make_drone("m", [(0, 0, 0, 0.0), (40, 0, 20, 4.0)]))
+    schedule = FlightSchedule(drones=[
+        make_drone("a", [(0, 10, 5, 1.0), (0, 30, 5, 3.0)]),
+        make_drone("b", [(10, 10, 0, 0.0), (20, 10, 0, 2.0), (20, 20, 10, 4.0)]),
+    ])
+    return mission, schedule
+
+
+@pytest.mark.parametrize("view", ["2d", "3d"])
+def test_parallel_render_matches_in_process(mission_and_schedule, tmp_path, view):
+    mission, schedule = mission_and_schedule
+    serial = tmp_path / "serial.gif"
+    parallel = tmp_path / "parallel.gif"
+
+    count = render_animation(mission, schedule, str(serial), view=view, fps=3, workers=1, dpi=40)
+    render_animation(
+        mission, schedule, str(parallel), view=view, fps=3, workers=2, chunk_frames=4, dpi=40
+    )
+
+    frames = imageio.mimread(serial)
+    assert count == len(frames) == 12
+    size = {"2d": 8, "3d": 10}[view] * 40  # figure inches x dpi
+    assert frames[0].shape == (size, size, 3)
+    for a, b in zip(frames, imageio.mimread(parallel)):
+        np.testing.assert_array_equal(a, b)
+
+
+def test_render_rejects_unknown_view(mission_and_schedule, tmp_path):
+    mission, schedule = mission_and_schedule
+    with pytest.raises(ValueError):
+        render_animation(mission, schedule, str(tmp_path / "x.gif"), view="4d")
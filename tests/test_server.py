@@ -0,0 +1,127 @@
+import asyncio
+import json
+import socket
+import urllib.error
+import urllib.request
+
+from src.query.server import DeconflictionServer
+from src.query.service import DeconflictionService
+
+
+MISSIONS = "data/sample_missions.json"
+FLIGHTS = "data/simulated_flights.json"
+
+
+def _post(base, path, payload):
+    request = urllib.request.Request(
+        base + path,
+        data=json.dumps(payload).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def _run(client):
+    """Start a server on a free port and run `client(base_url)` in a thread."""
+    async def main():
+        service = DeconflictionService.from_files(MISSIONS, FLIGHTS)
+        server = DeconflictionServer(service)
+        host, port = await server.start("127.0.0.1", 0)
+        try:
+            return await asyncio.to_thread(client, f"http://{host}:{port}", service)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+def test_check_mission_matches_service():
+    def client(base, service):
+        status, body = _post(base, "/missions/check", {"mission_id": "mission_2"})
+        assert status == 200
+        assert body == json.loads(json.dumps(service.check_mission("mission_2")))
+
+    _run(client)
+
+
+def test_concurrent_checks_are_batched():
+    def client(base, service):
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(8) as pool:
+            replies = list(pool.map(
+                lambda i: _post(base, "/missions/check", {"mission_id": f"mission_{1 + i % 2}"}),
+                range(16),
+            ))
+        assert all(status == 200 for status, _ in replies)
+        assert {body["mission_id"] for _, body in replies} == {"mission_1", "mission_2"}
+
+    _run(client)
+
+
+def test_filed_flight_is_seen_by_later_checks():
+    flight = {
+        "id": "intruder",
+        "name": "Intruder",
+        "description": "Sits on mission_1's first waypoint",
+        "waypoints": [
+            {"id": 0, "x": 0.0, "y": 0.0, "z": 10.0, "timestamp": 0.0},
+            {"id": 1, "x": 0.0, "y": 0.0, "z": 10.0, "timestamp": 10.0},
+        ],
+    }
+
+    def client(base, service):
+        assert _post(base, "/flights", flight) == (201, {"filed": ["intruder"]})
+        status, body = _post(base, "/missions/check", {"mission_id": "mission_1"})
+        assert status == 200
+        assert "intruder" in {c["other_drone_id"] for c in body["conflicts"]}
+
+    _run(client)
+
+
+def test_bad_requests():
+    def client(base, service):
+        assert _post(base, "/missions/check", {"mission_id": "nope"})[0] == 404
+        assert _post(base, "/missions/check", {})[0] == 400
+        assert _post(base, "/missions/check", {"mission": {"drone": {}}})[0] == 400
+        assert _post(base, "/flights", {"flights": [{"drone_id": "x"}]})[0] == 400
+        assert _post(base, "/unknown", {})[0] == 404
+
+    _run(client)
+
+
+def _raw_status(base, content_length):
+    host, port = base.rsplit("/", 1)[-1].split(":")
+    with socket.create_connection((host, int(port)), timeout=10) as sock:
+        sock.sendall(
+            f"POST /missions/check HTTP/1.1\r\nContent-Length: {content_length}\r\n\r\n".encode()
+        )
+        return int(sock.recv(4096).split()[1])
+
+
+def test_invalid_content_length_is_a_bad_request():
+    def client(base, service):
+        assert _raw_status(base, "abc") == 400
+        assert _raw_status(base, "-5") == 400
+
+    _run(client)
+
+
+def test_evaluation_errors_are_not_reported_as_unknown_missions():
+    def client(base, service):
+        def fail(*args, **kwargs):
+            raise ValueError("bad mission data")
+
+        service.check_missions = fail
+        service.check_mission = fail
+        assert _post(base, "/missions/check", {"mission_id": "mission_2"}) == (
+            500, {"error": "bad mission data"}
+        )
+        assert _post(base, "/missions/check", {"mission_id": "mission_2", "first_conflict_only": True})[0] == 500
+        assert _post(base, "/missions/check", {"mission_id": "nope"})[0] == 404
+
+    _run(client)
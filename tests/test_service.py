@@ -0,0 +1,107 @@
+import os
+import shutil
+
+import pytest
+
+from src.data.models import Waypoint, Drone
+from src.query.service import DeconflictionService, get_service
+from src.utils.config import get_config
+
+
+MISSIONS = "data/sample_missions.json"
+FLIGHTS = "data/simulated_flights.json"
+
+
+def test_shared_service_is_loaded_once():
+    first = get_service(MISSIONS, FLIGHTS)
+    second = get_service(MISSIONS, FLIGHTS)
+
+    assert first is second
+    assert first.check_mission("mission_2")["status"] == "conflict_detected"
+
+
+def test_file_and_cancel_flights():
+    service = DeconflictionService.from_files(MISSIONS, FLIGHTS)
+    mission = service.get_mission("mission_1")
+    twin = Drone("twin", "Twin", "", [
+        Waypoint(wp.id, wp.x, wp.y, wp.z, wp.t) for wp in mission.drone.waypoints
+    ])
+
+    service.add_flight(twin)
+    assert "twin" in {c["other_drone_id"] for c in service.check_mission(mission)["conflicts"]}
+
+    assert service.remove_flight("twin") is True
+    assert service.remove_flight("twin") is False
+    assert "twin" not in {c["other_drone_id"] for c in service.check_mission(mission)["conflicts"]}
+
+
+def test_live_index_tracks_filed_flights():
+    config = get_config()
+    config.PRUNING = "tree"
+    service = DeconflictionService.from_files(MISSIONS, FLIGHTS, config=config)
+    plain = DeconflictionService.from_files(MISSIONS, FLIGHTS)
+
+    assert service.check_mission("mission_2") == plain.check_mission("mission_2")
+
+    mission = service.get_mission("mission_2")
+    twin = Drone("twin", "Twin", "", list(mission.drone.waypoints))
+    service.add_flight(twin)
+    plain.add_flight(twin)
+
+    assert service.check_mission("mission_2") == plain.check_mission("mission_2")
+
+
+def test_unknown_mission_raises():
+    service = DeconflictionService.from_files(MISSIONS, FLIGHTS)
+    with pytest.raises(ValueError):
+        service.check_mission("no_such_mission")
+
+
+def test_shared_service_reloads_when_files_change(tmp_path):
+    missions = tmp_path / "missions.json"
+    flights = tmp_path / "flights.json"
+    shutil.copy(MISSIONS, missions)
+    shutil.copy(FLIGHTS, flights)
+
+    first = get_service(str(missions), str(flights))
+    stat = os.stat(flights)
+    os.utime(flights, (stat.st_atime, stat.st_mtime + 10))
+
+    assert first.is_stale()
+    assert get_service(str(missions), str(flights)) is not first
+
+
+def test_conflict_state_follows_filed_flights():
+    service = DeconflictionService.from_files(MISSIONS, FLIGHTS)
+    assert service.add_flight(Drone("early", "Early", "", [])) is None
+
+    state = service.conflict_state
+    flight = service.get_mission("mission_2").drone
+    diff = service.add_flight(Drone("twin", "Twin", "", list(flight.waypoints)))
+
+    assert {p.key for p in diff.new} == {p.key for p in state.conflicts_for("twin")}
+    assert diff.new
+    service.remove_flight("twin")
+    assert state.conflicts_for("twin") == []
+
+
+def test_reload_replays_runtime_flights(tmp_path):
+    missions = tmp_path / "missions.json"
+    flights = tmp_path / "flights.json"
+    shutil.copy(MISSIONS, missions)
+    shutil.copy(FLIGHTS, flights)
+
+    first = get_service(str(missions), str(flights))
+    cancelled = first.schedule.drone_ids[0]
+    twin = Drone("twin", "Twin", "", list(first.get_mission("mission_2").drone.waypoints))
+    first.add_flight(twin)
+    first.remove_flight(cancelled)
+
+    stat = os.stat(flights)
+    os.utime(flights, (stat.st_atime, stat.st_mtime + 10))
+    reloaded = get_service(str(missions), str(flights))
+
+    assert reloaded is not first
+    assert reloaded.schedule.drone_ids == first.schedule.drone_ids
+    assert "twin" in reloaded.schedule.drone_ids
+    assert cancelled not in reloaded.schedule.drone_ids
@@ -1,7 +1,11 @@
 import numpy as np
+import pytest
+
 from src.core.spatial_checker import (
     compute_min_distance_segment_segment,
-    check_spatial_conflict
+    check_spatial_conflict,
+    check_spatial_conflicts,
+    segment_distances,
 )
 
 
@@ -30,3 +34,39 @@ def test_segments_with_altitude_separation():
     res = check_spatial_conflict(A0, A1, B0, B1, safety_buffer=5.0)
     assert res["conflict"] is False
     assert res["distance"] == 10
+
+
+def test_parallel_offset_segments_clamp_to_nearest_endpoints():
+    # Collinear-ish segments that do not overlap: closest pair is A1-B0
+    res = compute_min_distance_segment_segment((0, 0, 0), (10, 0, 0), (20, 1, 0), (30, 1, 0))
+    assert res["distance"] == pytest.approx(np.hypot(10, 1))
+    np.testing.assert_allclose(res["point_on_A"], (10, 0, 0))
+    np.testing.assert_allclose(res["point_on_B"], (20, 1, 0))
+
+
+def test_batched_distances_are_minimal():
+    rng = np.random.default_rng(7)
+    n = 200
+    A0, A1, B0, B1 = (rng.uniform(-10, 10, (n, 3)) for _ in range(4))
+    A1[:20] = A0[:20]                                   # point A
+    B1[20:40] = B0[20:40]                               # point B
+    B1[40:80] = B0[40:80] + (A1[40:80] - A0[40:80]) * rng.uniform(-2, 2, (40, 1))  # parallel
+    A1[80:90], B1[80:90] = A0[80:90], B0[80:90]          # two points
+
+    res = segment_distances(A0, A1, B0, B1)
+    conflicts = check_spatial_conflicts(A0, A1, B0, B1, safety_buffer=3.0)
+
+    grid = np.linspace(0.0, 1.0, 201)
+    for k in range(n):
+        pa = A0[k] + grid[:, None] * (A1[k] - A0[k])
+        pb = B0[k] + grid[:, None] * (B1[k] - B0[k])
+        brute = np.linalg.norm(pa[:, None, :] - pb[None, :, :], axis=2).min()
+        assert res["distance"][k] <= brute + 1e-9
+        assert res["distance"][k] == pytest.approx(
+            np.linalg.norm(res["point_on_A"][k] - res["point_on_B"][k])
+        )
+        single = compute_min_distance_segment_segment(A0[k], A1[k], B0[k], B1[k])
+        assert single["distance"] == pytest.approx(res["distance"][k])
+        np.testing.assert_allclose(single["point_on_A"], res["point_on_A"][k], atol=1e-9)
+        np.testing.assert_allclose(single["point_on_B"], res["point_on_B"][k], atol=1e-9)
+    assert (conflicts["conflict"] == (res["distance"] < 3.0)).all()
@@ -0,0 +1,125 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.core.batch_kernel import segments_to_array
+from src.core.conflict_resolver import resolve_conflicts_for_mission
+from src.core.spatial_grid import SegmentGrid
+from src.core.spatial_index import BaseSegmentIndex, SegmentIndex
+from src.data.models import FlightSchedule, Mission
+from src.utils.random_flights import generate_random_drone, generate_random_flight_schedule
+
+
+def _random_mission(seed):
+    random.seed(seed)
+    drone = generate_random_drone("mission_drone", area_size=400.0, max_waypoints=6)
+    return Mission("m", "M", "", (0.0, 100.0), drone)
+
+
+def test_tree_pruning_matches_full_check():
+    mission = _random_mission(10)
+    schedule = generate_random_flight_schedule(num_drones=200, area_size=400.0)
+
+    full = resolve_conflicts_for_mission(mission, schedule, 30.0)
+    for engine in ("vectorized", "analytic"):
+        pruned = resolve_conflicts_for_mission(
+            mission, schedule, 30.0, engine=engine, pruning="tree"
+        )
+        assert pruned["total_conflicts"] == full["total_conflicts"] > 0
+        for cp, cf in zip(pruned["conflicts"], full["conflicts"]):
+            assert cp["other_drone_id"] == cf["other_drone_id"]
+            assert cp["min_distance"] == pytest.approx(cf["min_distance"])
+
+
+def test_index_prunes_candidates():
+    mission = _random_mission(11)
+    schedule = generate_random_flight_schedule(num_drones=200, area_size=400.0)
+    index = SegmentIndex.from_schedule(schedule, safety_buffer=10.0)
+
+    mission_array = segments_to_array(mission.drone.to_segments())
+    cand = index.query(mission_array)
+
+    total_pairs = len(mission_array) * sum(len(d.to_segments()) for d in schedule.drones)
+    assert 0 < len(cand["index_a"]) < total_pairs
+
+
+def test_insert_and_remove_keep_index_live():
+    mission = _random_mission(12)
+    schedule = generate_random_flight_schedule(num_drones=50, area_size=400.0)
+    index = SegmentIndex.from_schedule(schedule, safety_buffer=30.0)
+
+    # File a flight identical to the mission: guaranteed conflict
+    twin = generate_random_drone("twin")
+    twin.waypoints = list(mission.drone.waypoints)
+    index.insert(twin)
+    result = resolve_conflicts_for_mission(mission, schedule, 30.0, index=index)
+    assert "twin" in {c["other_drone_id"] for c in result["conflicts"]}
+
+    # Cancel it again, plus every originally conflicting drone
+    index.remove("twin")
+    baseline = resolve_conflicts_for_mission(mission, schedule, 30.0)
+    for c in baseline["conflicts"]:
+        index.remove(c["other_drone_id"])
+    index.rebuild()
+
+    result = resolve_conflicts_for_mission(mission, schedule, 30.0, index=index)
+    assert result["status"] == "clear"
+    assert "twin" not in index
+    assert index.remove("twin") is False
+
+
+def test_query_rejects_larger_buffer():
+    schedule = generate_random_flight_schedule(num_drones=3)
+    index = SegmentIndex.from_schedule(schedule, safety_buffer=10.0)
+    with pytest.raises(ValueError):
+        index.query(segments_to_array(schedule.drones[0].to_segments()), safety_buffer=20.0)
+
+
+def test_incomplete_index_subclass_cannot_be_created():
+    class NoQuery(BaseSegmentIndex):
+        def _build_structure(self) -> None:
+            pass
+
+    with pytest.raises(TypeError):
+        NoQuery(safety_buffer=10.0)
+
+
+def test_grid_pruning_matches_full_check():
+    mission = _random_mission(13)
+    schedule = generate_random_flight_schedule(num_drones=200, area_size=400.0)
+
+    full = resolve_conflicts_for_mission(mission, schedule, 30.0)
+    pruned = resolve_conflicts_for_mission(mission, schedule, 30.0, pruning="grid")
+
+    assert pruned["total_conflicts"] == full["total_conflicts"] > 0
+    for cp, cf in zip(pruned["conflicts"], full["conflicts"]):
+        assert cp["other_drone_id"] == cf["other_drone_id"]
+        assert cp["conflict_time"] == pytest.approx(cf["conflict_time"])
+
+
+def test_grid_candidates_are_tighter_than_tree():
+    mission = _random_mission(14)
+    schedule = generate_random_flight_schedule(num_drones=100, area_size=400.0)
+    mission_array = segments_to_array(mission.drone.to_segments())
+
+    tree = SegmentIndex.from_schedule(schedule, safety_buffer=20.0).query(mission_array)
+    grid = SegmentGrid.from_schedule(schedule, safety_buffer=20.0).query(mission_array)
+
+    def pairs(c):
+        return set(zip(c["index_a"], c["drone_key"], c["segment_index"]))
+
+    # Grid pieces are finer than whole-segment boxes
+    assert 0 < len(pairs(grid)) and pairs(grid) <= pairs(tree)
+
+
+def test_duplicate_drone_ids_keep_the_last_flight():
+    random.seed(12)
+    first = generate_random_drone("twin", area_size=400.0)
+    last = generate_random_drone("twin", area_size=400.0)
+    schedule = FlightSchedule(drones=[first, generate_random_drone("other"), last])
+
+    for index_type in (SegmentIndex, SegmentGrid):
+        index = index_type.from_schedule(schedule, safety_buffer=10.0)
+        assert sorted(index.drone_ids) == ["other", "twin"]
+        assert np.array_equal(index.drone_segments("twin"), last.trajectory.packed)
@@ -0,0 +1,63 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Generous: importing main takes well under a second without matplotlib
+IMPORT_BUDGET_SECONDS = 5.0
+
+
+def _run(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip().splitlines()[-1]
+
+
+def test_importing_main_skips_matplotlib_within_budget():
+    elapsed, loaded = _run(
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import main\n"
+        "print(time.perf_counter() - start, 'matplotlib' in sys.modules)"
+    ).split()
+
+    assert loaded == "False"
+    assert float(elapsed) < IMPORT_BUDGET_SECONDS
+
+
+def test_importing_main_skips_mode_specific_modules():
+    loaded = _run(
+        "import sys\n"
+        "import main\n"
+        "print(sorted(m for m in ('src.query.server', 'src.query.service',\n"
+        "    'src.utils.random_flights', 'src.visualization.render') if m in sys.modules))"
+    )
+    assert loaded == "[]"
+
+
+def test_no_plot_mission_check_never_imports_matplotlib():
+    loaded = _run(
+        "import runpy, sys\n"
+        "sys.argv = ['main.py', '--mission', 'mission_2', '--no-plot']\n"
+        "runpy.run_path('main.py', run_name='__main__')\n"
+        "print('matplotlib' in sys.modules)"
+    )
+    assert loaded == "False"
+
+
+def test_log_file_is_created_on_first_record(tmp_path):
+    log_file = tmp_path / "logs" / "run.log"
+    created = _run(
+        "import os\n"
+        "from src.utils.config import Config\n"
+        f"Config.LOG_FILE = {str(log_file)!r}\n"
+        "import main\n"
+        f"before = os.path.exists({str(log_file.parent)!r})\n"
+        "from src.utils.logger import get_logger\n"
+        "get_logger('startup').info('first record')\n"
+        f"print(before, os.path.exists({str(log_file)!r}))"
+    )
+    assert created == "False True"
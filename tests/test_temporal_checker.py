@@ -1,7 +1,12 @@
+import numpy as np
+
 from src.core.temporal_checker import (
     get_time_overlap,
     interpolate_segment_position,
+    interpolate_segment_positions,
+    interpolate_tracks,
     get_segments_time_overlap,
+    time_overlaps,
 )
 
 
@@ -62,3 +67,47 @@ def test_segments_time_overlap_helper():
 
     overlap = get_segments_time_overlap(seg_a, seg_b)
     assert overlap == (5.0, 10.0)
+
+
+def test_time_overlaps_arrays_match_scalar():
+    rng = np.random.default_rng(0)
+    a = rng.uniform(0, 20, (200, 2))
+    b = rng.uniform(0, 20, (200, 2))
+    res = time_overlaps(a[:, 0], a[:, 1], b[:, 0], b[:, 1])
+    for k in range(200):
+        expected = get_time_overlap(tuple(a[k]), tuple(b[k]))
+        assert bool(res["valid"][k]) == (expected is not None)
+        if expected is not None:
+            assert (res["start"][k], res["end"][k]) == expected
+
+
+def test_segment_positions_match_scalar_many_times():
+    segments = np.array([
+        [0, 0, 0, 10, 0, 10, 0.0, 10.0],
+        [5, 5, 5, 5, 5, 5, 2.0, 2.0],  # zero duration
+        [0, 0, 0, -4, 8, 2, 3.0, 7.0],
+    ])
+    times = np.array([[-1.0, 0.0, 2.5, 10.0, 12.0]] * 3)
+    pos = interpolate_segment_positions(segments, times)
+    assert pos.shape == (3, 5, 3)
+    for k, seg in enumerate(segments):
+        for j, t in enumerate(times[k]):
+            expected = interpolate_segment_position(tuple(seg[0:3]), tuple(seg[3:6]), seg[6], seg[7], t)
+            assert tuple(pos[k, j]) == expected
+
+
+def test_interpolate_tracks_matches_np_interp():
+    # Three drones with different timestamps, one without waypoints
+    t = [np.array([0.0, 4.0, 9.0]), np.array([2.0, 3.0]), np.array([]), np.array([5.0])]
+    xyz = [np.random.default_rng(i).uniform(-50, 50, (len(ti), 3)) for i, ti in enumerate(t)]
+    offsets = np.cumsum([0] + [len(ti) for ti in t])
+    queries = np.array([-1.0, 0.0, 2.0, 2.5, 3.0, 4.5, 9.0, 20.0])
+
+    pos = interpolate_tracks(queries, offsets, np.concatenate(t), np.concatenate(xyz))
+
+    assert pos.shape == (len(queries), 4, 3)
+    assert np.isnan(pos[:, 2]).all()
+    for d in (0, 1, 3):
+        for axis in range(3):
+            expected = np.interp(queries, t[d], xyz[d][:, axis])
+            np.testing.assert_allclose(pos[:, d, axis], expected)
@@ -0,0 +1,75 @@
+import copy
+
+import numpy as np
+
+from src.core.batch_kernel import pack_nearby_segments, schedule_bounds
+from src.core.conflict_resolver import resolve_conflicts_for_mission
+from src.data.columnar import ColumnarSchedule
+from src.data.models import FlightSchedule, Mission, Waypoint
+from src.utils.mission_modifiers import slope_mission_altitude
+from src.utils.random_flights import generate_random_flight_schedule
+from tests.helpers import make_drone
+
+
+def test_trajectory_summaries():
+    drone = make_drone("d", [(0, 0, 10, 0.0), (30, 40, 10, 10.0), (30, 40, 20, 10.0), (30, 0, 0, 20.0)])
+    traj = drone.trajectory
+
+    # The zero-duration hop is dropped, as in to_segments
+    assert len(traj) == 2
+    assert traj.segments == drone.to_segments()
+    np.testing.assert_array_equal(traj.lo, [0, 0, 0, 0])
+    np.testing.assert_array_equal(traj.hi, [30, 40, 20, 20])
+    np.testing.assert_array_equal(traj.segment_lo[1], [30, 0, 0, 10])
+    assert traj.time_span == (0.0, 20.0)
+    assert traj.max_speed == 5.0
+    assert drone.trajectory is traj
+
+
+def test_trajectory_rebuilt_after_waypoint_edits():
+    mission = Mission("m", "", "", (0.0, 10.0), make_drone("m", [(0, 0, 0, 0.0), (10, 0, 0, 10.0)]))
+    before = mission.drone.trajectory
+
+    slope_mission_altitude(mission, start_z=10.0, end_z=40.0)
+    after = mission.drone.trajectory
+    assert after is not before
+    assert after.segments[0][0][2] == 10.0 and after.segments[0][1][2] == 40.0
+
+    mission.drone.waypoints.append(Waypoint(2, 20, 0, 40, 20.0))
+    assert len(mission.drone.trajectory) == 2
+
+    # In-place edits of a waypoint are picked up as well
+    mission.drone.waypoints[1].x = 500.0
+    assert mission.drone.to_segments()[0][1] == (500.0, 0, 40.0)
+    mission.drone.waypoints[1].x = 10.0
+
+    # Copies do not carry the cache over
+    copied = copy.deepcopy(mission.drone)
+    copied.waypoints[0].x = 5.0
+    assert copied.trajectory.segments[0][0][0] == 5.0
+    assert mission.drone.trajectory.segments[0][0][0] == 0.0
+
+
+def test_whole_drone_reject_keeps_results():
+    schedule = generate_random_flight_schedule(num_drones=60)
+    mission_drone = make_drone("m", [(0, 0, 0, 0.0), (200, 200, 50, 50.0), (400, 0, 100, 100.0)])
+    mission = Mission("m", "", "", (0.0, 100.0), mission_drone)
+    far = make_drone("far", [(5000, 5000, 0, 0.0), (5100, 5000, 0, 100.0)])
+    later = make_drone("later", [(0, 0, 0, 500.0), (200, 200, 50, 550.0)])
+    schedule.drones.extend([far, later])
+
+    columnar = ColumnarSchedule.from_schedule(schedule)
+    for s in (schedule, columnar):
+        lo, hi = schedule_bounds(s)
+        np.testing.assert_array_equal(lo[-2], far.trajectory.lo)
+        np.testing.assert_array_equal(hi[-1], later.trajectory.hi)
+        _, owner = pack_nearby_segments(s, mission_drone.trajectory.packed, 25.0)
+        assert len(schedule.drones) - 2 not in owner
+        assert len(schedule.drones) - 1 not in owner
+
+    for engine in ("analytic", "vectorized"):
+        fast = resolve_conflicts_for_mission(mission, columnar, 25.0, engine=engine)
+        full = resolve_conflicts_for_mission(
+            mission, FlightSchedule(drones=schedule.drones), 25.0, engine=engine, pruning="tree"
+        )
+        assert fast["conflicts"] == full["conflicts"]
@@ -0,0 +1,64 @@
+import json
+
+import numpy as np
+import pytest
+
+from src.data.columnar import ColumnarSchedule
+from src.data.loader import load_simulated_flights, load_validated_flights
+from src.data.validation import ScheduleValidationError, validate_flight_records
+
+
+def _flight(flight_id, waypoints):
+    return {"id": flight_id, "name": flight_id, "description": "", "waypoints": waypoints}
+
+
+def _wp(i, t, x=0.0, **extra):
+    return {"id": i, "x": x, "y": 0.0, "z": 10.0, "timestamp": t, **extra}
+
+
+def test_valid_file_matches_loader():
+    schedule, issues = load_validated_flights("data/simulated_flights.json")
+    expected = ColumnarSchedule.from_schedule(load_simulated_flights("data/simulated_flights.json"))
+
+    assert issues == []
+    assert schedule.drone_ids == expected.drone_ids
+    for column in ("offsets", "x", "y", "z", "t", "waypoint_ids"):
+        assert np.array_equal(getattr(schedule, column), getattr(expected, column))
+
+
+def test_every_issue_is_reported_with_indices():
+    records = [
+        _flight("ok", [_wp(0, 0.0), _wp(1, 10.0)]),
+        _flight("bad_values", [_wp(0, 0.0, x="12"), _wp(1, 5.0, x=float("nan")), {"id": 2, "x": 1, "y": 1}]),
+        _flight("backwards", [_wp(0, 10.0), _wp(1, 10.0), _wp(2, 5.0)]),
+        {"name": "no id", "waypoints": []},
+    ]
+    schedule, issues = validate_flight_records(records, batch_size=2)
+
+    assert schedule.drone_ids == ["ok"]
+    found = {(i.flight_index, i.waypoint_index, i.field) for i in issues}
+    assert found == {
+        (1, 0, "x"), (1, 1, "x"), (1, 2, "timestamp"),
+        (2, 1, "timestamp"), (2, 2, "timestamp"),
+        (3, None, None),
+    }
+
+
+@pytest.mark.parametrize("value", [True, [1, 2]])
+def test_booleans_and_nested_values_next_to_numbers_are_issues(value):
+    records = [_flight("mixed", [_wp(0, 0.0, x=value), _wp(1, 10.0, x=1.5)])]
+    schedule, issues = validate_flight_records(records)
+
+    assert schedule.drone_ids == []
+    assert [(i.waypoint_index, i.field) for i in issues] == [(0, "x")]
+    assert issues[0].message.startswith("expected a number")
+
+
+def test_strict_loading_raises(tmp_path):
+    path = tmp_path / "flights.json"
+    path.write_text(json.dumps({"flights": [_flight("a", [_wp(0, 5.0), _wp(1, 1.0)])]}))
+
+    with pytest.raises(ScheduleValidationError) as excinfo:
+        load_validated_flights(path)
+    assert "flight 0 ('a'), waypoint 1, field 'timestamp'" in str(excinfo.value)
+    assert load_validated_flights(path, strict=False)[0].drone_ids == []